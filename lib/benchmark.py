@@ -0,0 +1,447 @@
+"""Micro-benchmarks for the codec hot paths.
+
+Run from the lib directory with ``python benchmark.py``. Every benchmark
+returns its numbers so tests can exercise it with a small call count.
+"""
+import gc
+import os
+import struct
+import sys
+import timeit
+import tracemalloc
+import types
+
+from bytebuf import Buf, ByteBuf
+from checksum import (
+    Crc16ChecksumService,
+    Crc32ChecksumService,
+    SsebinChecksumService,
+    SzsebinChecksumService,
+    create_checksum_service,
+)
+from codec import write_fixed_string
+from samples import sample_execution_report, sample_new_order_single
+
+
+class LegacyByteBuf:
+    """The accessor style ByteBuf used before struct formats were precompiled:
+    format strings built per call, reads through a sliced copy, writes through
+    bytearray concatenation. Kept only as the "before" side of benchmarks."""
+
+    def __init__(self):
+        self.buf = bytearray()
+        self.write_index = 0
+        self.read_index = 0
+
+    def read_u32(self):
+        if self.write_index - self.read_index < 4:
+            raise Exception("readable bytes length must greater than or equal 4")
+        ret = struct.unpack(
+            Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_INT,
+            self.buf[self.read_index : self.read_index + 4],
+        )
+        self.read_index += 4
+        return ret[0]
+
+    def read_i64_le(self):
+        if self.write_index - self.read_index < 8:
+            raise Exception("readable bytes length must greater than or equal 8")
+        ret = struct.unpack(
+            Buf.ByteOrder.LITTLE_ENDIAN + Buf.LONG_LONG,
+            self.buf[self.read_index : self.read_index + 8],
+        )
+        self.read_index += 8
+        return ret[0]
+
+    def write_u64(self, value):
+        self.buf += struct.pack(
+            Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_LONG_LONG, value
+        )
+        self.write_index += 8
+
+    def write_bytes(self, value):
+        if len(value) > 0:
+            self.buf += value
+            self.write_index += len(value)
+
+
+def legacy_crc16(data) -> int:
+    """Bitwise CRC16 as computed before the table-driven version."""
+    crc = 0xFFFF
+    for b in data:
+        crc ^= b
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+    return crc & 0xFFFF
+
+
+def legacy_byte_sum(data) -> int:
+    """Per-byte additive checksum as computed before sum()/numpy."""
+    checksum = 0
+    for b in data:
+        checksum += b
+    return checksum % 256
+
+
+def legacy_create_checksum_service(algorithm: str):
+    """The per-call factory used before the registry: a new dict and four new
+    services every time."""
+    mapping = {
+        "CRC16": Crc16ChecksumService(),
+        "CRC32": Crc32ChecksumService(),
+        "SSE_BIN": SsebinChecksumService(),
+        "SZSE_BIN": SzsebinChecksumService(),
+    }
+    return mapping[algorithm]
+
+
+def per_call_ns(func, calls: int, repeat: int = 5) -> float:
+    """Best-of-``repeat`` wall time of ``func`` divided by ``calls``, in ns."""
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    return best * 1e9 / calls
+
+
+def _primitive_cases(buf_factory, calls: int):
+    reader = buf_factory()
+    for i in range(calls):
+        reader.write_bytes(struct.pack(">I", i))
+    le_reader = buf_factory()
+    for i in range(calls):
+        le_reader.write_bytes(struct.pack("<q", -i))
+
+    def read_u32():
+        reader.read_index = 0
+        read = reader.read_u32
+        for _ in range(calls):
+            read()
+
+    def read_i64_le():
+        le_reader.read_index = 0
+        read = le_reader.read_i64_le
+        for _ in range(calls):
+            read()
+
+    def write_u64():
+        write = buf_factory().write_u64
+        for i in range(calls):
+            write(i)
+
+    def fixed_string():
+        buf = buf_factory()
+        for _ in range(calls):
+            write_fixed_string(buf, "600000", 12, "utf-8")
+
+    return {
+        "read_u32": read_u32,
+        "read_i64_le": read_i64_le,
+        "write_u64": write_u64,
+        "write_fixed_string": fixed_string,
+    }
+
+
+def bench_primitives(calls: int = 100000, repeat: int = 5):
+    """Per-call ns of common accessors: {name: (before, after)}."""
+    before = _primitive_cases(LegacyByteBuf, calls)
+    after = _primitive_cases(ByteBuf, calls)
+    return {
+        name: (
+            per_call_ns(before[name], calls, repeat),
+            per_call_ns(after[name], calls, repeat),
+        )
+        for name in before
+    }
+
+
+def bench_arrays(length: int = 10000, repeat: int = 5):
+    """Per-element ns of an i16_le list field: {name: (loop, bulk)}."""
+    buf = ByteBuf()
+    buf.write_i16_le_array([i % 32768 for i in range(length)])
+    values = buf.read_i16_le_array(length)
+
+    def read_loop():
+        buf.read_index = 0
+        ret = []
+        for i in range(length):
+            ret.append(buf.read_i16_le())
+
+    def read_bulk():
+        buf.read_index = 0
+        buf.read_i16_le_array(length)
+
+    def write_loop():
+        out = ByteBuf()
+        for i in range(length):
+            out.write_i16_le(values[i])
+
+    def write_bulk():
+        ByteBuf().write_i16_le_array(values)
+
+    return {
+        "read_i16_le_array": (
+            per_call_ns(read_loop, length, repeat),
+            per_call_ns(read_bulk, length, repeat),
+        ),
+        "write_i16_le_array": (
+            per_call_ns(write_loop, length, repeat),
+            per_call_ns(write_bulk, length, repeat),
+        ),
+    }
+
+
+def bench_frame_decode(frames: int = 2000, repeat: int = 5):
+    """Per-frame us decoding SZSE ExecutionReport frames with per-field
+    bounds checks (ByteBuf.debug_checks) and verified-once: {name: (checked,
+    unchecked)}."""
+    from szse_binary import SzseBinary
+
+    packet = SzseBinary()
+    packet.msg_type = 200115
+    packet.body = sample_execution_report()
+    stream = ByteBuf()
+    for _ in range(frames):
+        packet.encode(stream)
+
+    def decode_all():
+        stream.read_index = 0
+        for _ in range(frames):
+            SzseBinary().decode(stream)
+
+    results = []
+    debug_checks = ByteBuf.debug_checks
+    try:
+        for checked in (True, False):
+            ByteBuf.debug_checks = checked
+            results.append(per_call_ns(decode_all, frames, repeat) / 1000)
+    finally:
+        ByteBuf.debug_checks = debug_checks
+    return {"ExecutionReport": tuple(results)}
+
+
+CHECKSUM_SIZES = (64, 1024, 16 * 1024, 64 * 1024, 1024 * 1024)
+
+
+def bench_checksums(sizes=CHECKSUM_SIZES, repeat: int = 3):
+    """Per-frame us of the per-byte loops vs the current services:
+    {"<algorithm> <size>": (before, after)}."""
+    cases = (
+        ("CRC16", legacy_crc16),
+        ("SSE_BIN", legacy_byte_sum),
+        ("SZSE_BIN", legacy_byte_sum),
+    )
+    results = {}
+    for size in sizes:
+        data = memoryview(bytearray(os.urandom(size)))
+        for algorithm, legacy in cases:
+            service = create_checksum_service(algorithm)
+            results["%s %dB" % (algorithm, size)] = (
+                per_call_ns(lambda: legacy(data), 1, repeat) / 1000,
+                per_call_ns(lambda: service.calc_bytes(data), 1, repeat) / 1000,
+            )
+    return results
+
+
+def bench_checksum_service(calls: int = 100000, repeat: int = 5):
+    """Per-frame ns of getting the SZSE_BIN service: {name: (factory,
+    registry, bound)}, where bound is the codec's class attribute."""
+    from szse_binary import SzseBinary
+
+    packet = SzseBinary()
+
+    def factory():
+        for _ in range(calls):
+            legacy_create_checksum_service("SZSE_BIN")
+
+    def registry():
+        for _ in range(calls):
+            create_checksum_service("SZSE_BIN")
+
+    def bound():
+        for _ in range(calls):
+            packet.checksum_service
+
+    return {
+        "SZSE_BIN lookup": tuple(
+            per_call_ns(f, calls, repeat) for f in (factory, registry, bound)
+        )
+    }
+
+
+def bench_codec_plan(messages: int = 20000, repeat: int = 5):
+    """Per-message us of encode and decode through the generated methods and
+    through installed codec plans: {name: (generated, plan)}."""
+    import codec_plan
+
+    cases = (
+        ("NewOrderSingle", sample_new_order_single()),
+        ("ExecutionReport", sample_execution_report()),
+    )
+
+    def timings():
+        ret = {}
+        for name, message in cases:
+            buf = ByteBuf()
+
+            def encode():
+                buf.clear()
+                for _ in range(messages):
+                    message.encode(buf)
+
+            def decode():
+                buf.read_index = 0
+                cls = message.__class__
+                for _ in range(messages):
+                    cls().decode(buf)
+
+            ret[name + " encode"] = per_call_ns(encode, messages, repeat) / 1000
+            ret[name + " decode"] = per_call_ns(decode, messages, repeat) / 1000
+        return ret
+
+    generated = timings()
+    plans = [codec_plan.install_plan(message.__class__) for _, message in cases]
+    try:
+        planned = timings()
+    finally:
+        for plan in plans:
+            codec_plan.uninstall_plan(plan.cls)
+    return {name: (generated[name], planned[name]) for name in generated}
+
+
+def dict_backed(cls):
+    """A copy of a generated class without __slots__, i.e. the per-instance
+    __dict__ layout messages had before. Only for the "before" side of
+    bench_message_memory."""
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name != "__slots__" and not isinstance(value, types.MemberDescriptorType)
+    }
+    return type(cls.__name__, (object,), namespace)
+
+
+def _retained_bytes(cls, body: bytes, reports: int) -> float:
+    buf = ByteBuf(body)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        messages = []
+        for _ in range(reports):
+            buf.read_index = 0
+            message = cls()
+            message.decode(buf)
+            messages.append(message)
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    # the list itself is the same for both layouts
+    return (used - sys.getsizeof(messages)) / reports
+
+
+def bench_message_memory(reports: int = 1000000):
+    """Bytes retained per decoded SZSE ExecutionReport, including its field
+    values: {name: (dict, slots)}."""
+    report = sample_execution_report()
+    buf = ByteBuf()
+    report.encode(buf)
+    body = bytes(buf.to_bytes())
+    cls = report.__class__
+    return {
+        "ExecutionReport": (
+            _retained_bytes(dict_backed(cls), body, reports),
+            _retained_bytes(cls, body, reports),
+        )
+    }
+
+
+def bench_decode_reuse(frames: int = 2000, repeat: int = 5):
+    """Per-frame us decoding SZSE ExecutionReport frames into a new packet
+    each time vs one packet reusing its body: {name: (new, reuse)}."""
+    from szse_binary import SzseBinary
+
+    packet = SzseBinary()
+    packet.msg_type = 200115
+    packet.body = sample_execution_report()
+    stream = ByteBuf()
+    for _ in range(frames):
+        packet.encode(stream)
+
+    def decode_new():
+        stream.read_index = 0
+        for _ in range(frames):
+            SzseBinary().decode(stream)
+
+    target = SzseBinary()
+
+    def decode_reuse():
+        stream.read_index = 0
+        for _ in range(frames):
+            target.decode(stream, reuse_body=True)
+
+    return {
+        "ExecutionReport": (
+            per_call_ns(decode_new, frames, repeat) / 1000,
+            per_call_ns(decode_reuse, frames, repeat) / 1000,
+        )
+    }
+
+
+def bench_views(frames: int = 2000, repeat: int = 5):
+    """Per-frame us reading report_index, cl_ord_id, last_px and last_qty of
+    SZSE ExecutionReport frames, decoded vs through views: {name: (decode,
+    view)}."""
+    from message_view import frame_views
+    from szse_binary import SzseBinary
+
+    packet = SzseBinary()
+    packet.msg_type = 200115
+    packet.body = sample_execution_report()
+    stream = ByteBuf()
+    for _ in range(frames):
+        packet.encode(stream)
+
+    def decode_all():
+        stream.read_index = 0
+        for packet in SzseBinary.decode_batch(stream):
+            body = packet.body
+            body.report_index, body.cl_ord_id, body.last_px, body.last_qty
+
+    def view_all():
+        stream.read_index = 0
+        for body in frame_views(SzseBinary, stream):
+            body.report_index, body.cl_ord_id, body.last_px, body.last_qty
+
+    return {
+        "ExecutionReport": (
+            per_call_ns(decode_all, frames, repeat) / 1000,
+            per_call_ns(view_all, frames, repeat) / 1000,
+        )
+    }
+
+
+def print_table(title: str, results, columns=("before", "after")):
+    print(title)
+    print("  %-24s %s" % ("", " ".join("%12s" % c for c in columns)))
+    for name, values in results.items():
+        print("  %-24s %s" % (name, " ".join("%12.1f" % v for v in values)))
+    print()
+
+
+if __name__ == "__main__":
+    print_table("ByteBuf accessors (ns/call)", bench_primitives())
+    print_table("List fields (ns/element)", bench_arrays(), ("loop", "bulk"))
+    print_table(
+        "Frame decode (us/frame)", bench_frame_decode(), ("checked", "unchecked")
+    )
+    print_table("Checksums (us/frame)", bench_checksums())
+    print_table("Codec plans (us/message)", bench_codec_plan(), ("generated", "plan"))
+    print_table("Memory (bytes/message)", bench_message_memory(), ("dict", "slots"))
+    print_table("Decode into (us/frame)", bench_decode_reuse(), ("new", "reuse"))
+    print_table("Four fields per frame (us)", bench_views(), ("decode", "view"))
+    print_table(
+        "Checksum service per frame (ns)",
+        bench_checksum_service(),
+        ("factory", "registry", "bound"),
+    )
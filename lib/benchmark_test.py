@@ -0,0 +1,69 @@
+from benchmark import (
+    bench_arrays,
+    bench_checksum_service,
+    bench_checksums,
+    bench_codec_plan,
+    bench_decode_reuse,
+    bench_message_memory,
+    bench_primitives,
+    bench_views,
+)
+
+
+def test_bench_primitives():
+    results = bench_primitives(calls=100, repeat=1)
+    assert set(results) == {"read_u32", "read_i64_le", "write_u64", "write_fixed_string"}
+    for before, after in results.values():
+        assert before > 0 and after > 0
+
+
+def test_bench_arrays():
+    results = bench_arrays(length=100, repeat=1)
+    assert set(results) == {"read_i16_le_array", "write_i16_le_array"}
+
+
+def test_bench_checksums():
+    results = bench_checksums(sizes=(64, 8192), repeat=1)
+    assert set(results) == {
+        "%s %dB" % (algorithm, size)
+        for algorithm in ("CRC16", "SSE_BIN", "SZSE_BIN")
+        for size in (64, 8192)
+    }
+
+
+def test_bench_checksum_service():
+    results = bench_checksum_service(calls=100, repeat=1)
+    factory, registry, bound = results["SZSE_BIN lookup"]
+    assert factory > 0 and registry > 0 and bound > 0
+
+
+def test_bench_codec_plan():
+    results = bench_codec_plan(messages=50, repeat=1)
+    assert set(results) == {
+        "NewOrderSingle encode",
+        "NewOrderSingle decode",
+        "ExecutionReport encode",
+        "ExecutionReport decode",
+    }
+    for generated, plan in results.values():
+        assert generated > 0 and plan > 0
+
+
+def test_bench_message_memory():
+    results = bench_message_memory(reports=200)
+    with_dict, with_slots = results["ExecutionReport"]
+    assert with_slots < with_dict
+
+
+def test_bench_decode_reuse():
+    results = bench_decode_reuse(frames=10, repeat=1)
+    assert set(results) == {"ExecutionReport"}
+    for new, reuse in results.values():
+        assert new > 0 and reuse > 0
+
+
+def test_bench_views():
+    results = bench_views(frames=10, repeat=1)
+    assert set(results) == {"ExecutionReport"}
+    for decode, view in results.values():
+        assert decode > 0 and view > 0
@@ -1,10 +1,19 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
 from bytebuf import ByteBuf
-from checksum import create_checksum_service
+from checksum import ChecksumVerifier, create_checksum_service
 from message_factory import MessageFactory
 from codec import *
 
 class Logon(BinaryCodec):
+    __slots__ = ("sender_comp_id", "target_comp_id", "heart_bt_int", "password", "default_appl_ver_id")
+    _fields = (
+        FieldDescriptor('sender_comp_id', 'fixed_string', size=20),
+        FieldDescriptor('target_comp_id', 'fixed_string', size=20),
+        FieldDescriptor('heart_bt_int', 'i32_le'),
+        FieldDescriptor('password', 'fixed_string', size=16),
+        FieldDescriptor('default_appl_ver_id', 'fixed_string', size=32),
+    )
     def __init__(self):
         self.sender_comp_id = ''
         self.target_comp_id = ''
@@ -12,6 +21,13 @@ class Logon(BinaryCodec):
         self.password = ''
         self.default_appl_ver_id = ''
     
+    def reset(self):
+        self.sender_comp_id = ''
+        self.target_comp_id = ''
+        self.heart_bt_int = 0
+        self.password = ''
+        self.default_appl_ver_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.sender_comp_id, 20, 'utf-8')
         write_fixed_string(buffer, self.target_comp_id, 20, 'utf-8')
@@ -19,7 +35,7 @@ class Logon(BinaryCodec):
         write_fixed_string(buffer, self.password, 16, 'utf-8')
         write_fixed_string(buffer, self.default_appl_ver_id, 32, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.sender_comp_id = read_fixed_string(buffer, 20, 'utf-8')
         self.target_comp_id = read_fixed_string(buffer, 20, 'utf-8')
         self.heart_bt_int = buffer.read_i32_le()
@@ -41,15 +57,24 @@ class Logon(BinaryCodec):
 
 
 class Logout(BinaryCodec):
+    __slots__ = ("session_status", "text")
+    _fields = (
+        FieldDescriptor('session_status', 'i32_le'),
+        FieldDescriptor('text', 'fixed_string', size=200),
+    )
     def __init__(self):
         self.session_status = 0
         self.text = ''
     
+    def reset(self):
+        self.session_status = 0
+        self.text = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.session_status)
         write_fixed_string(buffer, self.text, 200, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.session_status = buffer.read_i32_le()
         self.text = read_fixed_string(buffer, 200, 'utf-8')
     
@@ -65,13 +90,18 @@ class Logout(BinaryCodec):
 
 
 class Heartbeat(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -82,6 +112,16 @@ class Heartbeat(BinaryCodec):
 
 
 class ExtendNewOrder010(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "cash_margin", "settl_type", "settl_period")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64_le'),
+        FieldDescriptor('min_qty', 'i64_le'),
+        FieldDescriptor('max_price_levels', 'u16_le'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('settl_type', 'fixed_string', size=1),
+        FieldDescriptor('settl_period', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -91,6 +131,15 @@ class ExtendNewOrder010(BinaryCodec):
         self.settl_type = ''
         self.settl_period = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.cash_margin = ''
+        self.settl_type = ''
+        self.settl_period = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64_le(self.stop_px)
         buffer.write_i64_le(self.min_qty)
@@ -100,7 +149,7 @@ class ExtendNewOrder010(BinaryCodec):
         write_fixed_string(buffer, self.settl_type, 1, 'utf-8')
         write_fixed_string(buffer, self.settl_period, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64_le()
         self.min_qty = buffer.read_i64_le()
         self.max_price_levels = buffer.read_u16_le()
@@ -125,6 +174,14 @@ class ExtendNewOrder010(BinaryCodec):
     
 
 class ExtendNewOrder040(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "cash_margin")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64_le'),
+        FieldDescriptor('min_qty', 'i64_le'),
+        FieldDescriptor('max_price_levels', 'u16_le'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -132,6 +189,13 @@ class ExtendNewOrder040(BinaryCodec):
         self.time_in_force = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64_le(self.stop_px)
         buffer.write_i64_le(self.min_qty)
@@ -139,7 +203,7 @@ class ExtendNewOrder040(BinaryCodec):
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64_le()
         self.min_qty = buffer.read_i64_le()
         self.max_price_levels = buffer.read_u16_le()
@@ -160,13 +224,18 @@ class ExtendNewOrder040(BinaryCodec):
     
 
 class ExtendNewOrder041(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -176,13 +245,18 @@ class ExtendNewOrder041(BinaryCodec):
     
 
 class ExtendNewOrder042(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -192,13 +266,18 @@ class ExtendNewOrder042(BinaryCodec):
     
 
 class ExtendNewOrder043(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -208,13 +287,18 @@ class ExtendNewOrder043(BinaryCodec):
     
 
 class ExtendNewOrder044(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -224,13 +308,18 @@ class ExtendNewOrder044(BinaryCodec):
     
 
 class ExtendNewOrder045(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -240,17 +329,28 @@ class ExtendNewOrder045(BinaryCodec):
     
 
 class ExtendNewOrder050(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16_le'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16_le(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16_le()
         self.expiration_type = buffer.read_u8()
         self.share_property = read_fixed_string(buffer, 2, 'utf-8')
@@ -279,6 +379,26 @@ newOrderMessageFactory.register("050", ExtendNewOrder050)
 
 
 class NewOrder(BinaryCodec):
+    __slots__ = ("appl_id", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "cl_ord_id", "account_id", "branch_id", "order_restrictions", "side", "ord_type", "order_qty", "price", "appl_extend")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('order_restrictions', 'fixed_string', size=4),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('ord_type', 'fixed_string', size=1),
+        FieldDescriptor('order_qty', 'i64_le'),
+        FieldDescriptor('price', 'i64_le'),
+        FieldDescriptor('appl_extend', 'message', factory='newOrderMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.appl_id = ''
         self.submitting_pbuid = ''
@@ -298,6 +418,25 @@ class NewOrder(BinaryCodec):
         self.price = 0
         self.appl_extend = None
     
+    def reset(self):
+        self.appl_id = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.cl_ord_id = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.order_restrictions = ''
+        self.side = ''
+        self.ord_type = ''
+        self.order_qty = 0
+        self.price = 0
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         write_fixed_string(buffer, self.submitting_pbuid, 6, 'utf-8')
@@ -318,7 +457,7 @@ class NewOrder(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.security_id = read_fixed_string(buffer, 8, 'utf-8')
@@ -335,8 +474,11 @@ class NewOrder(BinaryCodec):
         self.ord_type = read_fixed_string(buffer, 1, 'utf-8')
         self.order_qty = buffer.read_i64_le()
         self.price = buffer.read_i64_le()
-        self.appl_extend = newOrderMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = newOrderMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = newOrderMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -381,6 +523,23 @@ class NewOrder(BinaryCodec):
 
 
 class OrderCancelRequest(BinaryCodec):
+    __slots__ = ("appl_id", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "cl_ord_id", "orig_cl_ord_id", "account_id", "branch_id", "order_id", "order_qty")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('order_qty', 'i64_le'),
+    )
     def __init__(self):
         self.appl_id = ''
         self.submitting_pbuid = ''
@@ -397,6 +556,22 @@ class OrderCancelRequest(BinaryCodec):
         self.order_id = ''
         self.order_qty = 0
     
+    def reset(self):
+        self.appl_id = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.cl_ord_id = ''
+        self.orig_cl_ord_id = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.order_id = ''
+        self.order_qty = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         write_fixed_string(buffer, self.submitting_pbuid, 6, 'utf-8')
@@ -413,7 +588,7 @@ class OrderCancelRequest(BinaryCodec):
         write_fixed_string(buffer, self.order_id, 16, 'utf-8')
         buffer.write_i64_le(self.order_qty)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.security_id = read_fixed_string(buffer, 8, 'utf-8')
@@ -453,6 +628,28 @@ class OrderCancelRequest(BinaryCodec):
 
 
 class CancelReject(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "cl_ord_id", "orig_cl_ord_id", "account_id", "branch_id", "ord_status", "cxl_rej_reason", "reject_text", "order_id")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+        FieldDescriptor('cxl_rej_reason', 'u16_le'),
+        FieldDescriptor('reject_text', 'fixed_string', size=16),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -474,6 +671,27 @@ class CancelReject(BinaryCodec):
         self.reject_text = ''
         self.order_id = ''
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.cl_ord_id = ''
+        self.orig_cl_ord_id = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.ord_status = ''
+        self.cxl_rej_reason = 0
+        self.reject_text = ''
+        self.order_id = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
@@ -495,7 +713,7 @@ class CancelReject(BinaryCodec):
         write_fixed_string(buffer, self.reject_text, 16, 'utf-8')
         write_fixed_string(buffer, self.order_id, 16, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -545,6 +763,14 @@ class CancelReject(BinaryCodec):
 
 
 class ConfirmExtend010(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "cash_margin")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64_le'),
+        FieldDescriptor('min_qty', 'i64_le'),
+        FieldDescriptor('max_price_levels', 'u16_le'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -552,6 +778,13 @@ class ConfirmExtend010(BinaryCodec):
         self.time_in_force = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64_le(self.stop_px)
         buffer.write_i64_le(self.min_qty)
@@ -559,7 +792,7 @@ class ConfirmExtend010(BinaryCodec):
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64_le()
         self.min_qty = buffer.read_i64_le()
         self.max_price_levels = buffer.read_u16_le()
@@ -580,6 +813,14 @@ class ConfirmExtend010(BinaryCodec):
     
 
 class ConfirmExtend040(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "cash_margin")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64_le'),
+        FieldDescriptor('min_qty', 'i64_le'),
+        FieldDescriptor('max_price_levels', 'u16_le'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -587,6 +828,13 @@ class ConfirmExtend040(BinaryCodec):
         self.time_in_force = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64_le(self.stop_px)
         buffer.write_i64_le(self.min_qty)
@@ -594,7 +842,7 @@ class ConfirmExtend040(BinaryCodec):
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64_le()
         self.min_qty = buffer.read_i64_le()
         self.max_price_levels = buffer.read_u16_le()
@@ -615,13 +863,18 @@ class ConfirmExtend040(BinaryCodec):
     
 
 class ConfirmExtend041(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -631,13 +884,18 @@ class ConfirmExtend041(BinaryCodec):
     
 
 class ConfirmExtend042(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -647,13 +905,18 @@ class ConfirmExtend042(BinaryCodec):
     
 
 class ConfirmExtend043(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -663,13 +926,18 @@ class ConfirmExtend043(BinaryCodec):
     
 
 class ConfirmExtend044(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -679,13 +947,18 @@ class ConfirmExtend044(BinaryCodec):
     
 
 class ConfirmExtend045(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -695,17 +968,28 @@ class ConfirmExtend045(BinaryCodec):
     
 
 class ConfirmExtend050(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16_le'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16_le(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16_le()
         self.expiration_type = buffer.read_u8()
         self.share_property = read_fixed_string(buffer, 2, 'utf-8')
@@ -734,6 +1018,37 @@ executionConfirmMessageFactory.register("050", ConfirmExtend050)
 
 
 class ExecutionConfirm(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "order_id", "cl_ord_id", "orig_cl_ord_id", "exec_id", "exec_type", "ord_status", "ord_rej_reason", "leaves_qty", "cum_qty", "side", "ord_type", "order_qty", "price", "account_id", "branch_id", "order_restrictions", "appl_extend")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('exec_type', 'fixed_string', size=1),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+        FieldDescriptor('ord_rej_reason', 'u16_le'),
+        FieldDescriptor('leaves_qty', 'i64_le'),
+        FieldDescriptor('cum_qty', 'i64_le'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('ord_type', 'fixed_string', size=1),
+        FieldDescriptor('order_qty', 'i64_le'),
+        FieldDescriptor('price', 'i64_le'),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('order_restrictions', 'fixed_string', size=4),
+        FieldDescriptor('appl_extend', 'message', factory='executionConfirmMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -764,6 +1079,36 @@ class ExecutionConfirm(BinaryCodec):
         self.order_restrictions = ''
         self.appl_extend = None
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.order_id = ''
+        self.cl_ord_id = ''
+        self.orig_cl_ord_id = ''
+        self.exec_id = ''
+        self.exec_type = ''
+        self.ord_status = ''
+        self.ord_rej_reason = 0
+        self.leaves_qty = 0
+        self.cum_qty = 0
+        self.side = ''
+        self.ord_type = ''
+        self.order_qty = 0
+        self.price = 0
+        self.account_id = ''
+        self.branch_id = ''
+        self.order_restrictions = ''
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
@@ -795,7 +1140,7 @@ class ExecutionConfirm(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -823,8 +1168,11 @@ class ExecutionConfirm(BinaryCodec):
         self.account_id = read_fixed_string(buffer, 10, 'utf-8')
         self.branch_id = read_fixed_string(buffer, 2, 'utf-8')
         self.order_restrictions = read_fixed_string(buffer, 4, 'utf-8')
-        self.appl_extend = executionConfirmMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = executionConfirmMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = executionConfirmMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -880,17 +1228,28 @@ class ExecutionConfirm(BinaryCodec):
 
 
 class ReportExtend010(BinaryCodec):
+    __slots__ = ("cash_margin", "settl_type", "settl_period")
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('settl_type', 'fixed_string', size=1),
+        FieldDescriptor('settl_period', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
         self.settl_type = ''
         self.settl_period = ''
     
+    def reset(self):
+        self.cash_margin = ''
+        self.settl_type = ''
+        self.settl_period = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         write_fixed_string(buffer, self.settl_type, 1, 'utf-8')
         write_fixed_string(buffer, self.settl_period, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
         self.settl_type = read_fixed_string(buffer, 1, 'utf-8')
         self.settl_period = read_fixed_string(buffer, 1, 'utf-8')
@@ -907,13 +1266,20 @@ class ReportExtend010(BinaryCodec):
     
 
 class ReportExtend040(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -926,19 +1292,32 @@ class ReportExtend040(BinaryCodec):
     
 
 class ReportExtend050(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "maturity_date", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16_le'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('maturity_date', 'u32_le'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.maturity_date = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.maturity_date = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16_le(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         buffer.write_u32_le(self.maturity_date)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16_le()
         self.expiration_type = buffer.read_u8()
         self.maturity_date = buffer.read_u32_le()
@@ -964,6 +1343,33 @@ executionReportMessageFactory.register("050", ReportExtend050)
 
 
 class ExecutionReport(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "order_id", "cl_ord_id", "exec_id", "exec_type", "ord_status", "last_px", "last_qty", "leaves_qty", "cum_qty", "side", "account_id", "branch_id", "appl_extend")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('exec_type', 'fixed_string', size=1),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+        FieldDescriptor('last_px', 'i64_le'),
+        FieldDescriptor('last_qty', 'i64_le'),
+        FieldDescriptor('leaves_qty', 'i64_le'),
+        FieldDescriptor('cum_qty', 'i64_le'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('appl_extend', 'message', factory='executionReportMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -990,6 +1396,32 @@ class ExecutionReport(BinaryCodec):
         self.branch_id = ''
         self.appl_extend = None
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.order_id = ''
+        self.cl_ord_id = ''
+        self.exec_id = ''
+        self.exec_type = ''
+        self.ord_status = ''
+        self.last_px = 0
+        self.last_qty = 0
+        self.leaves_qty = 0
+        self.cum_qty = 0
+        self.side = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
@@ -1017,7 +1449,7 @@ class ExecutionReport(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -1041,8 +1473,11 @@ class ExecutionReport(BinaryCodec):
         self.side = read_fixed_string(buffer, 1, 'utf-8')
         self.account_id = read_fixed_string(buffer, 10, 'utf-8')
         self.branch_id = read_fixed_string(buffer, 2, 'utf-8')
-        self.appl_extend = executionReportMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = executionReportMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = executionReportMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -1084,6 +1519,18 @@ class ExecutionReport(BinaryCodec):
 
 
 class QuoteExtend070(BinaryCodec):
+    __slots__ = ("branch_id", "quote_id", "quote_resp_id", "private_quote", "valid_until_time", "price_type", "cash_margin", "counter_party_pbuid", "memo")
+    _fields = (
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('quote_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_resp_id', 'fixed_string', size=10),
+        FieldDescriptor('private_quote', 'u8'),
+        FieldDescriptor('valid_until_time', 'i64_le'),
+        FieldDescriptor('price_type', 'u8'),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('counter_party_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('memo', 'fixed_string', size=120),
+    )
     def __init__(self):
         self.branch_id = ''
         self.quote_id = ''
@@ -1095,6 +1542,17 @@ class QuoteExtend070(BinaryCodec):
         self.counter_party_pbuid = ''
         self.memo = ''
     
+    def reset(self):
+        self.branch_id = ''
+        self.quote_id = ''
+        self.quote_resp_id = ''
+        self.private_quote = 0
+        self.valid_until_time = 0
+        self.price_type = 0
+        self.cash_margin = ''
+        self.counter_party_pbuid = ''
+        self.memo = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.branch_id, 2, 'utf-8')
         write_fixed_string(buffer, self.quote_id, 10, 'utf-8')
@@ -1106,7 +1564,7 @@ class QuoteExtend070(BinaryCodec):
         write_fixed_string(buffer, self.counter_party_pbuid, 6, 'utf-8')
         write_fixed_string(buffer, self.memo, 120, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.branch_id = read_fixed_string(buffer, 2, 'utf-8')
         self.quote_id = read_fixed_string(buffer, 10, 'utf-8')
         self.quote_resp_id = read_fixed_string(buffer, 10, 'utf-8')
@@ -1135,13 +1593,18 @@ class QuoteExtend070(BinaryCodec):
     
 
 class QuoteExtend071(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -1157,6 +1620,26 @@ quoteMessageFactory.register("071", QuoteExtend071)
 
 
 class Quote(BinaryCodec):
+    __slots__ = ("appl_id", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "quote_msg_id", "account_id", "quote_req_id", "quote_type", "bid_px", "offer_px", "bid_size", "offer_size", "appl_extend")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('quote_msg_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_req_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_type', 'u8'),
+        FieldDescriptor('bid_px', 'i64_le'),
+        FieldDescriptor('offer_px', 'i64_le'),
+        FieldDescriptor('bid_size', 'i64_le'),
+        FieldDescriptor('offer_size', 'i64_le'),
+        FieldDescriptor('appl_extend', 'message', factory='quoteMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.appl_id = ''
         self.submitting_pbuid = ''
@@ -1176,6 +1659,25 @@ class Quote(BinaryCodec):
         self.offer_size = 0
         self.appl_extend = None
     
+    def reset(self):
+        self.appl_id = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.quote_msg_id = ''
+        self.account_id = ''
+        self.quote_req_id = ''
+        self.quote_type = 0
+        self.bid_px = 0
+        self.offer_px = 0
+        self.bid_size = 0
+        self.offer_size = 0
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         write_fixed_string(buffer, self.submitting_pbuid, 6, 'utf-8')
@@ -1196,7 +1698,7 @@ class Quote(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.security_id = read_fixed_string(buffer, 8, 'utf-8')
@@ -1213,8 +1715,11 @@ class Quote(BinaryCodec):
         self.offer_px = buffer.read_i64_le()
         self.bid_size = buffer.read_i64_le()
         self.offer_size = buffer.read_i64_le()
-        self.appl_extend = quoteMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = quoteMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = quoteMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -1247,17 +1752,28 @@ class Quote(BinaryCodec):
 
 
 class Quote1(BinaryCodec):
+    __slots__ = ("quote_id", "quote_price", "quote_qty")
+    _fields = (
+        FieldDescriptor('quote_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_price', 'i64_le'),
+        FieldDescriptor('quote_qty', 'i64_le'),
+    )
     def __init__(self):
         self.quote_id = ''
         self.quote_price = 0
         self.quote_qty = 0
     
+    def reset(self):
+        self.quote_id = ''
+        self.quote_price = 0
+        self.quote_qty = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.quote_id, 10, 'utf-8')
         buffer.write_i64_le(self.quote_price)
         buffer.write_i64_le(self.quote_qty)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.quote_id = read_fixed_string(buffer, 10, 'utf-8')
         self.quote_price = buffer.read_i64_le()
         self.quote_qty = buffer.read_i64_le()
@@ -1274,6 +1790,21 @@ class Quote1(BinaryCodec):
     
 
 class QuoteStatusReportExtend070(BinaryCodec):
+    __slots__ = ("branch_id", "order_id", "exec_id", "quote_resp_id", "private_quote", "side", "price_type", "valid_until_time", "cash_margin", "counter_party_pbuid", "memo", "quote_1")
+    _fields = (
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('quote_resp_id', 'fixed_string', size=10),
+        FieldDescriptor('private_quote', 'u8'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('price_type', 'u8'),
+        FieldDescriptor('valid_until_time', 'i64_le'),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('counter_party_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('memo', 'fixed_string', size=120),
+        FieldDescriptor('quote_1', 'list', length_type='u16_le', element=FieldDescriptor(None, 'message', message_class='Quote1')),
+    )
     def __init__(self):
         self.branch_id = ''
         self.order_id = ''
@@ -1288,6 +1819,20 @@ class QuoteStatusReportExtend070(BinaryCodec):
         self.memo = ''
         self.quote_1 = []
     
+    def reset(self):
+        self.branch_id = ''
+        self.order_id = ''
+        self.exec_id = ''
+        self.quote_resp_id = ''
+        self.private_quote = 0
+        self.side = ''
+        self.price_type = 0
+        self.valid_until_time = 0
+        self.cash_margin = ''
+        self.counter_party_pbuid = ''
+        self.memo = ''
+        self.quote_1 = []
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.branch_id, 2, 'utf-8')
         write_fixed_string(buffer, self.order_id, 16, 'utf-8')
@@ -1306,7 +1851,7 @@ class QuoteStatusReportExtend070(BinaryCodec):
             self.quote_1[i].encode(buffer)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.branch_id = read_fixed_string(buffer, 2, 'utf-8')
         self.order_id = read_fixed_string(buffer, 16, 'utf-8')
         self.exec_id = read_fixed_string(buffer, 16, 'utf-8')
@@ -1319,6 +1864,7 @@ class QuoteStatusReportExtend070(BinaryCodec):
         self.counter_party_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.memo = read_fixed_string(buffer, 120, 'utf-8')
         size = read_len_le(buffer, 'u16')
+        self.quote_1 = []
         for i in range(size):
             _quote_1 = Quote1()
             _quote_1.decode(buffer)
@@ -1351,6 +1897,30 @@ quoteStatusReportMessageFactory.register("070", QuoteStatusReportExtend070)
 
 
 class QuoteStatusReport(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "quote_msg_id", "account_id", "quote_req_id", "quote_rject_reason", "quote_type", "bid_px", "offer_px", "bid_size", "offer_size", "appl_extend")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('quote_msg_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_req_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_rject_reason', 'u64_le'),
+        FieldDescriptor('quote_type', 'u8'),
+        FieldDescriptor('bid_px', 'i64_le'),
+        FieldDescriptor('offer_px', 'i64_le'),
+        FieldDescriptor('bid_size', 'i64_le'),
+        FieldDescriptor('offer_size', 'i64_le'),
+        FieldDescriptor('appl_extend', 'message', factory='quoteStatusReportMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -1374,6 +1944,29 @@ class QuoteStatusReport(BinaryCodec):
         self.offer_size = 0
         self.appl_extend = None
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.quote_msg_id = ''
+        self.account_id = ''
+        self.quote_req_id = ''
+        self.quote_rject_reason = 0
+        self.quote_type = 0
+        self.bid_px = 0
+        self.offer_px = 0
+        self.bid_size = 0
+        self.offer_size = 0
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
@@ -1398,7 +1991,7 @@ class QuoteStatusReport(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -1419,8 +2012,11 @@ class QuoteStatusReport(BinaryCodec):
         self.offer_px = buffer.read_i64_le()
         self.bid_size = buffer.read_i64_le()
         self.offer_size = buffer.read_i64_le()
-        self.appl_extend = quoteStatusReportMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = quoteStatusReportMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = quoteStatusReportMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -1455,17 +2051,28 @@ class QuoteStatusReport(BinaryCodec):
 
 
 class Quote2(BinaryCodec):
+    __slots__ = ("quote_id", "quote_price", "quote_qty")
+    _fields = (
+        FieldDescriptor('quote_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_price', 'i64_le'),
+        FieldDescriptor('quote_qty', 'i64_le'),
+    )
     def __init__(self):
         self.quote_id = ''
         self.quote_price = 0
         self.quote_qty = 0
     
+    def reset(self):
+        self.quote_id = ''
+        self.quote_price = 0
+        self.quote_qty = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.quote_id, 10, 'utf-8')
         buffer.write_i64_le(self.quote_price)
         buffer.write_i64_le(self.quote_qty)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.quote_id = read_fixed_string(buffer, 10, 'utf-8')
         self.quote_price = buffer.read_i64_le()
         self.quote_qty = buffer.read_i64_le()
@@ -1482,13 +2089,20 @@ class Quote2(BinaryCodec):
     
 
 class QuoteResponseExtend070(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -1506,6 +2120,29 @@ quoteResponseMessageFactory.register("070", QuoteResponseExtend070)
 
 
 class QuoteResponse(BinaryCodec):
+    __slots__ = ("appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "cl_ord_id", "account_id", "branch_id", "quote_resp_id", "quote_resp_type", "side", "valid_until_time", "quote_type", "price_type", "quote_2", "appl_extend")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('quote_resp_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_resp_type', 'u8'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('valid_until_time', 'i64_le'),
+        FieldDescriptor('quote_type', 'u8'),
+        FieldDescriptor('price_type', 'u8'),
+        FieldDescriptor('quote_2', 'list', length_type='u16_le', element=FieldDescriptor(None, 'message', message_class='Quote2')),
+        FieldDescriptor('appl_extend', 'message', factory='quoteResponseMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.appl_id = ''
         self.reporting_pbuid = ''
@@ -1528,6 +2165,28 @@ class QuoteResponse(BinaryCodec):
         self.quote_2 = []
         self.appl_extend = None
     
+    def reset(self):
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.cl_ord_id = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.quote_resp_id = ''
+        self.quote_resp_type = 0
+        self.side = ''
+        self.valid_until_time = 0
+        self.quote_type = 0
+        self.price_type = 0
+        self.quote_2 = []
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         write_fixed_string(buffer, self.reporting_pbuid, 6, 'utf-8')
@@ -1555,7 +2214,7 @@ class QuoteResponse(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.reporting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
@@ -1575,13 +2234,17 @@ class QuoteResponse(BinaryCodec):
         self.quote_type = buffer.read_u8()
         self.price_type = buffer.read_u8()
         size = read_len_le(buffer, 'u16')
+        self.quote_2 = []
         for i in range(size):
             _quote_2 = Quote2()
             _quote_2.decode(buffer)
             self.quote_2.append(_quote_2)
         
-        self.appl_extend = quoteResponseMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = quoteResponseMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = quoteResponseMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -1615,15 +2278,24 @@ class QuoteResponse(BinaryCodec):
 
 
 class AllegeQuoteExtend070(BinaryCodec):
+    __slots__ = ("cash_margin", "counter_party_pbuid")
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('counter_party_pbuid', 'fixed_string', size=6),
+    )
     def __init__(self):
         self.cash_margin = ''
         self.counter_party_pbuid = ''
     
+    def reset(self):
+        self.cash_margin = ''
+        self.counter_party_pbuid = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         write_fixed_string(buffer, self.counter_party_pbuid, 6, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
         self.counter_party_pbuid = read_fixed_string(buffer, 6, 'utf-8')
     
@@ -1643,6 +2315,37 @@ allegeQuoteMessageFactory.register("070", AllegeQuoteExtend070)
 
 
 class AllegeQuote(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "order_id", "exec_id", "cl_ord_id", "account_id", "quote_req_id", "quote_id", "quote_resp_id", "quote_type", "bid_px", "offer_px", "bid_size", "offer_size", "private_quote", "valid_until_time", "price_type", "memo", "appl_extend")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_req_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_resp_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_type', 'u8'),
+        FieldDescriptor('bid_px', 'i64_le'),
+        FieldDescriptor('offer_px', 'i64_le'),
+        FieldDescriptor('bid_size', 'i64_le'),
+        FieldDescriptor('offer_size', 'i64_le'),
+        FieldDescriptor('private_quote', 'u8'),
+        FieldDescriptor('valid_until_time', 'i64_le'),
+        FieldDescriptor('price_type', 'u8'),
+        FieldDescriptor('memo', 'fixed_string', size=120),
+        FieldDescriptor('appl_extend', 'message', factory='allegeQuoteMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -1673,6 +2376,36 @@ class AllegeQuote(BinaryCodec):
         self.memo = ''
         self.appl_extend = None
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.order_id = ''
+        self.exec_id = ''
+        self.cl_ord_id = ''
+        self.account_id = ''
+        self.quote_req_id = ''
+        self.quote_id = ''
+        self.quote_resp_id = ''
+        self.quote_type = 0
+        self.bid_px = 0
+        self.offer_px = 0
+        self.bid_size = 0
+        self.offer_size = 0
+        self.private_quote = 0
+        self.valid_until_time = 0
+        self.price_type = 0
+        self.memo = ''
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
@@ -1704,7 +2437,7 @@ class AllegeQuote(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -1732,8 +2465,11 @@ class AllegeQuote(BinaryCodec):
         self.valid_until_time = buffer.read_i64_le()
         self.price_type = buffer.read_u8()
         self.memo = read_fixed_string(buffer, 120, 'utf-8')
-        self.appl_extend = allegeQuoteMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = allegeQuoteMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = allegeQuoteMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -1775,6 +2511,33 @@ class AllegeQuote(BinaryCodec):
 
 
 class AllegeQuoteResponse(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "order_id", "exec_id", "cl_ord_id", "account_id", "quote_id", "quote_resp_id", "quote_resp_type", "private_quote", "order_qty", "price", "valid_until_time", "quote_type", "price_type")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_resp_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_resp_type', 'u8'),
+        FieldDescriptor('private_quote', 'u8'),
+        FieldDescriptor('order_qty', 'i64_le'),
+        FieldDescriptor('price', 'i64_le'),
+        FieldDescriptor('valid_until_time', 'i64_le'),
+        FieldDescriptor('quote_type', 'u8'),
+        FieldDescriptor('price_type', 'u8'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -1801,6 +2564,32 @@ class AllegeQuoteResponse(BinaryCodec):
         self.quote_type = 0
         self.price_type = 0
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.order_id = ''
+        self.exec_id = ''
+        self.cl_ord_id = ''
+        self.account_id = ''
+        self.quote_id = ''
+        self.quote_resp_id = ''
+        self.quote_resp_type = 0
+        self.private_quote = 0
+        self.order_qty = 0
+        self.price = 0
+        self.valid_until_time = 0
+        self.quote_type = 0
+        self.price_type = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
@@ -1827,7 +2616,7 @@ class AllegeQuoteResponse(BinaryCodec):
         buffer.write_u8(self.quote_type)
         buffer.write_u8(self.price_type)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -1887,6 +2676,17 @@ class AllegeQuoteResponse(BinaryCodec):
 
 
 class TradeCaptureReportExtend031(BinaryCodec):
+    __slots__ = ("member_id", "trader_code", "counter_party_member_id", "counter_party_trader_code", "settl_type", "settl_period", "cash_margin", "memo")
+    _fields = (
+        FieldDescriptor('member_id', 'fixed_string', size=6),
+        FieldDescriptor('trader_code', 'fixed_string', size=5),
+        FieldDescriptor('counter_party_member_id', 'fixed_string', size=6),
+        FieldDescriptor('counter_party_trader_code', 'fixed_string', size=5),
+        FieldDescriptor('settl_type', 'fixed_string', size=1),
+        FieldDescriptor('settl_period', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('memo', 'fixed_string', size=120),
+    )
     def __init__(self):
         self.member_id = ''
         self.trader_code = ''
@@ -1897,6 +2697,16 @@ class TradeCaptureReportExtend031(BinaryCodec):
         self.cash_margin = ''
         self.memo = ''
     
+    def reset(self):
+        self.member_id = ''
+        self.trader_code = ''
+        self.counter_party_member_id = ''
+        self.counter_party_trader_code = ''
+        self.settl_type = ''
+        self.settl_period = ''
+        self.cash_margin = ''
+        self.memo = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.member_id, 6, 'utf-8')
         write_fixed_string(buffer, self.trader_code, 5, 'utf-8')
@@ -1907,7 +2717,7 @@ class TradeCaptureReportExtend031(BinaryCodec):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         write_fixed_string(buffer, self.memo, 120, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.member_id = read_fixed_string(buffer, 6, 'utf-8')
         self.trader_code = read_fixed_string(buffer, 5, 'utf-8')
         self.counter_party_member_id = read_fixed_string(buffer, 6, 'utf-8')
@@ -1934,17 +2744,28 @@ class TradeCaptureReportExtend031(BinaryCodec):
     
 
 class TradeCaptureReportExtend051(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16_le'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16_le(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16_le()
         self.expiration_type = buffer.read_u8()
         self.share_property = read_fixed_string(buffer, 2, 'utf-8')
@@ -1961,13 +2782,18 @@ class TradeCaptureReportExtend051(BinaryCodec):
     
 
 class TradeCaptureReportExtend060(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -1977,13 +2803,18 @@ class TradeCaptureReportExtend060(BinaryCodec):
     
 
 class TradeCaptureReportExtend061(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -1993,13 +2824,20 @@ class TradeCaptureReportExtend061(BinaryCodec):
     
 
 class TradeCaptureReportExtend062(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -2021,6 +2859,35 @@ tradeCaptureReportMessageFactory.register("062", TradeCaptureReportExtend062)
 
 
 class TradeCaptureReport(BinaryCodec):
+    __slots__ = ("appl_id", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "trade_report_id", "trade_report_type", "trade_report_trans_type", "trade_handling_instr", "trade_report_ref_id", "last_px", "last_qty", "trd_type", "trd_sub_type", "confirm_id", "side", "pbuid", "account_id", "branch_id", "counter_party_pbuid", "counter_party_account_id", "counter_party_branch_id", "appl_extend")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('trade_report_id', 'fixed_string', size=10),
+        FieldDescriptor('trade_report_type', 'u8'),
+        FieldDescriptor('trade_report_trans_type', 'u8'),
+        FieldDescriptor('trade_handling_instr', 'fixed_string', size=1),
+        FieldDescriptor('trade_report_ref_id', 'fixed_string', size=10),
+        FieldDescriptor('last_px', 'i64_le'),
+        FieldDescriptor('last_qty', 'i64_le'),
+        FieldDescriptor('trd_type', 'u16_le'),
+        FieldDescriptor('trd_sub_type', 'u16_le'),
+        FieldDescriptor('confirm_id', 'u32_le'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('pbuid', 'fixed_string', size=6),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('counter_party_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('counter_party_account_id', 'fixed_string', size=10),
+        FieldDescriptor('counter_party_branch_id', 'fixed_string', size=2),
+        FieldDescriptor('appl_extend', 'message', factory='tradeCaptureReportMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.appl_id = ''
         self.submitting_pbuid = ''
@@ -2049,6 +2916,34 @@ class TradeCaptureReport(BinaryCodec):
         self.counter_party_branch_id = ''
         self.appl_extend = None
     
+    def reset(self):
+        self.appl_id = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.trade_report_id = ''
+        self.trade_report_type = 0
+        self.trade_report_trans_type = 0
+        self.trade_handling_instr = ''
+        self.trade_report_ref_id = ''
+        self.last_px = 0
+        self.last_qty = 0
+        self.trd_type = 0
+        self.trd_sub_type = 0
+        self.confirm_id = 0
+        self.side = ''
+        self.pbuid = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.counter_party_pbuid = ''
+        self.counter_party_account_id = ''
+        self.counter_party_branch_id = ''
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         write_fixed_string(buffer, self.submitting_pbuid, 6, 'utf-8')
@@ -2078,7 +2973,7 @@ class TradeCaptureReport(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.security_id = read_fixed_string(buffer, 8, 'utf-8')
@@ -2104,8 +2999,11 @@ class TradeCaptureReport(BinaryCodec):
         self.counter_party_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.counter_party_account_id = read_fixed_string(buffer, 10, 'utf-8')
         self.counter_party_branch_id = read_fixed_string(buffer, 2, 'utf-8')
-        self.appl_extend = tradeCaptureReportMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = tradeCaptureReportMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = tradeCaptureReportMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -2153,6 +3051,17 @@ class TradeCaptureReport(BinaryCodec):
 
 
 class TradeCaptureReportAckExtend031(BinaryCodec):
+    __slots__ = ("member_id", "trader_code", "counter_party_member_id", "counter_party_trader_code", "settl_type", "settl_period", "cash_margin", "memo")
+    _fields = (
+        FieldDescriptor('member_id', 'fixed_string', size=6),
+        FieldDescriptor('trader_code', 'fixed_string', size=5),
+        FieldDescriptor('counter_party_member_id', 'fixed_string', size=6),
+        FieldDescriptor('counter_party_trader_code', 'fixed_string', size=5),
+        FieldDescriptor('settl_type', 'fixed_string', size=1),
+        FieldDescriptor('settl_period', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('memo', 'fixed_string', size=120),
+    )
     def __init__(self):
         self.member_id = ''
         self.trader_code = ''
@@ -2163,6 +3072,16 @@ class TradeCaptureReportAckExtend031(BinaryCodec):
         self.cash_margin = ''
         self.memo = ''
     
+    def reset(self):
+        self.member_id = ''
+        self.trader_code = ''
+        self.counter_party_member_id = ''
+        self.counter_party_trader_code = ''
+        self.settl_type = ''
+        self.settl_period = ''
+        self.cash_margin = ''
+        self.memo = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.member_id, 6, 'utf-8')
         write_fixed_string(buffer, self.trader_code, 5, 'utf-8')
@@ -2173,7 +3092,7 @@ class TradeCaptureReportAckExtend031(BinaryCodec):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         write_fixed_string(buffer, self.memo, 120, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.member_id = read_fixed_string(buffer, 6, 'utf-8')
         self.trader_code = read_fixed_string(buffer, 5, 'utf-8')
         self.counter_party_member_id = read_fixed_string(buffer, 6, 'utf-8')
@@ -2200,17 +3119,28 @@ class TradeCaptureReportAckExtend031(BinaryCodec):
     
 
 class TradeCaptureReportAckExtend051(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16_le'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16_le(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16_le()
         self.expiration_type = buffer.read_u8()
         self.share_property = read_fixed_string(buffer, 2, 'utf-8')
@@ -2227,13 +3157,18 @@ class TradeCaptureReportAckExtend051(BinaryCodec):
     
 
 class TradeCaptureReportAckExtend060(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -2243,13 +3178,18 @@ class TradeCaptureReportAckExtend060(BinaryCodec):
     
 
 class TradeCaptureReportAckExtend061(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -2259,13 +3199,20 @@ class TradeCaptureReportAckExtend061(BinaryCodec):
     
 
 class TradeCaptureReportAckExtend062(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -2287,6 +3234,43 @@ tradeCaptureReportAckMessageFactory.register("062", TradeCaptureReportAckExtend0
 
 
 class TradeCaptureReportAck(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "trade_id", "trade_report_id", "trade_report_type", "trade_report_trans_type", "trade_handling_instr", "trade_report_ref_id", "trd_ack_status", "trd_rpt_status", "trade_report_reject_reason", "last_px", "last_qty", "trd_type", "trd_sub_type", "confirm_id", "exec_id", "side", "pbuid", "account_id", "branch_id", "counter_party_pbuid", "counter_party_account_id", "counter_party_branch_id", "appl_extend")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('trade_id', 'fixed_string', size=16),
+        FieldDescriptor('trade_report_id', 'fixed_string', size=10),
+        FieldDescriptor('trade_report_type', 'u8'),
+        FieldDescriptor('trade_report_trans_type', 'u8'),
+        FieldDescriptor('trade_handling_instr', 'fixed_string', size=1),
+        FieldDescriptor('trade_report_ref_id', 'fixed_string', size=10),
+        FieldDescriptor('trd_ack_status', 'u8'),
+        FieldDescriptor('trd_rpt_status', 'u8'),
+        FieldDescriptor('trade_report_reject_reason', 'u16_le'),
+        FieldDescriptor('last_px', 'i64_le'),
+        FieldDescriptor('last_qty', 'i64_le'),
+        FieldDescriptor('trd_type', 'u16_le'),
+        FieldDescriptor('trd_sub_type', 'u16_le'),
+        FieldDescriptor('confirm_id', 'u32_le'),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('pbuid', 'fixed_string', size=6),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('counter_party_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('counter_party_account_id', 'fixed_string', size=10),
+        FieldDescriptor('counter_party_branch_id', 'fixed_string', size=2),
+        FieldDescriptor('appl_extend', 'message', factory='tradeCaptureReportAckMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -2323,6 +3307,42 @@ class TradeCaptureReportAck(BinaryCodec):
         self.counter_party_branch_id = ''
         self.appl_extend = None
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.trade_id = ''
+        self.trade_report_id = ''
+        self.trade_report_type = 0
+        self.trade_report_trans_type = 0
+        self.trade_handling_instr = ''
+        self.trade_report_ref_id = ''
+        self.trd_ack_status = 0
+        self.trd_rpt_status = 0
+        self.trade_report_reject_reason = 0
+        self.last_px = 0
+        self.last_qty = 0
+        self.trd_type = 0
+        self.trd_sub_type = 0
+        self.confirm_id = 0
+        self.exec_id = ''
+        self.side = ''
+        self.pbuid = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.counter_party_pbuid = ''
+        self.counter_party_account_id = ''
+        self.counter_party_branch_id = ''
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
@@ -2360,7 +3380,7 @@ class TradeCaptureReportAck(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -2394,8 +3414,11 @@ class TradeCaptureReportAck(BinaryCodec):
         self.counter_party_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.counter_party_account_id = read_fixed_string(buffer, 10, 'utf-8')
         self.counter_party_branch_id = read_fixed_string(buffer, 2, 'utf-8')
-        self.appl_extend = tradeCaptureReportAckMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = tradeCaptureReportAckMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = tradeCaptureReportAckMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -2451,6 +3474,17 @@ class TradeCaptureReportAck(BinaryCodec):
 
 
 class TradeCaptureConfirmExtend031(BinaryCodec):
+    __slots__ = ("member_id", "trader_code", "counter_party_member_id", "counter_party_trader_code", "settl_type", "settl_period", "cash_margin", "memo")
+    _fields = (
+        FieldDescriptor('member_id', 'fixed_string', size=6),
+        FieldDescriptor('trader_code', 'fixed_string', size=5),
+        FieldDescriptor('counter_party_member_id', 'fixed_string', size=6),
+        FieldDescriptor('counter_party_trader_code', 'fixed_string', size=5),
+        FieldDescriptor('settl_type', 'fixed_string', size=1),
+        FieldDescriptor('settl_period', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('memo', 'fixed_string', size=120),
+    )
     def __init__(self):
         self.member_id = ''
         self.trader_code = ''
@@ -2461,6 +3495,16 @@ class TradeCaptureConfirmExtend031(BinaryCodec):
         self.cash_margin = ''
         self.memo = ''
     
+    def reset(self):
+        self.member_id = ''
+        self.trader_code = ''
+        self.counter_party_member_id = ''
+        self.counter_party_trader_code = ''
+        self.settl_type = ''
+        self.settl_period = ''
+        self.cash_margin = ''
+        self.memo = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.member_id, 6, 'utf-8')
         write_fixed_string(buffer, self.trader_code, 5, 'utf-8')
@@ -2471,7 +3515,7 @@ class TradeCaptureConfirmExtend031(BinaryCodec):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         write_fixed_string(buffer, self.memo, 120, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.member_id = read_fixed_string(buffer, 6, 'utf-8')
         self.trader_code = read_fixed_string(buffer, 5, 'utf-8')
         self.counter_party_member_id = read_fixed_string(buffer, 6, 'utf-8')
@@ -2498,19 +3542,32 @@ class TradeCaptureConfirmExtend031(BinaryCodec):
     
 
 class TradeCaptureConfirmExtend051(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "maturity_date", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16_le'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('maturity_date', 'u32_le'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.maturity_date = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.maturity_date = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16_le(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         buffer.write_u32_le(self.maturity_date)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16_le()
         self.expiration_type = buffer.read_u8()
         self.maturity_date = buffer.read_u32_le()
@@ -2529,13 +3586,18 @@ class TradeCaptureConfirmExtend051(BinaryCodec):
     
 
 class TradeCaptureConfirmExtend060(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -2545,13 +3607,18 @@ class TradeCaptureConfirmExtend060(BinaryCodec):
     
 
 class TradeCaptureConfirmExtend061(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -2561,13 +3628,20 @@ class TradeCaptureConfirmExtend061(BinaryCodec):
     
 
 class TradeCaptureConfirmExtend062(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -2589,6 +3663,39 @@ tradeCaptureConfirmMessageFactory.register("062", TradeCaptureConfirmExtend062)
 
 
 class TradeCaptureConfirm(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "trade_id", "trade_report_id", "trade_report_type", "trade_report_trans_type", "trade_handling_instr", "last_px", "last_qty", "trd_type", "trd_sub_type", "confirm_id", "exec_id", "side", "pbuid", "account_id", "branch_id", "counter_party_pbuid", "counter_party_account_id", "counter_party_branch_id", "appl_extend")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16_le'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+        FieldDescriptor('trade_id', 'fixed_string', size=16),
+        FieldDescriptor('trade_report_id', 'fixed_string', size=10),
+        FieldDescriptor('trade_report_type', 'u8'),
+        FieldDescriptor('trade_report_trans_type', 'u8'),
+        FieldDescriptor('trade_handling_instr', 'fixed_string', size=1),
+        FieldDescriptor('last_px', 'i64_le'),
+        FieldDescriptor('last_qty', 'i64_le'),
+        FieldDescriptor('trd_type', 'u16_le'),
+        FieldDescriptor('trd_sub_type', 'u16_le'),
+        FieldDescriptor('confirm_id', 'u32_le'),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('pbuid', 'fixed_string', size=6),
+        FieldDescriptor('account_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=2),
+        FieldDescriptor('counter_party_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('counter_party_account_id', 'fixed_string', size=10),
+        FieldDescriptor('counter_party_branch_id', 'fixed_string', size=2),
+        FieldDescriptor('appl_extend', 'message', factory='tradeCaptureConfirmMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -2621,6 +3728,38 @@ class TradeCaptureConfirm(BinaryCodec):
         self.counter_party_branch_id = ''
         self.appl_extend = None
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.trade_id = ''
+        self.trade_report_id = ''
+        self.trade_report_type = 0
+        self.trade_report_trans_type = 0
+        self.trade_handling_instr = ''
+        self.last_px = 0
+        self.last_qty = 0
+        self.trd_type = 0
+        self.trd_sub_type = 0
+        self.confirm_id = 0
+        self.exec_id = ''
+        self.side = ''
+        self.pbuid = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.counter_party_pbuid = ''
+        self.counter_party_account_id = ''
+        self.counter_party_branch_id = ''
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
@@ -2654,7 +3793,7 @@ class TradeCaptureConfirm(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -2684,8 +3823,11 @@ class TradeCaptureConfirm(BinaryCodec):
         self.counter_party_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.counter_party_account_id = read_fixed_string(buffer, 10, 'utf-8')
         self.counter_party_branch_id = read_fixed_string(buffer, 2, 'utf-8')
-        self.appl_extend = tradeCaptureConfirmMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = tradeCaptureConfirmMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = tradeCaptureConfirmMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -2737,6 +3879,19 @@ class TradeCaptureConfirm(BinaryCodec):
 
 
 class BusinessReject(BinaryCodec):
+    __slots__ = ("appl_id", "transact_time", "submitting_pbuid", "security_id", "security_id_source", "ref_seq_num", "ref_msg_type", "business_reject_ref_id", "business_reject_reason", "business_reject_text")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('transact_time', 'i64_le'),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('ref_seq_num', 'i64_le'),
+        FieldDescriptor('ref_msg_type', 'u32_le'),
+        FieldDescriptor('business_reject_ref_id', 'fixed_string', size=10),
+        FieldDescriptor('business_reject_reason', 'u16_le'),
+        FieldDescriptor('business_reject_text', 'fixed_string', size=50),
+    )
     def __init__(self):
         self.appl_id = ''
         self.transact_time = 0
@@ -2749,6 +3904,18 @@ class BusinessReject(BinaryCodec):
         self.business_reject_reason = 0
         self.business_reject_text = ''
     
+    def reset(self):
+        self.appl_id = ''
+        self.transact_time = 0
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.ref_seq_num = 0
+        self.ref_msg_type = 0
+        self.business_reject_ref_id = ''
+        self.business_reject_reason = 0
+        self.business_reject_text = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         buffer.write_i64_le(self.transact_time)
@@ -2761,7 +3928,7 @@ class BusinessReject(BinaryCodec):
         buffer.write_u16_le(self.business_reject_reason)
         write_fixed_string(buffer, self.business_reject_text, 50, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.transact_time = buffer.read_i64_le()
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
@@ -2793,15 +3960,24 @@ class BusinessReject(BinaryCodec):
 
 
 class ReportPartitionSync(BinaryCodec):
+    __slots__ = ("partition_no", "report_index")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
     
@@ -2816,9 +3992,16 @@ class ReportPartitionSync(BinaryCodec):
     
 
 class ReportSynchronization(BinaryCodec):
+    __slots__ = ("report_partition_sync",)
+    _fields = (
+        FieldDescriptor('report_partition_sync', 'list', length_type='u16_le', element=FieldDescriptor(None, 'message', message_class='ReportPartitionSync')),
+    )
     def __init__(self):
         self.report_partition_sync = []
     
+    def reset(self):
+        self.report_partition_sync = []
+    
     def encode(self, buffer: ByteBuf):
         size = len(self.report_partition_sync)
         buffer.write_u16_le(size)
@@ -2826,8 +4009,9 @@ class ReportSynchronization(BinaryCodec):
             self.report_partition_sync[i].encode(buffer)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         size = read_len_le(buffer, 'u16')
+        self.report_partition_sync = []
         for i in range(size):
             _report_partition_sync = ReportPartitionSync()
             _report_partition_sync.decode(buffer)
@@ -2845,6 +4029,15 @@ class ReportSynchronization(BinaryCodec):
 
 
 class TradingSessionStatus(BinaryCodec):
+    __slots__ = ("market_id", "market_segment_id", "trading_session_id", "trading_session_sub_id", "trad_ses_status", "trad_ses_start_time")
+    _fields = (
+        FieldDescriptor('market_id', 'fixed_string', size=3),
+        FieldDescriptor('market_segment_id', 'fixed_string', size=3),
+        FieldDescriptor('trading_session_id', 'fixed_string', size=3),
+        FieldDescriptor('trading_session_sub_id', 'fixed_string', size=3),
+        FieldDescriptor('trad_ses_status', 'u8'),
+        FieldDescriptor('trad_ses_start_time', 'i64_le'),
+    )
     def __init__(self):
         self.market_id = ''
         self.market_segment_id = ''
@@ -2853,6 +4046,14 @@ class TradingSessionStatus(BinaryCodec):
         self.trad_ses_status = 0
         self.trad_ses_start_time = 0
     
+    def reset(self):
+        self.market_id = ''
+        self.market_segment_id = ''
+        self.trading_session_id = ''
+        self.trading_session_sub_id = ''
+        self.trad_ses_status = 0
+        self.trad_ses_start_time = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.market_id, 3, 'utf-8')
         write_fixed_string(buffer, self.market_segment_id, 3, 'utf-8')
@@ -2861,7 +4062,7 @@ class TradingSessionStatus(BinaryCodec):
         buffer.write_u8(self.trad_ses_status)
         buffer.write_i64_le(self.trad_ses_start_time)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.market_id = read_fixed_string(buffer, 3, 'utf-8')
         self.market_segment_id = read_fixed_string(buffer, 3, 'utf-8')
         self.trading_session_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -2885,15 +4086,24 @@ class TradingSessionStatus(BinaryCodec):
 
 
 class PlatformStateInfo(BinaryCodec):
+    __slots__ = ("platform_id", "platform_state")
+    _fields = (
+        FieldDescriptor('platform_id', 'u16_le'),
+        FieldDescriptor('platform_state', 'u16_le'),
+    )
     def __init__(self):
         self.platform_id = 0
         self.platform_state = 0
     
+    def reset(self):
+        self.platform_id = 0
+        self.platform_state = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16_le(self.platform_id)
         buffer.write_u16_le(self.platform_state)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.platform_id = buffer.read_u16_le()
         self.platform_state = buffer.read_u16_le()
     
@@ -2909,17 +4119,28 @@ class PlatformStateInfo(BinaryCodec):
 
 
 class ReportFinished(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "platform_id")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('report_index', 'i64_le'),
+        FieldDescriptor('platform_id', 'u16_le'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
         self.platform_id = 0
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.platform_id = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         buffer.write_i64_le(self.report_index)
         buffer.write_u16_le(self.platform_id)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.report_index = buffer.read_i64_le()
         self.platform_id = buffer.read_u16_le()
@@ -2937,15 +4158,24 @@ class ReportFinished(BinaryCodec):
 
 
 class NoPartitions(BinaryCodec):
+    __slots__ = ("partition_no", "partition_name")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32_le'),
+        FieldDescriptor('partition_name', 'fixed_string', size=20),
+    )
     def __init__(self):
         self.partition_no = 0
         self.partition_name = ''
     
+    def reset(self):
+        self.partition_no = 0
+        self.partition_name = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32_le(self.partition_no)
         write_fixed_string(buffer, self.partition_name, 20, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32_le()
         self.partition_name = read_fixed_string(buffer, 20, 'utf-8')
     
@@ -2960,10 +4190,19 @@ class NoPartitions(BinaryCodec):
     
 
 class PlatformInfo(BinaryCodec):
+    __slots__ = ("platform_id", "no_partitions")
+    _fields = (
+        FieldDescriptor('platform_id', 'u16_le'),
+        FieldDescriptor('no_partitions', 'list', length_type='u16_le', element=FieldDescriptor(None, 'message', message_class='NoPartitions')),
+    )
     def __init__(self):
         self.platform_id = 0
         self.no_partitions = []
     
+    def reset(self):
+        self.platform_id = 0
+        self.no_partitions = []
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16_le(self.platform_id)
         size = len(self.no_partitions)
@@ -2972,9 +4211,10 @@ class PlatformInfo(BinaryCodec):
             self.no_partitions[i].encode(buffer)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.platform_id = buffer.read_u16_le()
         size = read_len_le(buffer, 'u16')
+        self.no_partitions = []
         for i in range(size):
             _no_partitions = NoPartitions()
             _no_partitions.decode(buffer)
@@ -3008,24 +4248,67 @@ bjseBinaryMessageFactory.register(7, ReportFinished)
 
 
 class BjseBinary(BinaryCodec):
+    __slots__ = ("msg_type", "body_length", "body", "checksum", "checksum_valid", "body_cache")
+    _fields = (
+        FieldDescriptor('msg_type', 'u32_le'),
+        FieldDescriptor('body_length', 'u32_le'),
+        FieldDescriptor('body', 'message', factory='bjseBinaryMessageFactory', factory_key='msg_type'),
+        FieldDescriptor('checksum', 'u32_le'),
+    )
+    frame_layout = FrameLayout(4, "<I", 8, "<I")
+    checksum_service = create_checksum_service("BJSE_BIN")
+    checksum_verifier = ChecksumVerifier(checksum_service)
+
     def __init__(self):
         self.msg_type = 0
         self.body_length = 0
         self.body = None
         self.checksum = 0
+        self.checksum_valid = None
+        self.body_cache = None
+    
+    def reset(self):
+        self.msg_type = 0
+        self.body_length = 0
+        self.body = None
+        self.checksum = 0
+        self.checksum_valid = None
     
     def encode(self, buffer: ByteBuf):
+        frame_start = buffer.write_index
         buffer.write_u32_le(self.msg_type)
-        buffer.write_u32_le(self.body_length)
+        body_length_pos = buffer.write_index
+        buffer.write_u32_le(0)
+        body_start = buffer.write_index
         if self.body is not None:
             self.body.encode(buffer)
+        body_end = buffer.write_index
+        self.body_length = body_end - body_start
+        buffer.write_u32_le_at(body_length_pos, self.body_length)
+        service = self.checksum_service
+        if service :
+            self.checksum = service.calc_range(buffer, frame_start, buffer.write_index)
         buffer.write_u32_le(self.checksum)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
+        checksum_valid = self.checksum_verifier.verify_next(buffer, self.frame_layout)
+        self._decode_frame(buffer, reuse_body)
+        self.checksum_valid = checksum_valid
+
+    @classmethod
+    def decode_batch(cls, buffer: ByteBuf) -> list:
+        return decode_frames(cls, buffer)
+    
+    def _decode_frame(self, buffer: ByteBuf, reuse_body: bool = False):
         self.msg_type = buffer.read_u32_le()
         self.body_length = buffer.read_u32_le()
-        self.body = bjseBinaryMessageFactory.create(self.msg_type)
-        self.body.decode(buffer)
+        if reuse_body:
+            if self.body_cache is None:
+                self.body_cache = {}
+            self.body = bjseBinaryMessageFactory.create_cached(self.msg_type, self.body_cache)
+        else:
+            self.body = bjseBinaryMessageFactory.create(self.msg_type)
+        self.body.decode(buffer.read_verified_slice(self.body_length), reuse_body)
         self.checksum = buffer.read_u32_le()
     
     def __eq__(self, other):
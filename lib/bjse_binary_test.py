@@ -1,4 +1,6 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
+import struct
 import unittest
 
 from bjse_binary import *
@@ -1400,6 +1402,30 @@ class TestBjseBinary(unittest.TestCase):
         decoded_packet.decode(buf)
         self.assertEqual(decoded_packet, self.packet)
 
+    def test_encode_computes_body_length_and_checksum(self):
+        body = ByteBuf()
+        self.packet.body.encode(body)
+        buf = ByteBuf()
+        buf.write_bytes(b"\xff" * 3)
+        self.packet.encode(buf)
+        frame = bytes(buf.to_bytes()[3:])
+        self.assertEqual(body.write_index, self.packet.body_length)
+        self.assertEqual(self.packet.body_length, struct.unpack_from("<I", frame, 4)[0])
+        self.assertEqual(sum(frame[:-4]) % 256, self.packet.checksum)
+        buf.skip_bytes(3)
+        decoded_packet = BjseBinary()
+        decoded_packet.decode(buf)
+        self.assertTrue(decoded_packet.checksum_valid)
+        self.assertEqual(decoded_packet, self.packet)
+
+    def test_decode_batch(self):
+        buf = ByteBuf()
+        for _ in range(3):
+            self.packet.encode(buf)
+        packets = BjseBinary.decode_batch(buf)
+        self.assertEqual([True] * 3, [p.checksum_valid for p in packets])
+        self.assertEqual(0, buf.readable_bytes_len())
+
 
 
 if __name__ == '__main__':
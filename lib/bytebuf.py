@@ -1,5 +1,9 @@
 import abc
+import array
+import mmap
+import os
 import struct
+import sys
 
 from numpy import longlong
 
@@ -46,6 +50,21 @@ class Buf(metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
     def to_bytes(self) -> bytearray:
+        """The written bytes as bytes or bytearray, never a view.
+
+        May return the backing bytearray itself when it is exactly full.
+        """
+        pass
+
+    @abc.abstractmethod
+    def readable_view(self) -> memoryview:
+        """The unread bytes, without copying where the storage allows it."""
+        pass
+
+    @abc.abstractmethod
+    def peek_views(self, length: int, offset: int = 0) -> list:
+        """memoryviews covering ``length`` unread bytes at ``offset``, in
+        order and without copying; nothing is consumed."""
         pass
 
     @abc.abstractmethod
@@ -206,19 +225,296 @@ class Buf(metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
     def read_bytes(self, length: int) -> bytes:
+        """Consume ``length`` bytes as a bytes-like object.
+
+        This may be a memoryview into the storage (zero_copy buffers, views
+        from slice(), composite and mmap-backed buffers); call bytes() on it
+        for an owned copy.
+        """
         pass
 
+    def _read_array(self, code: str, length: int, little_endian: bool) -> list:
+        """Read ``length`` consecutive values with one array.frombytes call."""
+        ret = array.array(_ARRAY_CODES[code])
+        ret.frombytes(self.read_bytes(length * ret.itemsize))
+        if ret.itemsize > 1 and little_endian != _LITTLE_ENDIAN_HOST:
+            ret.byteswap()
+        return ret.tolist()
+
+    def _write_array(self, code: str, values, little_endian: bool):
+        """Write all ``values`` with one struct.pack call."""
+        order = Buf.ByteOrder.LITTLE_ENDIAN if little_endian else Buf.ByteOrder.BIG_ENDIAN
+        self.write_bytes(struct.pack("%s%d%s" % (order, len(values), code), *values))
+
+    def write_struct(self, struct_obj: struct.Struct, *values):
+        """Write a run of fixed-width fields with one precompiled Struct."""
+        self.write_bytes(struct_obj.pack(*values))
+
+    def read_struct(self, struct_obj: struct.Struct) -> tuple:
+        """Read a run of fixed-width fields with one precompiled Struct."""
+        return struct_obj.unpack(self.read_bytes(struct_obj.size))
+
+    def read_i8_array(self, length: int) -> list:
+        return self._read_array("b", length, False)
+
+    def write_i8_array(self, values):
+        self._write_array("b", values, False)
+
+    def read_u8_array(self, length: int) -> list:
+        return self._read_array("B", length, False)
+
+    def write_u8_array(self, values):
+        self._write_array("B", values, False)
+
+    def read_i16_array(self, length: int) -> list:
+        return self._read_array("h", length, False)
+
+    def write_i16_array(self, values):
+        self._write_array("h", values, False)
+
+    def read_i16_le_array(self, length: int) -> list:
+        return self._read_array("h", length, True)
+
+    def write_i16_le_array(self, values):
+        self._write_array("h", values, True)
+
+    def read_u16_array(self, length: int) -> list:
+        return self._read_array("H", length, False)
+
+    def write_u16_array(self, values):
+        self._write_array("H", values, False)
+
+    def read_u16_le_array(self, length: int) -> list:
+        return self._read_array("H", length, True)
+
+    def write_u16_le_array(self, values):
+        self._write_array("H", values, True)
+
+    def read_i32_array(self, length: int) -> list:
+        return self._read_array("i", length, False)
+
+    def write_i32_array(self, values):
+        self._write_array("i", values, False)
+
+    def read_i32_le_array(self, length: int) -> list:
+        return self._read_array("i", length, True)
+
+    def write_i32_le_array(self, values):
+        self._write_array("i", values, True)
+
+    def read_u32_array(self, length: int) -> list:
+        return self._read_array("I", length, False)
+
+    def write_u32_array(self, values):
+        self._write_array("I", values, False)
+
+    def read_u32_le_array(self, length: int) -> list:
+        return self._read_array("I", length, True)
+
+    def write_u32_le_array(self, values):
+        self._write_array("I", values, True)
+
+    def read_i64_array(self, length: int) -> list:
+        return self._read_array("q", length, False)
+
+    def write_i64_array(self, values):
+        self._write_array("q", values, False)
+
+    def read_i64_le_array(self, length: int) -> list:
+        return self._read_array("q", length, True)
+
+    def write_i64_le_array(self, values):
+        self._write_array("q", values, True)
+
+    def read_u64_array(self, length: int) -> list:
+        return self._read_array("Q", length, False)
+
+    def write_u64_array(self, values):
+        self._write_array("Q", values, False)
+
+    def read_u64_le_array(self, length: int) -> list:
+        return self._read_array("Q", length, True)
+
+    def write_u64_le_array(self, values):
+        self._write_array("Q", values, True)
+
+    def read_f32_array(self, length: int) -> list:
+        return self._read_array("f", length, False)
+
+    def write_f32_array(self, values):
+        self._write_array("f", values, False)
+
+    def read_f32_le_array(self, length: int) -> list:
+        return self._read_array("f", length, True)
+
+    def write_f32_le_array(self, values):
+        self._write_array("f", values, True)
+
+    def read_f64_array(self, length: int) -> list:
+        return self._read_array("d", length, False)
+
+    def write_f64_array(self, values):
+        self._write_array("d", values, False)
+
+    def read_f64_le_array(self, length: int) -> list:
+        return self._read_array("d", length, True)
+
+    def write_f64_le_array(self, values):
+        self._write_array("d", values, True)
+
+
+_LITTLE_ENDIAN_HOST = sys.byteorder == "little"
+
+
+def _array_code(candidates: str, itemsize: int) -> str:
+    for code in candidates:
+        if array.array(code).itemsize == itemsize:
+            return code
+    raise ValueError("no array typecode of size %d in %r" % (itemsize, candidates))
+
+
+# struct format code -> array typecode of the same width on this platform
+_ARRAY_CODES = {
+    "b": "b",
+    "B": "B",
+    "h": _array_code("hi", 2),
+    "H": _array_code("HI", 2),
+    "i": _array_code("il", 4),
+    "I": _array_code("IL", 4),
+    "q": _array_code("ql", 8),
+    "Q": _array_code("QL", 8),
+    "f": "f",
+    "d": "d",
+}
+
+_I8 = struct.Struct(Buf.SIGNED_CHAR)
+_U8 = struct.Struct(Buf.UNSIGNED_CHAR)
+_BOOL = struct.Struct(Buf.BOOLEAN)
+_I16 = struct.Struct(Buf.ByteOrder.BIG_ENDIAN + Buf.SHORT)
+_I16_LE = struct.Struct(Buf.ByteOrder.LITTLE_ENDIAN + Buf.SHORT)
+_U16 = struct.Struct(Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_SHORT)
+_U16_LE = struct.Struct(Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_SHORT)
+_I32 = struct.Struct(Buf.ByteOrder.BIG_ENDIAN + Buf.INT)
+_I32_LE = struct.Struct(Buf.ByteOrder.LITTLE_ENDIAN + Buf.INT)
+_U32 = struct.Struct(Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_INT)
+_U32_LE = struct.Struct(Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_INT)
+_I64 = struct.Struct(Buf.ByteOrder.BIG_ENDIAN + Buf.LONG_LONG)
+_I64_LE = struct.Struct(Buf.ByteOrder.LITTLE_ENDIAN + Buf.LONG_LONG)
+_U64 = struct.Struct(Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_LONG_LONG)
+_U64_LE = struct.Struct(Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_LONG_LONG)
+_F32 = struct.Struct(Buf.ByteOrder.BIG_ENDIAN + Buf.FLOAT)
+_F32_LE = struct.Struct(Buf.ByteOrder.LITTLE_ENDIAN + Buf.FLOAT)
+_F64 = struct.Struct(Buf.ByteOrder.BIG_ENDIAN + Buf.DOUBLE)
+_F64_LE = struct.Struct(Buf.ByteOrder.LITTLE_ENDIAN + Buf.DOUBLE)
+
+# struct.Struct("<n>s").pack_into by length, for write_bytes: packing in place
+# is cheaper than bytearray slice assignment, and pack_into's own size check
+# stands in for the capacity check.
+_BYTES_PACKERS = {}
+_MAX_PACKED_BYTES = 256
+
 
 class ByteBuf(Buf):
-    def __init__(self, buf: bytearray = None) -> None:
+    DEFAULT_INITIAL_CAPACITY = 256
+    # Restores per-field bounds checks in slices from read_verified_slice().
+    debug_checks = False
+    # Writes into read-only storage copy it into a bytearray first.
+    copy_on_write = True
+
+    def __init__(
+        self,
+        buf: bytearray = None,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+        zero_copy: bool = False,
+        max_capacity: int = None,
+    ) -> None:
+        """Create a buffer, optionally wrapping existing storage.
+
+        ``buf`` may be any object supporting the buffer protocol (bytearray,
+        bytes, memoryview, mmap); it is wrapped as-is, without copying.
+        Read-only storage is copied into a new bytearray on the first write.
+        With ``zero_copy`` set, read_bytes returns memoryview slices of the
+        backing storage instead of copies. ``max_capacity`` bounds growth;
+        writes past it raise IndexError.
+        """
+        self.initial_capacity = initial_capacity
+        self.zero_copy = zero_copy
+        self.max_capacity = max_capacity
+        if isinstance(buf, memoryview) and (buf.ndim != 1 or buf.format != "B"):
+            buf = buf.cast("B")
         if buf is None:
-            self.buf = bytearray()
+            self.buf = bytearray(initial_capacity)
             self.write_index = 0
             self.read_index = 0
         else:
             self.buf = buf
             self.write_index = len(buf)
             self.read_index = 0
+        self.marked_read_index = 0
+        # False while the storage may be shared: wrapped, or from duplicate()
+        self._owns_storage = buf is None
+
+    def capacity(self) -> int:
+        return len(self.buf)
+
+    def ensure_writable(self, length: int):
+        """Grow the backing storage so ``length`` more bytes fit at write_index.
+
+        Capacity doubles until the write fits. Storage this buffer allocated
+        is resized in place when nothing views it; otherwise a new bytearray
+        is allocated, so views handed out earlier stay valid and wrapped
+        storage is left alone.
+        """
+        required = self.write_index + length
+        if required <= len(self.buf):
+            return
+        if self.max_capacity is not None and required > self.max_capacity:
+            raise IndexError(
+                "writing %d bytes exceeds max capacity %d" % (length, self.max_capacity)
+            )
+        capacity = max(len(self.buf), self.initial_capacity, 1)
+        while capacity < required:
+            capacity <<= 1
+        buf = self.buf
+        if self._owns_storage:
+            try:
+                # realloc, which bytearray refuses while a memoryview is exported
+                buf += bytes(capacity - len(buf))
+                return
+            except BufferError:
+                pass
+        buf = bytearray(capacity)
+        buf[: self.write_index] = memoryview(self.buf)[: self.write_index]
+        self.buf = buf
+        self._owns_storage = True
+
+    def writable_bytes(self) -> int:
+        return len(self.buf) - self.write_index
+
+    def writable_view(self) -> memoryview:
+        """The free region after write_index, for socket.recv_into and the like.
+
+        Call advance_writer() with the number of bytes actually written. Growth
+        moves the storage, so take a fresh view after ensure_writable().
+        """
+        return memoryview(self.buf)[self.write_index :]
+
+    def advance_writer(self, length: int):
+        """Mark ``length`` bytes written into writable_view() as readable."""
+        if length < 0 or length > self.writable_bytes():
+            raise IndexError("cannot advance writer by %d" % length)
+        self.write_index += length
+
+    def recv_into(self, sock, nbytes: int = 0) -> int:
+        """socket.recv_into straight into the free region; returns the count.
+
+        With ``nbytes`` room for that many bytes is made first, otherwise the
+        buffer only grows when it is full.
+        """
+        self.ensure_writable(max(nbytes, 1 if self.writable_bytes() == 0 else 0))
+        received = sock.recv_into(self.writable_view(), nbytes)
+        self.write_index += received
+        return received
 
     def check_readable_bytes_len(self, length: int):
         if self.readable_bytes_len() < length:
@@ -226,342 +522,1497 @@ class ByteBuf(Buf):
                 "readable bytes length must greater than or equal %d" % length
             )
 
+    def check_written_range(self, pos: int, length: int, name: str):
+        if pos < 0 or pos + length > self.write_index:
+            raise IndexError("Position out of bounds for %s" % name)
+
+    def check_patchable_range(self, pos: int, length: int, name: str):
+        """check_written_range() for write_*_at; read-only storage is copied
+        into a bytearray first."""
+        self.check_written_range(pos, length, name)
+        if self.buf.__class__ is not bytearray and self._read_only():
+            self.buf = bytearray(self.buf)
+            self._owns_storage = True
+
+    def _read_only(self) -> bool:
+        """Whether writes need the storage replaced by a bytearray first."""
+        buf = self.buf
+        if buf.__class__ is bytearray or not self.copy_on_write:
+            return False
+        with memoryview(buf) as view:
+            return view.readonly
+
     def readable_bytes_len(self) -> int:
         return self.write_index - self.read_index
 
+    def skip_bytes(self, length: int):
+        self.check_readable_bytes_len(length)
+        self.read_index += length
+
+    def mark_reader_index(self):
+        self.marked_read_index = self.read_index
+
+    def reset_reader_index(self):
+        self.read_index = self.marked_read_index
+
+    def check_peekable(self, offset: int, length: int):
+        if offset < 0 or self.readable_bytes_len() < offset + length:
+            raise Exception(
+                "readable bytes length must greater than or equal %d" % (offset + length)
+            )
+
+    def _peek(self, s: struct.Struct, offset: int):
+        """Unpack at read_index + offset without consuming anything."""
+        self.check_peekable(offset, s.size)
+        return s.unpack_from(self.buf, self.read_index + offset)[0]
+
+    def peek_i8(self, offset: int = 0) -> int:
+        return self._peek(_I8, offset)
+
+    def peek_u8(self, offset: int = 0) -> int:
+        return self._peek(_U8, offset)
+
+    def peek_bool(self, offset: int = 0) -> bool:
+        return self._peek(_BOOL, offset)
+
+    def peek_i16(self, offset: int = 0) -> int:
+        return self._peek(_I16, offset)
+
+    def peek_i16_le(self, offset: int = 0) -> int:
+        return self._peek(_I16_LE, offset)
+
+    def peek_u16(self, offset: int = 0) -> int:
+        return self._peek(_U16, offset)
+
+    def peek_u16_le(self, offset: int = 0) -> int:
+        return self._peek(_U16_LE, offset)
+
+    def peek_i32(self, offset: int = 0) -> int:
+        return self._peek(_I32, offset)
+
+    def peek_i32_le(self, offset: int = 0) -> int:
+        return self._peek(_I32_LE, offset)
+
+    def peek_u32(self, offset: int = 0) -> int:
+        return self._peek(_U32, offset)
+
+    def peek_u32_le(self, offset: int = 0) -> int:
+        return self._peek(_U32_LE, offset)
+
+    def peek_i64(self, offset: int = 0) -> int:
+        return self._peek(_I64, offset)
+
+    def peek_i64_le(self, offset: int = 0) -> int:
+        return self._peek(_I64_LE, offset)
+
+    def peek_u64(self, offset: int = 0) -> int:
+        return self._peek(_U64, offset)
+
+    def peek_u64_le(self, offset: int = 0) -> int:
+        return self._peek(_U64_LE, offset)
+
+    def peek_f32(self, offset: int = 0) -> float:
+        return self._peek(_F32, offset)
+
+    def peek_f32_le(self, offset: int = 0) -> float:
+        return self._peek(_F32_LE, offset)
+
+    def peek_f64(self, offset: int = 0) -> float:
+        return self._peek(_F64, offset)
+
+    def peek_f64_le(self, offset: int = 0) -> float:
+        return self._peek(_F64_LE, offset)
+
+    def peek_bytes(self, length: int, offset: int = 0) -> bytearray:
+        self.check_peekable(offset, length)
+        start = self.read_index + offset
+        if self.zero_copy:
+            return memoryview(self.buf)[start : start + length]
+        return self.buf[start : start + length]
+
+    def peek_views(self, length: int, offset: int = 0) -> list:
+        self.check_peekable(offset, length)
+        start = self.read_index + offset
+        return [memoryview(self.buf)[start : start + length]]
+
+    def slice(self, offset: int, length: int) -> "ByteBuf":
+        """A view of ``length`` written bytes starting at absolute ``offset``.
+
+        The view shares storage with this buffer but has its own indices,
+        starting fully readable, and cannot grow past ``length``.
+        """
+        self.check_written_range(offset, length, "slice")
+        return ByteBuf(
+            memoryview(self.buf)[offset : offset + length],
+            zero_copy=self.zero_copy,
+            max_capacity=length,
+        )
+
+    def read_slice(self, length: int) -> "ByteBuf":
+        """Like slice() over the next ``length`` readable bytes, consuming them."""
+        self.check_readable_bytes_len(length)
+        ret = self.slice(self.read_index, length)
+        self.read_index += length
+        return ret
+
+    def read_verified_slice(self, length: int) -> "ByteBuf":
+        """Consume ``length`` bytes, verified once, as a view for decoding.
+
+        The returned view skips per-field bounds checks on primitive reads;
+        set ByteBuf.debug_checks to get a fully checked slice instead.
+        """
+        if ByteBuf.debug_checks:
+            return self.read_slice(length)
+        self.check_readable_bytes_len(length)
+        start = self.read_index
+        self.read_index = start + length
+        return UncheckedByteBuf(
+            memoryview(self.buf)[start : start + length],
+            zero_copy=self.zero_copy,
+            max_capacity=length,
+        )
+
+    def duplicate(self) -> "ByteBuf":
+        """A buffer over the same storage whose indices start equal but move
+        independently. It cannot grow past the current capacity."""
+        ret = ByteBuf(
+            self.buf,
+            initial_capacity=self.initial_capacity,
+            zero_copy=self.zero_copy,
+            max_capacity=len(self.buf),
+        )
+        ret.read_index = self.read_index
+        ret.write_index = self.write_index
+        return ret
+
     def to_bytes(self) -> bytearray:
-        return self.buf
+        buf = self.buf
+        if isinstance(buf, (bytearray, bytes)):
+            if self.write_index == len(buf):
+                return buf
+            return buf[: self.write_index]
+        # memoryview or mmap storage: copy out instead of leaking a view.
+        return bytes(buf[: self.write_index])
+
+    def readable_view(self) -> memoryview:
+        return memoryview(self.buf)[self.read_index : self.write_index]
+
+    def view(self, start: int, end: int) -> memoryview:
+        """A memoryview of the written bytes ``[start, end)``, absolute offsets."""
+        if end < start:
+            raise IndexError("Position out of bounds for view")
+        self.check_written_range(start, end - start, "view")
+        return memoryview(self.buf)[start:end]
+
+    def clear(self):
+        """Reset both indices so the storage can be reused for the next frame.
+
+        Read-only storage is swapped for a new bytearray, as nothing in it is
+        kept.
+        """
+        if self._read_only():
+            self.buf = bytearray(self.initial_capacity)
+            self._owns_storage = True
+        self.read_index = 0
+        self.write_index = 0
+        self.marked_read_index = 0
+
+    def discard_read_bytes(self):
+        """Move the unread bytes to the start of the storage."""
+        if self.read_index == 0:
+            return
+        readable = self.write_index - self.read_index
+        if isinstance(self.buf, bytearray):
+            view = memoryview(self.buf)
+            view[:readable] = view[self.read_index : self.write_index]
+            view.release()
+        else:
+            buf = bytearray(max(readable, self.initial_capacity))
+            buf[:readable] = memoryview(self.buf)[self.read_index : self.write_index]
+            self.buf = buf
+            self._owns_storage = True
+        self.marked_read_index = max(0, self.marked_read_index - self.read_index)
+        self.read_index = 0
+        self.write_index = readable
+
+    def compact(self):
+        """Discard read bytes and give back capacity grown past what is needed.
+
+        Storage shrinks to the larger of initial_capacity and the unread
+        byte count, so a burst of large frames does not pin memory for the
+        rest of the session.
+        """
+        readable = self.write_index - self.read_index
+        capacity = max(readable, self.initial_capacity)
+        if capacity >= len(self.buf):
+            self.discard_read_bytes()
+            return
+        buf = bytearray(capacity)
+        buf[:readable] = memoryview(self.buf)[self.read_index : self.write_index]
+        self.buf = buf
+        self._owns_storage = True
+        self.marked_read_index = max(0, self.marked_read_index - self.read_index)
+        self.read_index = 0
+        self.write_index = readable
 
     def write_i8(self, value: int):
-        self.buf += struct.pack(Buf.SIGNED_CHAR, value)
-        self.write_index += 1
-        
+        index = self.write_index
+        if index + 1 > len(self.buf):
+            self.ensure_writable(1)
+        _I8.pack_into(self.buf, index, value)
+        self.write_index = index + 1
+
     def write_i8_at(self, pos: int, value: int):
-        if pos + 1 > len(self.buf):
-            raise IndexError("Position out of bounds for write_i8_at")
-        struct.pack_into(self.SIGNED_CHAR, self.buf, pos, value)
+        self.check_patchable_range(pos, 1, "write_i8_at")
+        _I8.pack_into(self.buf, pos, value)
 
     def write_u8(self, value: int):
-        self.buf += struct.pack(Buf.UNSIGNED_CHAR, value)
-        self.write_index += 1
-    
+        index = self.write_index
+        if index + 1 > len(self.buf):
+            self.ensure_writable(1)
+        _U8.pack_into(self.buf, index, value)
+        self.write_index = index + 1
+
     def write_u8_at(self, pos: int, value: int):
-        if pos + 1 > len(self.buf):
-            raise IndexError("Position out of bounds for write_u8_at")
-        struct.pack_into(self.UNSIGNED_CHAR, self.buf, pos, value)
+        self.check_patchable_range(pos, 1, "write_u8_at")
+        _U8.pack_into(self.buf, pos, value)
 
     def write_bool(self, value: bool):
-        self.buf += struct.pack(Buf.BOOLEAN, value)
-        self.write_index += 1
-        
+        index = self.write_index
+        if index + 1 > len(self.buf):
+            self.ensure_writable(1)
+        _BOOL.pack_into(self.buf, index, value)
+        self.write_index = index + 1
+
     def write_bool_at(self, pos: int, value: bool):
-        if pos + 1 > len(self.buf):
-            raise IndexError("Position out of bounds for write_bool_at")
-        struct.pack_into(self.BOOLEAN, self.buf, pos, value)
+        self.check_patchable_range(pos, 1, "write_bool_at")
+        _BOOL.pack_into(self.buf, pos, value)
 
     def write_i16(self, value: int):
-        self.buf += struct.pack(Buf.ByteOrder.BIG_ENDIAN + Buf.SHORT, value)
-        self.write_index += 2
-        
+        index = self.write_index
+        if index + 2 > len(self.buf):
+            self.ensure_writable(2)
+        _I16.pack_into(self.buf, index, value)
+        self.write_index = index + 2
+
     def write_i16_at(self, pos: int, value: int):
-        if pos + 2 > len(self.buf):
-            raise IndexError("Position out of bounds for write_i16_at")
-        struct.pack_into(self.ByteOrder.BIG_ENDIAN + self.SHORT, self.buf, pos, value)
+        self.check_patchable_range(pos, 2, "write_i16_at")
+        _I16.pack_into(self.buf, pos, value)
 
     def write_i16_le(self, value: int):
-        self.buf += struct.pack(Buf.ByteOrder.LITTLE_ENDIAN + Buf.SHORT, value)
-        self.write_index += 2
-        
+        index = self.write_index
+        if index + 2 > len(self.buf):
+            self.ensure_writable(2)
+        _I16_LE.pack_into(self.buf, index, value)
+        self.write_index = index + 2
+
     def write_i16_le_at(self, pos: int, value: int):
-        if pos + 2 > len(self.buf):
-            raise IndexError("Position out of bounds for write_i16_le_at")
-        struct.pack_into(self.ByteOrder.LITTLE_ENDIAN + self.SHORT, self.buf, pos, value)
+        self.check_patchable_range(pos, 2, "write_i16_le_at")
+        _I16_LE.pack_into(self.buf, pos, value)
 
     def write_u16(self, value: int):
-        self.buf += struct.pack(Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_SHORT, value)
-        self.write_index += 2
-        
-    def write_u16_at(self, pos: int, value: int):
-        if pos + 2 > len(self.buf):
-            raise IndexError("Position out of bounds for write_u16_at")
-        struct.pack_into(self.ByteOrder.BIG_ENDIAN + self.UNSIGNED_SHORT, self.buf, pos, value)
+        index = self.write_index
+        if index + 2 > len(self.buf):
+            self.ensure_writable(2)
+        _U16.pack_into(self.buf, index, value)
+        self.write_index = index + 2
 
+    def write_u16_at(self, pos: int, value: int):
+        self.check_patchable_range(pos, 2, "write_u16_at")
+        _U16.pack_into(self.buf, pos, value)
 
     def write_u16_le(self, value: int):
-        self.buf += struct.pack(Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_SHORT, value)
-        self.write_index += 2
-        
+        index = self.write_index
+        if index + 2 > len(self.buf):
+            self.ensure_writable(2)
+        _U16_LE.pack_into(self.buf, index, value)
+        self.write_index = index + 2
+
     def write_u16_le_at(self, pos: int, value: int):
-        if pos + 2 > len(self.buf):
-            raise IndexError("Position out of bounds for write_u16_le_at")
-        struct.pack_into(self.ByteOrder.LITTLE_ENDIAN + self.UNSIGNED_SHORT, self.buf, pos, value)
+        self.check_patchable_range(pos, 2, "write_u16_le_at")
+        _U16_LE.pack_into(self.buf, pos, value)
 
     def write_i32(self, value: int):
-        self.buf += struct.pack(Buf.ByteOrder.BIG_ENDIAN + Buf.INT, value)
-        self.write_index += 4
-    
+        index = self.write_index
+        if index + 4 > len(self.buf):
+            self.ensure_writable(4)
+        _I32.pack_into(self.buf, index, value)
+        self.write_index = index + 4
+
     def write_i32_at(self, pos: int, value: int):
-        if pos + 4 > len(self.buf):
-            raise IndexError("Position out of bounds for write_i32_at")
-        struct.pack_into(self.ByteOrder.BIG_ENDIAN + self.INT, self.buf, pos, value)
+        self.check_patchable_range(pos, 4, "write_i32_at")
+        _I32.pack_into(self.buf, pos, value)
 
     def write_i32_le(self, value: int):
-        self.buf += struct.pack(Buf.ByteOrder.LITTLE_ENDIAN + Buf.INT, value)
-        self.write_index += 4
+        index = self.write_index
+        if index + 4 > len(self.buf):
+            self.ensure_writable(4)
+        _I32_LE.pack_into(self.buf, index, value)
+        self.write_index = index + 4
 
     def write_i32_le_at(self, pos: int, value: int):
-        if pos + 4 > len(self.buf):
-            raise IndexError("Position out of bounds for write_i32_le_at")
-        struct.pack_into(self.ByteOrder.LITTLE_ENDIAN + self.INT, self.buf, pos, value)
+        self.check_patchable_range(pos, 4, "write_i32_le_at")
+        _I32_LE.pack_into(self.buf, pos, value)
 
     def write_u32(self, value: int):
-        self.buf += struct.pack(Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_INT, value)
-        self.write_index += 4
-    
+        index = self.write_index
+        if index + 4 > len(self.buf):
+            self.ensure_writable(4)
+        _U32.pack_into(self.buf, index, value)
+        self.write_index = index + 4
+
     def write_u32_at(self, pos: int, value: int):
-        if pos + 4 > len(self.buf):
-            raise IndexError("Position out of bounds for write_u32_at")
-        struct.pack_into(self.ByteOrder.BIG_ENDIAN + self.UNSIGNED_INT, self.buf, pos, value)
+        self.check_patchable_range(pos, 4, "write_u32_at")
+        _U32.pack_into(self.buf, pos, value)
 
     def write_u32_le(self, value: int):
-        self.buf += struct.pack(Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_INT, value)
-        self.write_index += 4
-        
+        index = self.write_index
+        if index + 4 > len(self.buf):
+            self.ensure_writable(4)
+        _U32_LE.pack_into(self.buf, index, value)
+        self.write_index = index + 4
+
     def write_u32_le_at(self, pos: int, value: int):
-        if pos + 4 > len(self.buf):
-            raise IndexError("Position out of bounds for write_u32_le_at")
-        struct.pack_into(self.ByteOrder.LITTLE_ENDIAN + self.UNSIGNED_INT, self.buf, pos, value)
+        self.check_patchable_range(pos, 4, "write_u32_le_at")
+        _U32_LE.pack_into(self.buf, pos, value)
 
     def write_i64(self, value: longlong):
-        self.buf += struct.pack(Buf.ByteOrder.BIG_ENDIAN + Buf.LONG_LONG, value)
-        self.write_index += 8
-        
+        index = self.write_index
+        if index + 8 > len(self.buf):
+            self.ensure_writable(8)
+        _I64.pack_into(self.buf, index, value)
+        self.write_index = index + 8
+
     def write_i64_at(self, pos: int, value: longlong):
-        if pos + 8 > len(self.buf):
-            raise IndexError("Position out of bounds for write_i64_at")
-        struct.pack_into(self.ByteOrder.BIG_ENDIAN + self.LONG_LONG, self.buf, pos, value)
+        self.check_patchable_range(pos, 8, "write_i64_at")
+        _I64.pack_into(self.buf, pos, value)
 
     def write_i64_le(self, value: longlong):
-        self.buf += struct.pack(Buf.ByteOrder.LITTLE_ENDIAN + Buf.LONG_LONG, value)
-        self.write_index += 8
-    
+        index = self.write_index
+        if index + 8 > len(self.buf):
+            self.ensure_writable(8)
+        _I64_LE.pack_into(self.buf, index, value)
+        self.write_index = index + 8
+
     def write_i64_le_at(self, pos: int, value: longlong):
-        if pos + 8 > len(self.buf):
-            raise IndexError("Position out of bounds for write_i64_at")
-        struct.pack_into(self.ByteOrder.LITTLE_ENDIAN + self.LONG_LONG, self.buf, pos, value)
+        self.check_patchable_range(pos, 8, "write_i64_le_at")
+        _I64_LE.pack_into(self.buf, pos, value)
 
     def write_u64(self, value: longlong):
-        self.buf += struct.pack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_LONG_LONG, value
-        )
-        self.write_index += 8
-        
+        index = self.write_index
+        if index + 8 > len(self.buf):
+            self.ensure_writable(8)
+        _U64.pack_into(self.buf, index, value)
+        self.write_index = index + 8
+
     def write_u64_at(self, pos: int, value: longlong):
-        if pos + 8 > len(self.buf):
-            raise IndexError("Position out of bounds for write_u64_at")
-        struct.pack_into(self.ByteOrder.BIG_ENDIAN + self.UNSIGNED_LONG_LONG, self.buf, pos, value)
+        self.check_patchable_range(pos, 8, "write_u64_at")
+        _U64.pack_into(self.buf, pos, value)
 
     def write_u64_le(self, value: longlong):
-        self.buf += struct.pack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_LONG_LONG, value
-        )
-        self.write_index += 8
-        
+        index = self.write_index
+        if index + 8 > len(self.buf):
+            self.ensure_writable(8)
+        _U64_LE.pack_into(self.buf, index, value)
+        self.write_index = index + 8
+
     def write_u64_le_at(self, pos: int, value: longlong):
-        if pos + 8 > len(self.buf):
-            raise IndexError("Position out of bounds for write_u64_le_at")
-        struct.pack_into(self.ByteOrder.LITTLE_ENDIAN + self.UNSIGNED_LONG_LONG, self.buf, pos, value)
+        self.check_patchable_range(pos, 8, "write_u64_le_at")
+        _U64_LE.pack_into(self.buf, pos, value)
 
     def write_f32(self, value: float):
-        self.buf += struct.pack(Buf.ByteOrder.BIG_ENDIAN + Buf.FLOAT, value)
-        self.write_index += 4
+        index = self.write_index
+        if index + 4 > len(self.buf):
+            self.ensure_writable(4)
+        _F32.pack_into(self.buf, index, value)
+        self.write_index = index + 4
 
     def write_f32_le(self, value: float):
-        self.buf += struct.pack(Buf.ByteOrder.LITTLE_ENDIAN + Buf.FLOAT, value)
-        self.write_index += 4
+        index = self.write_index
+        if index + 4 > len(self.buf):
+            self.ensure_writable(4)
+        _F32_LE.pack_into(self.buf, index, value)
+        self.write_index = index + 4
 
     def write_f64(self, value: float):
-        self.buf += struct.pack(Buf.ByteOrder.BIG_ENDIAN + Buf.DOUBLE, value)
-        self.write_index += 8
+        index = self.write_index
+        if index + 8 > len(self.buf):
+            self.ensure_writable(8)
+        _F64.pack_into(self.buf, index, value)
+        self.write_index = index + 8
 
     def write_f64_le(self, value: float):
-        self.buf += struct.pack(Buf.ByteOrder.LITTLE_ENDIAN + Buf.DOUBLE, value)
-        self.write_index += 8
+        index = self.write_index
+        if index + 8 > len(self.buf):
+            self.ensure_writable(8)
+        _F64_LE.pack_into(self.buf, index, value)
+        self.write_index = index + 8
+
+    def _write_array(self, code: str, values, little_endian: bool):
+        order = Buf.ByteOrder.LITTLE_ENDIAN if little_endian else Buf.ByteOrder.BIG_ENDIAN
+        fmt = "%s%d%s" % (order, len(values), code)
+        size = struct.calcsize(fmt)
+        index = self.write_index
+        if index + size > len(self.buf):
+            self.ensure_writable(size)
+        struct.pack_into(fmt, self.buf, index, *values)
+        self.write_index = index + size
+
+    def write_struct(self, struct_obj: struct.Struct, *values):
+        size = struct_obj.size
+        index = self.write_index
+        if index + size > len(self.buf):
+            self.ensure_writable(size)
+        struct_obj.pack_into(self.buf, index, *values)
+        self.write_index = index + size
+
+    def read_struct(self, struct_obj: struct.Struct) -> tuple:
+        self.check_readable_bytes_len(struct_obj.size)
+        ret = struct_obj.unpack_from(self.buf, self.read_index)
+        self.read_index += struct_obj.size
+        return ret
 
     def write_bytes(self, value: bytes):
-        if len(value) > 0:
-            self.buf += value
-            self.write_index += len(value)
+        index = self.write_index
+        try:
+            _BYTES_PACKERS[len(value)](self.buf, index, value)
+        except (KeyError, struct.error):
+            # first write of this length, no room left, or a memoryview
+            # ("s" only packs bytes and bytearray)
+            self._write_bytes_slow(value)
+            return
+        self.write_index = index + len(value)
+
+    def _write_bytes_slow(self, value):
+        index = self.write_index
+        length = len(value)
+        self.ensure_writable(length)
+        if length <= _MAX_PACKED_BYTES and length not in _BYTES_PACKERS:
+            _BYTES_PACKERS[length] = struct.Struct("%ds" % length).pack_into
+        self.buf[index : index + length] = value
+        self.write_index = index + length
 
     def read_i8(self) -> int:
         self.check_readable_bytes_len(1)
-        ret = struct.unpack(
-            Buf.SIGNED_CHAR, self.buf[self.read_index : self.read_index + 1]
-        )
+        ret = _I8.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 1
-        return ret[0]
+        return ret
 
     def read_u8(self):
         self.check_readable_bytes_len(1)
-        ret = struct.unpack(
-            Buf.UNSIGNED_CHAR, self.buf[self.read_index : self.read_index + 1]
-        )
+        ret = _U8.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 1
-        return ret[0]
+        return ret
 
     def read_bool(self):
         self.check_readable_bytes_len(1)
-        ret = struct.unpack(
-            Buf.BOOLEAN, self.buf[self.read_index : self.read_index + 1]
-        )
+        ret = _BOOL.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 1
-        return ret[0]
+        return ret
 
     def read_i16(self):
         self.check_readable_bytes_len(2)
-        ret = struct.unpack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.SHORT,
-            self.buf[self.read_index : self.read_index + 2],
-        )
+        ret = _I16.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 2
-        return ret[0]
+        return ret
 
     def read_i16_le(self):
         self.check_readable_bytes_len(2)
-        ret = struct.unpack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.SHORT,
-            self.buf[self.read_index : self.read_index + 2],
-        )
+        ret = _I16_LE.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 2
-        return ret[0]
+        return ret
 
     def read_u16(self):
         self.check_readable_bytes_len(2)
-        ret = struct.unpack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_SHORT,
-            self.buf[self.read_index : self.read_index + 2],
-        )
+        ret = _U16.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 2
-        return ret[0]
+        return ret
 
     def read_u16_le(self):
         self.check_readable_bytes_len(2)
-        ret = struct.unpack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_SHORT,
-            self.buf[self.read_index : self.read_index + 2],
-        )
+        ret = _U16_LE.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 2
-        return ret[0]
+        return ret
 
     def read_i32(self):
-        ret = struct.unpack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.INT,
-            self.buf[self.read_index : self.read_index + 4],
-        )
+        self.check_readable_bytes_len(4)
+        ret = _I32.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 4
-        return ret[0]
+        return ret
 
     def read_i32_le(self):
         self.check_readable_bytes_len(4)
-        ret = struct.unpack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.INT,
-            self.buf[self.read_index : self.read_index + 4],
-        )
+        ret = _I32_LE.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 4
-        return ret[0]
+        return ret
 
     def read_u32(self):
         self.check_readable_bytes_len(4)
-        ret = struct.unpack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_INT,
-            self.buf[self.read_index : self.read_index + 4],
-        )
+        ret = _U32.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 4
-        return ret[0]
+        return ret
 
     def read_u32_le(self):
         self.check_readable_bytes_len(4)
-        ret = struct.unpack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_INT,
-            self.buf[self.read_index : self.read_index + 4],
-        )
+        ret = _U32_LE.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 4
-        return ret[0]
+        return ret
 
     def read_i64(self):
         self.check_readable_bytes_len(8)
-        ret = struct.unpack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.LONG_LONG,
-            self.buf[self.read_index : self.read_index + 8],
-        )
+        ret = _I64.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 8
-        return ret[0]
+        return ret
 
     def read_i64_le(self):
         self.check_readable_bytes_len(8)
-        ret = struct.unpack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.LONG_LONG,
-            self.buf[self.read_index : self.read_index + 8],
-        )
+        ret = _I64_LE.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 8
-        return ret[0]
+        return ret
 
     def read_u64(self):
         self.check_readable_bytes_len(8)
-        ret = struct.unpack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.UNSIGNED_LONG_LONG,
-            self.buf[self.read_index : self.read_index + 8],
-        )
+        ret = _U64.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 8
-        return ret[0]
+        return ret
 
     def read_u64_le(self):
         self.check_readable_bytes_len(8)
-        ret = struct.unpack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.UNSIGNED_LONG_LONG,
-            self.buf[self.read_index : self.read_index + 8],
-        )
+        ret = _U64_LE.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 8
-        return ret[0]
+        return ret
 
     def read_f32(self):
         self.check_readable_bytes_len(4)
-        ret = struct.unpack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.FLOAT,
-            self.buf[self.read_index : self.read_index + 4],
-        )
+        ret = _F32.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 4
-        return ret[0]
+        return ret
 
     def read_f32_le(self):
         self.check_readable_bytes_len(4)
-        ret = struct.unpack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.FLOAT,
-            self.buf[self.read_index : self.read_index + 4],
-        )
+        ret = _F32_LE.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 4
-        return ret[0]
+        return ret
 
     def read_f64(self):
         self.check_readable_bytes_len(8)
-        ret = struct.unpack(
-            Buf.ByteOrder.BIG_ENDIAN + Buf.DOUBLE,
-            self.buf[self.read_index : self.read_index + 8],
-        )
+        ret = _F64.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 8
-        return ret[0]
+        return ret
 
     def read_f64_le(self):
         self.check_readable_bytes_len(8)
-        ret = struct.unpack(
-            Buf.ByteOrder.LITTLE_ENDIAN + Buf.DOUBLE,
-            self.buf[self.read_index : self.read_index + 8],
-        )
+        ret = _F64_LE.unpack_from(self.buf, self.read_index)[0]
         self.read_index += 8
-        return ret[0]
+        return ret
 
     def read_bytes(self, length: int) -> bytearray:
         self.check_readable_bytes_len(length)
-        ret = self.buf[self.read_index : self.read_index + length]
+        if self.zero_copy:
+            ret = memoryview(self.buf)[self.read_index : self.read_index + length]
+        else:
+            ret = self.buf[self.read_index : self.read_index + length]
         self.read_index += length
         return ret
+
+
+class UncheckedByteBuf(ByteBuf):
+    """A read view whose reads skip the per-field length check.
+
+    Only created by read_verified_slice(), over storage that ends exactly at
+    the verified range, so an overrun still fails inside struct.unpack_from
+    rather than reading past the frame. Slicing truncates silently at the
+    end of storage instead, so read_bytes (and with it every fixed-string
+    field) compares against write_index inline rather than through
+    check_readable_bytes_len().
+    """
+
+    def read_bytes(self, length: int) -> bytearray:
+        start = self.read_index
+        end = start + length
+        if end > self.write_index:
+            self.check_readable_bytes_len(length)
+        self.read_index = end
+        if self.zero_copy:
+            return memoryview(self.buf)[start:end]
+        return self.buf[start:end]
+
+    def read_struct(self, struct_obj: struct.Struct) -> tuple:
+        ret = struct_obj.unpack_from(self.buf, self.read_index)
+        self.read_index += struct_obj.size
+        return ret
+
+    def read_i8(self) -> int:
+        ret = _I8.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 1
+        return ret
+
+    def read_u8(self):
+        ret = _U8.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 1
+        return ret
+
+    def read_bool(self):
+        ret = _BOOL.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 1
+        return ret
+
+    def read_i16(self):
+        ret = _I16.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 2
+        return ret
+
+    def read_i16_le(self):
+        ret = _I16_LE.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 2
+        return ret
+
+    def read_u16(self):
+        ret = _U16.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 2
+        return ret
+
+    def read_u16_le(self):
+        ret = _U16_LE.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 2
+        return ret
+
+    def read_i32(self):
+        ret = _I32.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 4
+        return ret
+
+    def read_i32_le(self):
+        ret = _I32_LE.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 4
+        return ret
+
+    def read_u32(self):
+        ret = _U32.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 4
+        return ret
+
+    def read_u32_le(self):
+        ret = _U32_LE.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 4
+        return ret
+
+    def read_i64(self):
+        ret = _I64.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 8
+        return ret
+
+    def read_i64_le(self):
+        ret = _I64_LE.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 8
+        return ret
+
+    def read_u64(self):
+        ret = _U64.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 8
+        return ret
+
+    def read_u64_le(self):
+        ret = _U64_LE.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 8
+        return ret
+
+    def read_f32(self):
+        ret = _F32.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 4
+        return ret
+
+    def read_f32_le(self):
+        ret = _F32_LE.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 4
+        return ret
+
+    def read_f64(self):
+        ret = _F64.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 8
+        return ret
+
+    def read_f64_le(self):
+        ret = _F64_LE.unpack_from(self.buf, self.read_index)[0]
+        self.read_index += 8
+        return ret
+
+
+class MmapByteBuf(ByteBuf):
+    """Read-only ByteBuf over a memory-mapped file, for decoding captures.
+
+    Pages are faulted in on demand, so decoding starts immediately and the
+    file is never copied into process memory. Reads are sequential through
+    read_*; random access goes through slice() or by setting read_index.
+    Writes raise, as copy_on_write is off. Call close() (or use it as a
+    context manager) to unmap deterministically; views handed out by
+    slice()/read_bytes() must be released first, otherwise close() raises
+    BufferError and leaves the buffer open and readable.
+    """
+
+    copy_on_write = False
+
+    def __init__(self, path, zero_copy: bool = True) -> None:
+        self._mmap = None
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > 0:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        super().__init__(
+            self._mmap if self._mmap is not None else b"",
+            zero_copy=zero_copy,
+            max_capacity=size,
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap is None or self._mmap.closed
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self.buf = b""
+        self.read_index = 0
+        self.write_index = 0
+        self.max_capacity = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CompositeByteBuf(Buf):
+    """One logical buffer over a list of components, without concatenating.
+
+    Components are ByteBuf readable regions or bytes-like objects, added
+    by reference. read_* works across component boundaries; values that
+    straddle two components are gathered into a small temporary. Writes
+    append to an owned tail component. nio_buffers() returns the readable
+    region as a list of memoryviews for vectored sends::
+
+        out = CompositeByteBuf()
+        for frame in frames:
+            out.add_component(frame)
+        sent = sock.sendmsg(out.nio_buffers())
+        out.skip_bytes(sent)
+    """
+
+    def __init__(self, components=()) -> None:
+        self._components = []
+        self._tail = None
+        self._cursor = 0
+        self._cursor_offset = 0
+        self.read_index = 0
+        self.write_index = 0
+        for component in components:
+            self.add_component(component)
+
+    def add_component(self, component):
+        if isinstance(component, ByteBuf):
+            component = memoryview(component.buf)[
+                component.read_index : component.write_index
+            ]
+        else:
+            component = memoryview(component)
+            if component.ndim != 1 or component.format != "B":
+                component = component.cast("B")
+        self._tail = None
+        if len(component) > 0:
+            self._components.append(component)
+            self.write_index += len(component)
+        return self
+
+    def num_components(self) -> int:
+        return len(self._components)
+
+    def nio_buffers(self) -> list:
+        """memoryviews covering [read_index, write_index), in order."""
+        self._tail = None
+        if self.read_index == self.write_index:
+            return []
+        views = [memoryview(c) for c in self._components[self._cursor :]]
+        views[0] = views[0][self._cursor_offset :]
+        return views
+
+    def discard_read_components(self):
+        """Drop components that have been read completely."""
+        if self._cursor == len(self._components):
+            self._tail = None
+        removed = sum(len(c) for c in self._components[: self._cursor])
+        del self._components[: self._cursor]
+        self._cursor = 0
+        self.read_index -= removed
+        self.write_index -= removed
+
+    def check_readable_bytes_len(self, length: int):
+        if self.readable_bytes_len() < length:
+            raise Exception(
+                "readable bytes length must greater than or equal %d" % length
+            )
+
+    def readable_bytes_len(self) -> int:
+        return self.write_index - self.read_index
+
+    def skip_bytes(self, length: int):
+        self.check_readable_bytes_len(length)
+        self._advance(length)
+
+    def to_bytes(self) -> bytes:
+        return b"".join(self._components)
+
+    def readable_view(self) -> memoryview:
+        """A view into the current component, or a gathered copy when the
+        unread bytes span several components."""
+        views = self.nio_buffers()
+        if len(views) == 1:
+            return views[0]
+        return memoryview(b"".join(views))
+
+    def peek_views(self, length: int, offset: int = 0) -> list:
+        if offset < 0 or self.readable_bytes_len() < offset + length:
+            raise Exception(
+                "readable bytes length must greater than or equal %d" % (offset + length)
+            )
+        self._tail = None
+        views = []
+        cursor, offset = self._cursor, self._cursor_offset + offset
+        while length > 0:
+            component = self._components[cursor]
+            if offset < len(component):
+                chunk = memoryview(component)[offset : offset + length]
+                views.append(chunk)
+                length -= len(chunk)
+                offset = 0
+            else:
+                offset -= len(component)
+            cursor += 1
+        return views
+
+    def read_slice(self, length: int) -> ByteBuf:
+        """The next ``length`` bytes as a ByteBuf, copied only if they span
+        more than one component."""
+        self.check_readable_bytes_len(length)
+        component = self._components[self._cursor] if length else b""
+        offset = self._cursor_offset
+        if offset + length <= len(component):
+            if component is self._tail:
+                self._tail = None
+            ret = ByteBuf(memoryview(component)[offset : offset + length], max_capacity=length)
+            self._advance(length)
+            return ret
+        return ByteBuf(self._gather(length), max_capacity=length)
+
+    def read_verified_slice(self, length: int) -> ByteBuf:
+        return self.read_slice(length)
+
+    def _advance(self, length: int):
+        self.read_index += length
+        offset = self._cursor_offset + length
+        components = self._components
+        while self._cursor < len(components) and offset >= len(components[self._cursor]):
+            offset -= len(components[self._cursor])
+            self._cursor += 1
+        self._cursor_offset = offset
+
+    def _gather(self, length: int) -> bytes:
+        chunks = []
+        remaining = length
+        cursor, offset = self._cursor, self._cursor_offset
+        while remaining > 0:
+            component = self._components[cursor]
+            chunk = component[offset : offset + remaining]
+            chunks.append(chunk)
+            remaining -= len(chunk)
+            cursor, offset = cursor + 1, 0
+        self._advance(length)
+        return b"".join(chunks)
+
+    def _read(self, s: struct.Struct):
+        size = s.size
+        self.check_readable_bytes_len(size)
+        component = self._components[self._cursor]
+        offset = self._cursor_offset
+        if offset + size <= len(component):
+            ret = s.unpack_from(component, offset)[0]
+            self._advance(size)
+            return ret
+        return s.unpack(self._gather(size))[0]
+
+    def _write(self, s: struct.Struct, value):
+        tail = self._tail
+        if tail is None:
+            tail = self._tail = bytearray()
+            self._components.append(tail)
+        tail += s.pack(value)
+        self.write_index += s.size
+
+    def write_i8(self, value: int):
+        self._write(_I8, value)
+
+    def write_u8(self, value: int):
+        self._write(_U8, value)
+
+    def write_bool(self, value: bool):
+        self._write(_BOOL, value)
+
+    def write_i16(self, value: int):
+        self._write(_I16, value)
+
+    def write_i16_le(self, value: int):
+        self._write(_I16_LE, value)
+
+    def write_u16(self, value: int):
+        self._write(_U16, value)
+
+    def write_u16_le(self, value: int):
+        self._write(_U16_LE, value)
+
+    def write_i32(self, value: int):
+        self._write(_I32, value)
+
+    def write_i32_le(self, value: int):
+        self._write(_I32_LE, value)
+
+    def write_u32(self, value: int):
+        self._write(_U32, value)
+
+    def write_u32_le(self, value: int):
+        self._write(_U32_LE, value)
+
+    def write_i64(self, value: longlong):
+        self._write(_I64, value)
+
+    def write_i64_le(self, value: longlong):
+        self._write(_I64_LE, value)
+
+    def write_u64(self, value: longlong):
+        self._write(_U64, value)
+
+    def write_u64_le(self, value: longlong):
+        self._write(_U64_LE, value)
+
+    def write_f32(self, value: float):
+        self._write(_F32, value)
+
+    def write_f32_le(self, value: float):
+        self._write(_F32_LE, value)
+
+    def write_f64(self, value: float):
+        self._write(_F64, value)
+
+    def write_f64_le(self, value: float):
+        self._write(_F64_LE, value)
+
+    def write_bytes(self, value: bytes):
+        if len(value) > 0:
+            tail = self._tail
+            if tail is None:
+                tail = self._tail = bytearray()
+                self._components.append(tail)
+            tail += value
+            self.write_index += len(value)
+
+    def read_i8(self):
+        return self._read(_I8)
+
+    def read_u8(self):
+        return self._read(_U8)
+
+    def read_bool(self):
+        return self._read(_BOOL)
+
+    def read_i16(self):
+        return self._read(_I16)
+
+    def read_i16_le(self):
+        return self._read(_I16_LE)
+
+    def read_u16(self):
+        return self._read(_U16)
+
+    def read_u16_le(self):
+        return self._read(_U16_LE)
+
+    def read_i32(self):
+        return self._read(_I32)
+
+    def read_i32_le(self):
+        return self._read(_I32_LE)
+
+    def read_u32(self):
+        return self._read(_U32)
+
+    def read_u32_le(self):
+        return self._read(_U32_LE)
+
+    def read_i64(self):
+        return self._read(_I64)
+
+    def read_i64_le(self):
+        return self._read(_I64_LE)
+
+    def read_u64(self):
+        return self._read(_U64)
+
+    def read_u64_le(self):
+        return self._read(_U64_LE)
+
+    def read_f32(self):
+        return self._read(_F32)
+
+    def read_f32_le(self):
+        return self._read(_F32_LE)
+
+    def read_f64(self):
+        return self._read(_F64)
+
+    def read_f64_le(self):
+        return self._read(_F64_LE)
+
+    def read_bytes(self, length: int) -> bytes:
+        self.check_readable_bytes_len(length)
+        component = self._components[self._cursor] if length else b""
+        offset = self._cursor_offset
+        if offset + length <= len(component):
+            if component is self._tail:
+                self._tail = None
+            ret = memoryview(component)[offset : offset + length]
+            self._advance(length)
+            return ret
+        return self._gather(length)
+
+
+class RingByteBuf(Buf):
+    """Fixed-capacity circular buffer for a long-lived receive stream.
+
+    Received bytes land directly in the free region (recv_into) and decoded
+    frames free their space as they are read, so steady-state receiving
+    neither grows memory nor compacts. read_*/peek_* handle values that
+    wrap around the end; only those few bytes are gathered. The ring grows
+    (doubling) only when it is full, i.e. when a single frame is larger
+    than the ring. Views from read_slice() alias ring storage and are only
+    valid until more data is received. read_index counts every byte
+    consumed so far; it is a stream position, not a storage offset.
+    """
+
+    DEFAULT_CAPACITY = 64 * 1024
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.buf = bytearray(capacity)
+        self._head = 0
+        self._size = 0
+        self.read_index = 0
+
+    def capacity(self) -> int:
+        return len(self.buf)
+
+    def check_readable_bytes_len(self, length: int):
+        if self._size < length:
+            raise Exception(
+                "readable bytes length must greater than or equal %d" % length
+            )
+
+    def readable_bytes_len(self) -> int:
+        return self._size
+
+    def writable_bytes(self) -> int:
+        return len(self.buf) - self._size
+
+    def ensure_writable(self, length: int):
+        """Grow (and linearize) the ring so ``length`` more bytes fit."""
+        if self.writable_bytes() >= length:
+            return
+        capacity = max(len(self.buf), 1)
+        while capacity - self._size < length:
+            capacity <<= 1
+        buf = bytearray(capacity)
+        pos = 0
+        for piece in self._readable_pieces(0, self._size):
+            buf[pos : pos + len(piece)] = piece
+            pos += len(piece)
+        self.buf = buf
+        self._head = 0
+
+    def writable_view(self) -> memoryview:
+        """The contiguous free region after the readable bytes. It may be
+        shorter than writable_bytes() when the free space wraps."""
+        capacity = len(self.buf)
+        tail = self._head + self._size
+        if tail >= capacity:
+            return memoryview(self.buf)[tail - capacity : self._head]
+        return memoryview(self.buf)[tail:capacity]
+
+    def advance_writer(self, length: int):
+        """Mark ``length`` bytes written into writable_view() as readable."""
+        if length < 0 or length > self.writable_bytes():
+            raise IndexError("cannot advance writer by %d" % length)
+        self._size += length
+
+    def recv_into(self, sock, nbytes: int = 0) -> int:
+        """socket.recv_into straight into the free region; returns the count.
+
+        A full ring means the frame being assembled does not fit, so it is
+        grown first.
+        """
+        if self.writable_bytes() == 0:
+            self.ensure_writable(1)
+        received = sock.recv_into(self.writable_view(), nbytes)
+        self._size += received
+        return received
+
+    def _readable_pieces(self, offset: int, length: int):
+        """Up to two memoryviews covering ``length`` bytes at read offset."""
+        if length == 0:
+            return []
+        capacity = len(self.buf)
+        start = (self._head + offset) % capacity
+        end = start + length
+        view = memoryview(self.buf)
+        if end <= capacity:
+            return [view[start:end]]
+        return [view[start:capacity], view[: end - capacity]]
+
+    def _copy(self, offset: int, length: int) -> bytes:
+        return b"".join(self._readable_pieces(offset, length))
+
+    def _consume(self, length: int):
+        self.read_index += length
+        self._size -= length
+        if self._size == 0:
+            self._head = 0
+        else:
+            self._head = (self._head + length) % len(self.buf)
+
+    def _read(self, s: struct.Struct):
+        size = s.size
+        self.check_readable_bytes_len(size)
+        head = self._head
+        if head + size <= len(self.buf):
+            ret = s.unpack_from(self.buf, head)[0]
+        else:
+            ret = s.unpack(self._copy(0, size))[0]
+        self._consume(size)
+        return ret
+
+    def _peek(self, s: struct.Struct, offset: int):
+        if offset < 0 or self._size < offset + s.size:
+            raise Exception(
+                "readable bytes length must greater than or equal %d" % (offset + s.size)
+            )
+        start = (self._head + offset) % len(self.buf)
+        if start + s.size <= len(self.buf):
+            return s.unpack_from(self.buf, start)[0]
+        return s.unpack(self._copy(offset, s.size))[0]
+
+    def skip_bytes(self, length: int):
+        self.check_readable_bytes_len(length)
+        self._consume(length)
+
+    def to_bytes(self) -> bytes:
+        return self._copy(0, self._size)
+
+    def readable_view(self) -> memoryview:
+        """A view into the ring, or a copy when the unread bytes wrap."""
+        pieces = self._readable_pieces(0, self._size)
+        if len(pieces) == 1:
+            return pieces[0]
+        return memoryview(b"".join(pieces))
+
+    def write_i8(self, value: int):
+        self.write_bytes(_I8.pack(value))
+
+    def write_u8(self, value: int):
+        self.write_bytes(_U8.pack(value))
+
+    def write_bool(self, value: bool):
+        self.write_bytes(_BOOL.pack(value))
+
+    def write_i16(self, value: int):
+        self.write_bytes(_I16.pack(value))
+
+    def write_i16_le(self, value: int):
+        self.write_bytes(_I16_LE.pack(value))
+
+    def write_u16(self, value: int):
+        self.write_bytes(_U16.pack(value))
+
+    def write_u16_le(self, value: int):
+        self.write_bytes(_U16_LE.pack(value))
+
+    def write_i32(self, value: int):
+        self.write_bytes(_I32.pack(value))
+
+    def write_i32_le(self, value: int):
+        self.write_bytes(_I32_LE.pack(value))
+
+    def write_u32(self, value: int):
+        self.write_bytes(_U32.pack(value))
+
+    def write_u32_le(self, value: int):
+        self.write_bytes(_U32_LE.pack(value))
+
+    def write_i64(self, value: longlong):
+        self.write_bytes(_I64.pack(value))
+
+    def write_i64_le(self, value: longlong):
+        self.write_bytes(_I64_LE.pack(value))
+
+    def write_u64(self, value: longlong):
+        self.write_bytes(_U64.pack(value))
+
+    def write_u64_le(self, value: longlong):
+        self.write_bytes(_U64_LE.pack(value))
+
+    def write_f32(self, value: float):
+        self.write_bytes(_F32.pack(value))
+
+    def write_f32_le(self, value: float):
+        self.write_bytes(_F32_LE.pack(value))
+
+    def write_f64(self, value: float):
+        self.write_bytes(_F64.pack(value))
+
+    def write_f64_le(self, value: float):
+        self.write_bytes(_F64_LE.pack(value))
+
+    def write_bytes(self, value: bytes):
+        length = len(value)
+        if length == 0:
+            return
+        self.ensure_writable(length)
+        capacity = len(self.buf)
+        tail = (self._head + self._size) % capacity
+        first = min(length, capacity - tail)
+        self.buf[tail : tail + first] = value[:first]
+        if first < length:
+            self.buf[: length - first] = value[first:]
+        self._size += length
+
+    def read_i8(self):
+        return self._read(_I8)
+
+    def read_u8(self):
+        return self._read(_U8)
+
+    def read_bool(self):
+        return self._read(_BOOL)
+
+    def read_i16(self):
+        return self._read(_I16)
+
+    def read_i16_le(self):
+        return self._read(_I16_LE)
+
+    def read_u16(self):
+        return self._read(_U16)
+
+    def read_u16_le(self):
+        return self._read(_U16_LE)
+
+    def read_i32(self):
+        return self._read(_I32)
+
+    def read_i32_le(self):
+        return self._read(_I32_LE)
+
+    def read_u32(self):
+        return self._read(_U32)
+
+    def read_u32_le(self):
+        return self._read(_U32_LE)
+
+    def read_i64(self):
+        return self._read(_I64)
+
+    def read_i64_le(self):
+        return self._read(_I64_LE)
+
+    def read_u64(self):
+        return self._read(_U64)
+
+    def read_u64_le(self):
+        return self._read(_U64_LE)
+
+    def read_f32(self):
+        return self._read(_F32)
+
+    def read_f32_le(self):
+        return self._read(_F32_LE)
+
+    def read_f64(self):
+        return self._read(_F64)
+
+    def read_f64_le(self):
+        return self._read(_F64_LE)
+
+    def peek_i8(self, offset: int = 0):
+        return self._peek(_I8, offset)
+
+    def peek_u8(self, offset: int = 0):
+        return self._peek(_U8, offset)
+
+    def peek_bool(self, offset: int = 0):
+        return self._peek(_BOOL, offset)
+
+    def peek_i16(self, offset: int = 0):
+        return self._peek(_I16, offset)
+
+    def peek_i16_le(self, offset: int = 0):
+        return self._peek(_I16_LE, offset)
+
+    def peek_u16(self, offset: int = 0):
+        return self._peek(_U16, offset)
+
+    def peek_u16_le(self, offset: int = 0):
+        return self._peek(_U16_LE, offset)
+
+    def peek_i32(self, offset: int = 0):
+        return self._peek(_I32, offset)
+
+    def peek_i32_le(self, offset: int = 0):
+        return self._peek(_I32_LE, offset)
+
+    def peek_u32(self, offset: int = 0):
+        return self._peek(_U32, offset)
+
+    def peek_u32_le(self, offset: int = 0):
+        return self._peek(_U32_LE, offset)
+
+    def peek_i64(self, offset: int = 0):
+        return self._peek(_I64, offset)
+
+    def peek_i64_le(self, offset: int = 0):
+        return self._peek(_I64_LE, offset)
+
+    def peek_u64(self, offset: int = 0):
+        return self._peek(_U64, offset)
+
+    def peek_u64_le(self, offset: int = 0):
+        return self._peek(_U64_LE, offset)
+
+    def peek_f32(self, offset: int = 0):
+        return self._peek(_F32, offset)
+
+    def peek_f32_le(self, offset: int = 0):
+        return self._peek(_F32_LE, offset)
+
+    def peek_f64(self, offset: int = 0):
+        return self._peek(_F64, offset)
+
+    def peek_f64_le(self, offset: int = 0):
+        return self._peek(_F64_LE, offset)
+
+    def read_bytes(self, length: int) -> bytes:
+        self.check_readable_bytes_len(length)
+        ret = self._copy(0, length)
+        self._consume(length)
+        return ret
+
+    def peek_bytes(self, length: int, offset: int = 0) -> bytes:
+        if offset < 0 or self._size < offset + length:
+            raise Exception(
+                "readable bytes length must greater than or equal %d" % (offset + length)
+            )
+        return self._copy(offset, length)
+
+    def peek_views(self, length: int, offset: int = 0) -> list:
+        if offset < 0 or self._size < offset + length:
+            raise Exception(
+                "readable bytes length must greater than or equal %d" % (offset + length)
+            )
+        return self._readable_pieces(offset, length)
+
+    def read_slice(self, length: int) -> ByteBuf:
+        """The next ``length`` bytes as a ByteBuf; a view into the ring
+        unless they wrap, in which case only these bytes are copied."""
+        self.check_readable_bytes_len(length)
+        pieces = self._readable_pieces(0, length)
+        if len(pieces) == 1:
+            ret = ByteBuf(pieces[0], max_capacity=length)
+        else:
+            ret = ByteBuf(b"".join(pieces), max_capacity=length)
+        self._consume(length)
+        return ret
+
+    def read_verified_slice(self, length: int) -> ByteBuf:
+        if ByteBuf.debug_checks:
+            return self.read_slice(length)
+        self.check_readable_bytes_len(length)
+        pieces = self._readable_pieces(0, length)
+        data = pieces[0] if len(pieces) == 1 else b"".join(pieces)
+        self._consume(length)
+        return UncheckedByteBuf(data, max_capacity=length)
+
+
+class ByteBufPool:
+    """Recycles ByteBuf instances across frames, Netty allocator style.
+
+    Buffers are grouped into size classes by capacity. acquire() hands out
+    a cleared buffer of at least the requested capacity and release()
+    returns it to its class. Requests larger than the biggest class are
+    served unpooled, and released buffers are dropped once the pool retains
+    max_retained_bytes of storage. Not thread-safe; use one pool per session
+    or guard it externally.
+    """
+
+    DEFAULT_SIZE_CLASSES = (256, 1024, 4096, 16384, 65536)
+    DEFAULT_MAX_RETAINED_BYTES = 4 * 1024 * 1024
+
+    def __init__(
+        self,
+        size_classes=DEFAULT_SIZE_CLASSES,
+        max_retained_bytes: int = DEFAULT_MAX_RETAINED_BYTES,
+    ) -> None:
+        self.size_classes = tuple(sorted(size_classes))
+        self.max_retained_bytes = max_retained_bytes
+        self._free = {size: [] for size in self.size_classes}
+        self._pooled = set()
+        self._retained_bytes = 0
+
+    def retained_bytes(self) -> int:
+        return self._retained_bytes
+
+    def acquire(self, min_capacity: int = 0) -> ByteBuf:
+        for size in self.size_classes:
+            if size < min_capacity:
+                continue
+            free = self._free[size]
+            if free:
+                buf = free.pop()
+                self._pooled.discard(id(buf))
+                self._retained_bytes -= buf.capacity()
+                return buf
+            return ByteBuf(initial_capacity=size)
+        return ByteBuf(initial_capacity=min_capacity)
+
+    def release(self, buf: ByteBuf) -> bool:
+        """Return ``buf`` to the pool. Returns False if it was dropped instead.
+
+        The caller must not touch ``buf`` (or views of it) after releasing.
+        Buffers that may share their storage (wrapped storage, duplicate(),
+        slice()) are never pooled. Raises ValueError if ``buf`` is already in
+        the pool.
+        """
+        if id(buf) in self._pooled:
+            raise ValueError("buffer released twice")
+        if type(buf) is not ByteBuf or not buf._owns_storage:
+            return False
+        capacity = buf.capacity()
+        if self._retained_bytes + capacity > self.max_retained_bytes:
+            return False
+        size_class = None
+        for size in self.size_classes:
+            if size > capacity:
+                break
+            size_class = size
+        if size_class is None or capacity > 2 * self.size_classes[-1]:
+            return False
+        buf.clear()
+        self._free[size_class].append(buf)
+        self._pooled.add(id(buf))
+        self._retained_bytes += capacity
+        return True
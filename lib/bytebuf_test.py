@@ -1,6 +1,13 @@
-import os, sys
+import os, socket, struct, sys, tempfile
 
-from bytebuf import ByteBuf
+from bytebuf import (
+    ByteBuf,
+    ByteBufPool,
+    CompositeByteBuf,
+    MmapByteBuf,
+    RingByteBuf,
+    UncheckedByteBuf,
+)
 
 sys.path.append(os.getcwd())
 from unittest import TestCase
@@ -278,3 +285,698 @@ class TestByteBuf(TestCase):
         self.buf.write_bytes(b"hello")
         self.assertEqual(b"hel", self.buf.read_bytes(3))
         self.assertEqual(b"lo", self.buf.read_bytes(2))
+
+    def test_capacity_grows_by_doubling(self):
+        buf = ByteBuf(initial_capacity=4)
+        self.assertEqual(4, buf.capacity())
+        buf.write_u32(1)
+        self.assertEqual(4, buf.capacity())
+        buf.write_u8(2)
+        self.assertEqual(8, buf.capacity())
+        buf.write_bytes(b"x" * 20)
+        self.assertEqual(32, buf.capacity())
+        self.assertEqual(1, buf.read_u32())
+        self.assertEqual(2, buf.read_u8())
+        self.assertEqual(b"x" * 20, buf.read_bytes(20))
+
+    def test_write_bytes_of_any_length_and_type(self):
+        buf = ByteBuf(initial_capacity=4)
+        values = [b"ab", bytearray(b"cd"), memoryview(b"ef"), b"", b"g" * 300, b"ab"]
+        for value in values:
+            buf.write_bytes(value)
+        self.assertEqual(b"".join(bytes(v) for v in values), bytes(buf.to_bytes()))
+
+    def test_growth_leaves_wrapped_storage_alone(self):
+        storage = bytearray(b"ab")
+        buf = ByteBuf(storage)
+        buf.write_bytes(b"cd")
+        self.assertEqual(b"ab", storage)
+        self.assertEqual(b"abcd", buf.to_bytes())
+
+    def test_growth_keeps_exported_views_valid(self):
+        buf = ByteBuf(initial_capacity=4)
+        buf.write_u32(1)
+        view = buf.readable_view()
+        buf.write_bytes(b"x" * 8)
+        self.assertEqual(b"\x00\x00\x00\x01", view)
+        self.assertEqual(b"\x00\x00\x00\x01" + b"x" * 8, buf.to_bytes())
+
+    def test_to_bytes_excludes_spare_capacity(self):
+        self.buf.write_u16(0x0102)
+        self.assertEqual(b"\x01\x02", self.buf.to_bytes())
+        self.assertEqual(2, len(self.buf.to_bytes()))
+
+    def test_write_at_patches_written_region(self):
+        self.buf.write_u32(0)
+        self.buf.write_u8(9)
+        self.buf.write_u32_at(0, 7)
+        self.assertEqual(b"\x00\x00\x00\x07\x09", self.buf.to_bytes())
+
+    def test_write_at_rejects_unwritten_region(self):
+        self.buf.write_u16(0)
+        with pytest.raises(IndexError):
+            self.buf.write_u32_at(0, 7)
+        with pytest.raises(IndexError):
+            self.buf.write_u8_at(-1, 7)
+
+    def test_read_beyond_written_region_fails(self):
+        self.buf.write_u16(0)
+        with pytest.raises(Exception):
+            self.buf.read_i32()
+
+    def test_zero_copy_read_bytes_returns_view(self):
+        storage = bytearray(b"hello world")
+        buf = ByteBuf(storage, zero_copy=True)
+        view = buf.read_bytes(5)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(b"hello", view)
+        storage[0:1] = b"j"
+        self.assertEqual(b"jello", view)
+
+    def test_to_bytes_never_returns_a_view(self):
+        storage = bytearray(b"\x00\x01\x02\x03")
+        for buf in (
+            ByteBuf(memoryview(storage)),
+            ByteBuf(storage, zero_copy=True).slice(0, 4),
+        ):
+            ret = buf.to_bytes()
+            self.assertIsInstance(ret, (bytes, bytearray))
+            self.assertEqual(b"\x00\x01\x02\x03", ret)
+            storage[0] = 9
+            self.assertEqual(0, ret[0])
+            storage[0] = 0
+        buf = ByteBuf()
+        buf.write_u16(1)
+        self.assertIsInstance(buf.to_bytes(), bytearray)
+
+    def test_wrap_read_only_storage(self):
+        for storage in (b"\x00\x01\x02\x03", memoryview(b"\x00\x01\x02\x03")):
+            buf = ByteBuf(storage)
+            self.assertEqual(4, buf.readable_bytes_len())
+            self.assertEqual(0x00010203, buf.read_u32())
+
+    def test_wrap_memoryview_without_copy(self):
+        storage = bytearray(b"\x00\x00\x00\x01\xff")
+        buf = ByteBuf(memoryview(storage)[:4], zero_copy=True)
+        storage[3] = 2
+        self.assertEqual(2, buf.read_u32())
+        with pytest.raises(Exception):
+            buf.read_u8()
+
+    def test_write_after_wrapping_read_only_storage(self):
+        buf = ByteBuf(b"\x01")
+        buf.write_u8(2)
+        self.assertEqual(b"\x01\x02", buf.to_bytes())
+
+    def test_write_after_clearing_read_only_storage(self):
+        for storage in (b"abcd", memoryview(b"abcd")):
+            buf = ByteBuf(storage)
+            buf.clear()
+            buf.write_u8(1)
+            buf.write_bytes(b"z")
+            self.assertEqual(b"\x01z", buf.to_bytes())
+        self.assertEqual(b"abcd", storage)
+
+    def test_write_at_read_only_storage_copies(self):
+        storage = b"\x00\x00\x00\x01"
+        buf = ByteBuf(storage)
+        buf.write_u16_at(0, 0x0102)
+        self.assertEqual(b"\x01\x02\x00\x01", buf.to_bytes())
+        self.assertEqual(b"\x00\x00\x00\x01", storage)
+
+    def test_clear_keeps_writable_shared_storage(self):
+        storage = bytearray(b"abcd")
+        buf = ByteBuf(memoryview(storage))
+        buf.clear()
+        buf.write_u8(0x7A)
+        self.assertEqual(b"zbcd", storage)
+
+    def test_clear(self):
+        self.buf.write_u32(1)
+        self.buf.read_u16()
+        self.buf.clear()
+        self.assertEqual(0, self.buf.readable_bytes_len())
+        self.buf.write_u8(5)
+        self.assertEqual(5, self.buf.read_u8())
+
+    def test_discard_read_bytes(self):
+        self.buf.write_bytes(b"abcdef")
+        self.assertEqual(b"ab", self.buf.read_bytes(2))
+        capacity = self.buf.capacity()
+        self.buf.discard_read_bytes()
+        self.assertEqual(capacity, self.buf.capacity())
+        self.assertEqual(0, self.buf.read_index)
+        self.assertEqual(b"cdef", self.buf.to_bytes())
+        self.buf.write_bytes(b"g")
+        self.assertEqual(b"cdefg", self.buf.read_bytes(5))
+
+    def test_discard_read_bytes_read_only_storage(self):
+        buf = ByteBuf(b"abcdef")
+        buf.read_bytes(4)
+        buf.discard_read_bytes()
+        self.assertEqual(b"ef", buf.to_bytes())
+
+    def test_compact_shrinks_grown_storage(self):
+        buf = ByteBuf(initial_capacity=16)
+        buf.write_bytes(b"x" * 1000)
+        buf.read_bytes(996)
+        buf.compact()
+        self.assertEqual(16, buf.capacity())
+        self.assertEqual(b"xxxx", buf.read_bytes(4))
+
+    def test_slice_shares_storage(self):
+        self.buf.write_bytes(b"headbodytail")
+        body = self.buf.slice(4, 4)
+        self.assertEqual(4, body.readable_bytes_len())
+        self.assertEqual(0, self.buf.read_index)
+        body.write_u8_at(0, ord("B"))
+        self.assertEqual(b"headBodytail", self.buf.to_bytes())
+        self.assertEqual(b"Body", body.read_bytes(4))
+        with pytest.raises(Exception):
+            body.read_u8()
+
+    def test_slice_cannot_grow_or_exceed_parent(self):
+        self.buf.write_bytes(b"abcd")
+        view = self.buf.slice(1, 2)
+        with pytest.raises(IndexError):
+            view.write_u8(1)
+        with pytest.raises(IndexError):
+            self.buf.slice(2, 3)
+
+    def test_read_slice_consumes(self):
+        self.buf.write_u32(8)
+        self.buf.write_bytes(b"12345678")
+        self.buf.write_u32(99)
+        length = self.buf.read_u32()
+        body = self.buf.read_slice(length)
+        self.assertEqual(99, self.buf.read_u32())
+        self.assertEqual(0x31323334, body.read_u32())
+        self.assertEqual(4, body.readable_bytes_len())
+
+    def test_duplicate_has_independent_indices(self):
+        self.buf.write_u16(1)
+        self.buf.write_u16(2)
+        dup = self.buf.duplicate()
+        self.assertEqual(1, dup.read_u16())
+        self.assertEqual(1, self.buf.read_u16())
+        self.assertEqual(2, dup.read_u16())
+        self.assertEqual(2, self.buf.readable_bytes_len())
+
+    def test_array_matches_scalar_encoding(self):
+        cases = [
+            ("i8", [-128, 0, 127]),
+            ("u8", [0, 255]),
+            ("i16", [-32768, 1, 32767]),
+            ("i16_le", [-32768, 1, 32767]),
+            ("u16_le", [0, 65535]),
+            ("i32", [-(2**31), 2**31 - 1]),
+            ("u32", [0, 2**32 - 1]),
+            ("u32_le", [1, 2]),
+            ("i64_le", [-(2**63), 2**63 - 1]),
+            ("u64", [0, 2**64 - 1]),
+            ("f32_le", [1.5, -2.0]),
+            ("f64", [0.1, 1e300]),
+        ]
+        for name, values in cases:
+            bulk = ByteBuf()
+            getattr(bulk, "write_%s_array" % name)(values)
+            scalar = ByteBuf()
+            for value in values:
+                getattr(scalar, "write_%s" % name)(value)
+            self.assertEqual(scalar.to_bytes(), bulk.to_bytes(), name)
+            self.assertEqual(values, getattr(bulk, "read_%s_array" % name)(len(values)), name)
+
+    def test_array_empty(self):
+        self.buf.write_u16_array([])
+        self.assertEqual(0, self.buf.readable_bytes_len())
+        self.assertEqual([], self.buf.read_u16_array(0))
+
+    def test_array_write_failed(self):
+        with pytest.raises(Exception):
+            self.buf.write_u8_array([1, 256])
+        self.assertEqual(0, self.buf.write_index)
+
+    def test_array_read_failed(self):
+        self.buf.write_u16(1)
+        with pytest.raises(Exception):
+            self.buf.read_u16_array(2)
+
+    def test_mark_reset_reader_index(self):
+        self.buf.write_u16(1)
+        self.buf.write_u16(2)
+        self.buf.read_u16()
+        self.buf.mark_reader_index()
+        self.assertEqual(2, self.buf.read_u16())
+        self.buf.reset_reader_index()
+        self.assertEqual(2, self.buf.read_u16())
+
+    def test_mark_follows_discard_read_bytes(self):
+        self.buf.write_bytes(b"abcd")
+        self.buf.read_bytes(1)
+        self.buf.mark_reader_index()
+        self.buf.discard_read_bytes()
+        self.assertEqual(b"bc", self.buf.read_bytes(2))
+        self.buf.reset_reader_index()
+        self.assertEqual(b"bcd", self.buf.read_bytes(3))
+
+    def test_peek_does_not_consume(self):
+        self.buf.write_u32(0x01020304)
+        self.buf.write_u32_le(5)
+        self.buf.read_u8()
+        self.assertEqual(0x020304, self.buf.peek_u32() >> 8)
+        self.assertEqual(5, self.buf.peek_u32_le(3))
+        self.assertEqual(b"\x02\x03", self.buf.peek_bytes(2))
+        self.assertEqual(b"\x04", self.buf.peek_bytes(1, 2))
+        self.assertEqual(1, self.buf.read_index)
+        with pytest.raises(Exception):
+            self.buf.peek_u32_le(4)
+        with pytest.raises(Exception):
+            self.buf.peek_u8(-1)
+
+    def test_peek_frame_header(self):
+        from szse_binary import SzseBinary, Heartbeat
+
+        packet = SzseBinary()
+        packet.msg_type = 3
+        packet.body = Heartbeat()
+        packet.encode(self.buf)
+        partial = ByteBuf(self.buf.to_bytes()[:-1])
+        frame_len = 8 + partial.peek_u32(4) + 4
+        self.assertEqual(3, partial.peek_u32())
+        self.assertTrue(partial.readable_bytes_len() < frame_len)
+        self.assertEqual(0, partial.read_index)
+
+    def test_read_verified_slice(self):
+        self.buf.write_u32(6)
+        self.buf.write_u16(1)
+        self.buf.write_u32(2)
+        self.buf.write_u32(99)
+        body = self.buf.read_verified_slice(self.buf.read_u32())
+        self.assertIsInstance(body, UncheckedByteBuf)
+        self.assertEqual(1, body.read_u16())
+        self.assertEqual(2, body.read_u32())
+        with pytest.raises(struct.error):
+            body.read_u8()
+        self.assertEqual(6, body.read_index)
+        self.assertEqual(99, self.buf.read_u32())
+
+    def test_read_verified_slice_checks_length_once(self):
+        self.buf.write_u16(1)
+        with pytest.raises(Exception):
+            self.buf.read_verified_slice(3)
+        self.assertEqual(0, self.buf.read_index)
+
+    def test_read_verified_slice_debug_checks(self):
+        self.buf.write_u16(1)
+        ByteBuf.debug_checks = True
+        try:
+            body = self.buf.read_verified_slice(2)
+        finally:
+            ByteBuf.debug_checks = False
+        self.assertNotIsInstance(body, UncheckedByteBuf)
+        self.assertEqual(1, body.read_u16())
+
+    def test_write_read_struct(self):
+        header = struct.Struct(">IqH")
+        self.buf.write_u8(7)
+        self.buf.write_struct(header, 1, -2, 3)
+        self.buf.write_struct(header, 4, 5, 6)
+        self.assertEqual(b"\x07" + header.pack(1, -2, 3) + header.pack(4, 5, 6), self.buf.to_bytes())
+        self.assertEqual(7, self.buf.read_u8())
+        self.assertEqual((1, -2, 3), self.buf.read_struct(header))
+        self.assertEqual((4, 5, 6), self.buf.read_struct(header))
+        with pytest.raises(Exception):
+            self.buf.read_struct(header)
+
+    def test_write_struct_grows(self):
+        buf = ByteBuf(initial_capacity=4)
+        buf.write_struct(struct.Struct("<QQ"), 1, 2)
+        self.assertEqual(16, buf.write_index)
+        self.assertEqual((1, 2), buf.read_struct(struct.Struct("<QQ")))
+
+    def test_writable_view_and_advance_writer(self):
+        buf = ByteBuf(initial_capacity=8)
+        buf.write_u16(1)
+        self.assertEqual(6, buf.writable_bytes())
+        view = buf.writable_view()
+        view[:4] = struct.pack(">I", 2)
+        buf.advance_writer(4)
+        self.assertEqual(1, buf.read_u16())
+        self.assertEqual(2, buf.read_u32())
+        with pytest.raises(IndexError):
+            buf.advance_writer(3)
+        buf.ensure_writable(3)
+        self.assertEqual(16, buf.capacity())
+        self.assertEqual(10, len(buf.writable_view()))
+
+    def test_recv_into(self):
+        left, right = socket.socketpair()
+        try:
+            buf = ByteBuf(initial_capacity=4)
+            right.sendall(b"\x00\x00\x00\x05hello")
+            received = 0
+            while received < 9:
+                received += buf.recv_into(left, 9 - received)
+            self.assertEqual(5, buf.read_u32())
+            self.assertEqual(b"hello", buf.read_bytes(5))
+        finally:
+            left.close()
+            right.close()
+
+    def test_readable_view(self):
+        self.buf.write_bytes(b"abcdef")
+        self.buf.skip_bytes(2)
+        view = self.buf.readable_view()
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(b"cdef", view)
+        self.assertEqual(b"bcd", self.buf.view(1, 4))
+        self.assertEqual(b"", self.buf.view(6, 6))
+        with pytest.raises(IndexError):
+            self.buf.view(4, 7)
+        with pytest.raises(IndexError):
+            self.buf.view(4, 3)
+
+    def test_read_struct_verified_slice(self):
+        self.buf.write_struct(struct.Struct(">HI"), 1, 2)
+        body = self.buf.read_verified_slice(6)
+        self.assertEqual((1, 2), body.read_struct(struct.Struct(">HI")))
+        with pytest.raises(struct.error):
+            body.read_struct(struct.Struct(">B"))
+
+
+class TestByteBufPool(TestCase):
+    def test_acquire_uses_size_class(self):
+        pool = ByteBufPool(size_classes=(64, 256))
+        self.assertEqual(64, pool.acquire().capacity())
+        self.assertEqual(256, pool.acquire(100).capacity())
+        self.assertEqual(1000, pool.acquire(1000).capacity())
+
+    def test_release_recycles_cleared_buffer(self):
+        pool = ByteBufPool(size_classes=(64, 256))
+        buf = pool.acquire(10)
+        buf.write_u32(1)
+        self.assertTrue(pool.release(buf))
+        self.assertEqual(64, pool.retained_bytes())
+        again = pool.acquire(10)
+        self.assertIs(buf, again)
+        self.assertEqual(0, again.readable_bytes_len())
+        self.assertEqual(0, pool.retained_bytes())
+
+    def test_grown_buffer_goes_to_matching_class(self):
+        pool = ByteBufPool(size_classes=(64, 256))
+        buf = pool.acquire()
+        buf.write_bytes(b"x" * 200)
+        pool.release(buf)
+        self.assertIs(buf, pool.acquire(200))
+
+    def test_retained_bytes_bounded(self):
+        pool = ByteBufPool(size_classes=(64,), max_retained_bytes=128)
+        bufs = [pool.acquire() for _ in range(3)]
+        self.assertEqual([True, True, False], [pool.release(b) for b in bufs])
+        self.assertEqual(128, pool.retained_bytes())
+
+    def test_unpooled_buffers_are_dropped(self):
+        pool = ByteBufPool(size_classes=(64,))
+        self.assertFalse(pool.release(ByteBuf(b"abc")))
+        self.assertFalse(pool.release(ByteBuf(initial_capacity=1024)))
+
+    def test_double_release_rejected(self):
+        pool = ByteBufPool(size_classes=(64,))
+        buf = pool.acquire()
+        self.assertTrue(pool.release(buf))
+        with pytest.raises(ValueError):
+            pool.release(buf)
+        self.assertIs(buf, pool.acquire())
+        self.assertIsNot(buf, pool.acquire())
+        self.assertTrue(pool.release(buf))
+
+    def test_views_sharing_storage_are_not_pooled(self):
+        pool = ByteBufPool(size_classes=(64,))
+        buf = pool.acquire()
+        buf.write_u32(1)
+        self.assertFalse(pool.release(buf.duplicate()))
+        self.assertFalse(pool.release(buf.slice(0, 4)))
+        self.assertFalse(pool.release(ByteBuf(bytearray(64))))
+        self.assertEqual(0, pool.retained_bytes())
+
+
+class TestCompositeByteBuf(TestCase):
+    def test_reads_across_components(self):
+        first = ByteBuf()
+        first.write_u16(1)
+        first.write_u8(0x12)
+        composite = CompositeByteBuf([first, b"\x34\x56\x78", memoryview(b"abc")])
+        self.assertEqual(3, composite.num_components())
+        self.assertEqual(9, composite.readable_bytes_len())
+        self.assertEqual(1, composite.read_u16())
+        self.assertEqual(0x12345678, composite.read_u32())
+        self.assertEqual(b"abc", composite.read_bytes(3))
+        self.assertEqual(0, composite.readable_bytes_len())
+        with pytest.raises(Exception):
+            composite.read_u8()
+
+    def test_component_is_referenced_not_copied(self):
+        storage = bytearray(b"\x00\x01")
+        composite = CompositeByteBuf([storage])
+        storage[1] = 2
+        self.assertEqual(2, composite.read_u16())
+
+    def test_writes_append_tail_component(self):
+        composite = CompositeByteBuf()
+        composite.write_u32(7)
+        composite.add_component(b"body")
+        composite.write_u32_le(9)
+        composite.write_u8(1)
+        self.assertEqual(3, composite.num_components())
+        self.assertEqual(b"\x00\x00\x00\x07body\x09\x00\x00\x00\x01", composite.to_bytes())
+        self.assertEqual(7, composite.read_u32())
+        self.assertEqual(b"body", composite.read_bytes(4))
+        self.assertEqual(9, composite.read_u32_le())
+
+    def test_nio_buffers_cover_readable_region(self):
+        composite = CompositeByteBuf([b"abc", b"def"])
+        composite.skip_bytes(1)
+        self.assertEqual([b"bc", b"def"], [bytes(v) for v in composite.nio_buffers()])
+        composite.skip_bytes(3)
+        self.assertEqual([b"ef"], [bytes(v) for v in composite.nio_buffers()])
+
+    def test_discard_read_components(self):
+        composite = CompositeByteBuf([b"ab", b"cd"])
+        composite.read_bytes(3)
+        composite.discard_read_components()
+        self.assertEqual(1, composite.num_components())
+        self.assertEqual(b"d", composite.read_bytes(1))
+
+    def test_decode_frames_from_components(self):
+        from szse_binary import SzseBinary, Heartbeat
+
+        frames = []
+        for _ in range(3):
+            packet = SzseBinary()
+            packet.msg_type = 3
+            packet.body = Heartbeat()
+            frame = ByteBuf()
+            packet.encode(frame)
+            frames.append(frame)
+        composite = CompositeByteBuf(frames)
+        for _ in range(3):
+            decoded = SzseBinary()
+            decoded.decode(composite)
+            self.assertEqual(3, decoded.msg_type)
+        self.assertEqual(0, composite.readable_bytes_len())
+
+    def test_array_across_components(self):
+        first = ByteBuf()
+        first.write_u16_le_array([1, 2])
+        composite = CompositeByteBuf([first, b"\x03"])
+        composite.write_u8(0)
+        self.assertEqual([1, 2, 3], composite.read_u16_le_array(3))
+
+    def test_readable_view(self):
+        composite = CompositeByteBuf([b"abc", b"def"])
+        composite.skip_bytes(1)
+        self.assertEqual(b"bcdef", composite.readable_view())
+        composite.skip_bytes(2)
+        self.assertEqual(b"def", composite.readable_view())
+
+    def test_struct_across_components(self):
+        composite = CompositeByteBuf([b"\x00\x01\x00"])
+        composite.write_struct(struct.Struct(">BB"), 2, 3)
+        self.assertEqual((1, 2, 3), composite.read_struct(struct.Struct(">HHB")))
+
+
+class TestMmapByteBuf(TestCase):
+    def setUp(self):
+        from szse_binary import SzseBinary, Heartbeat
+
+        self.frame = ByteBuf()
+        for _ in range(3):
+            packet = SzseBinary()
+            packet.msg_type = 3
+            packet.body = Heartbeat()
+            packet.encode(self.frame)
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.frame.to_bytes())
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_sequential_decode(self):
+        from szse_binary import SzseBinary
+
+        with MmapByteBuf(self.path) as buf:
+            self.assertEqual(self.frame.readable_bytes_len(), buf.readable_bytes_len())
+            count = 0
+            while buf.readable_bytes_len() > 0:
+                decoded = SzseBinary()
+                decoded.decode(buf)
+                self.assertEqual(3, decoded.msg_type)
+                count += 1
+            self.assertEqual(3, count)
+        self.assertTrue(buf.closed)
+        self.assertEqual(0, buf.readable_bytes_len())
+
+    def test_to_bytes_copies_out_of_the_mapping(self):
+        with MmapByteBuf(self.path) as buf:
+            ret = buf.to_bytes()
+        self.assertIsInstance(ret, bytes)
+        self.assertEqual(bytes(self.frame.to_bytes()), ret)
+
+    def test_random_access(self):
+        buf = MmapByteBuf(self.path)
+        frame_len = buf.readable_bytes_len() // 3
+        buf.read_index = 2 * frame_len
+        self.assertEqual(3, buf.read_u32())
+        second = buf.slice(frame_len, frame_len)
+        self.assertEqual(3, second.read_u32())
+        del second
+        buf.close()
+
+    def test_close_with_live_view(self):
+        buf = MmapByteBuf(self.path)
+        frame_len = buf.readable_bytes_len() // 3
+        second = buf.slice(frame_len, frame_len)
+        with pytest.raises(BufferError):
+            buf.close()
+        self.assertFalse(buf.closed)
+        self.assertEqual(3 * frame_len, buf.readable_bytes_len())
+        self.assertEqual(3, buf.read_u32())
+        self.assertEqual(3, second.read_u32())
+        del second
+        buf.close()
+        self.assertTrue(buf.closed)
+        self.assertEqual(0, buf.readable_bytes_len())
+
+    def test_read_only(self):
+        with MmapByteBuf(self.path) as buf:
+            with pytest.raises(IndexError):
+                buf.write_u8(1)
+            with pytest.raises(TypeError):
+                buf.write_u8_at(0, 1)
+
+    def test_empty_file(self):
+        open(self.path, "wb").close()
+        with MmapByteBuf(self.path) as buf:
+            self.assertEqual(0, buf.readable_bytes_len())
+
+
+class TestRingByteBuf(TestCase):
+    def setUp(self):
+        self.ring = RingByteBuf(8)
+
+    def test_wraparound_reads(self):
+        self.ring.write_bytes(b"\x00" * 6)
+        self.ring.skip_bytes(6)
+        self.ring.write_u32(0x01020304)
+        self.ring.write_u16_le(7)
+        self.assertEqual(8, self.ring.capacity())
+        self.assertEqual(0x0304, self.ring.peek_u16(2))
+        self.assertEqual(0x01020304, self.ring.read_u32())
+        self.assertEqual(7, self.ring.read_u16_le())
+        self.assertEqual(0, self.ring.readable_bytes_len())
+
+    def test_writable_view_and_advance_writer(self):
+        self.ring.write_bytes(b"abcdef")
+        self.ring.skip_bytes(4)
+        view = self.ring.writable_view()
+        self.assertEqual(2, len(view))
+        view[:] = b"gh"
+        self.ring.advance_writer(2)
+        view = self.ring.writable_view()
+        self.assertEqual(4, len(view))
+        view[:1] = b"i"
+        self.ring.advance_writer(1)
+        self.assertEqual(b"efghi", self.ring.read_bytes(5))
+        with pytest.raises(IndexError):
+            self.ring.advance_writer(9)
+
+    def test_grows_only_when_full(self):
+        self.ring.write_bytes(b"abcdef")
+        self.ring.skip_bytes(5)
+        self.ring.write_bytes(b"ghijklm")
+        self.assertEqual(8, self.ring.capacity())
+        self.ring.write_bytes(b"nop")
+        self.assertEqual(16, self.ring.capacity())
+        self.assertEqual(b"fghijklmnop", self.ring.to_bytes())
+
+    def test_read_slice_straddling_wrap(self):
+        self.ring.write_bytes(b"abcdef")
+        self.ring.skip_bytes(6)
+        self.ring.write_bytes(b"1234")
+        body = self.ring.read_slice(4)
+        self.assertEqual(b"1234", body.read_bytes(4))
+        self.ring.write_bytes(b"56")
+        body = self.ring.read_verified_slice(2)
+        self.assertIsInstance(body, UncheckedByteBuf)
+        self.assertEqual(0x3536, body.read_u16())
+
+    def test_readable_view(self):
+        self.ring.write_bytes(b"abcdef")
+        self.ring.skip_bytes(2)
+        self.assertEqual(b"cdef", self.ring.readable_view())
+        self.ring.write_bytes(b"ghi")
+        self.assertEqual(b"cdefghi", self.ring.readable_view())
+
+    def test_recv_into(self):
+        left, right = socket.socketpair()
+        try:
+            right.sendall(b"0123456789")
+            received = 0
+            while received < 10:
+                received += self.ring.recv_into(left)
+            self.assertEqual(16, self.ring.capacity())
+            self.assertEqual(b"0123456789", self.ring.read_bytes(10))
+        finally:
+            left.close()
+            right.close()
+
+    def test_stream_frames(self):
+        from szse_binary import SzseBinary, Heartbeat, Logout
+
+        stream = ByteBuf()
+        for i in range(10):
+            packet = SzseBinary()
+            if i % 2:
+                packet.msg_type = 3
+                packet.body = Heartbeat()
+            else:
+                packet.msg_type = 2
+                packet.body = Logout()
+                packet.body.session_status = i
+                packet.body.text = "bye"
+            packet.encode(stream)
+        data = stream.to_bytes()
+        ring = RingByteBuf(256)
+        decoded = []
+        for start in range(0, len(data), 37):
+            ring.write_bytes(data[start : start + 37])
+            while ring.readable_bytes_len() >= 8:
+                frame_len = 8 + ring.peek_u32(4) + 4
+                if ring.readable_bytes_len() < frame_len:
+                    break
+                packet = SzseBinary()
+                packet.decode(ring)
+                decoded.append(packet.msg_type)
+        self.assertEqual([2, 3] * 5, decoded)
+        self.assertEqual(256, ring.capacity())
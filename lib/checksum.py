@@ -2,73 +2,330 @@ from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 import zlib
 
+import numpy
+
 from bytebuf import ByteBuf
 
 
 InputType = TypeVar("InputType")
 OutputType = TypeVar("OutputType")
 
+# Above this many bytes the additive checksums sum with numpy; below it the
+# frombuffer call costs more than the builtin sum() over a memoryview.
+NUMPY_SUM_THRESHOLD = 4096
+
+
+def _byte_sum(data) -> int:
+    if len(data) >= NUMPY_SUM_THRESHOLD:
+        return int(numpy.frombuffer(data, dtype=numpy.uint8).sum(dtype=numpy.uint64))
+    return sum(data)
+
+
+def _byte_sums(data, ranges) -> list:
+    """Byte sums of many ``(start, end)`` ranges of ``data`` from one
+    numpy.add.reduceat over the range bounds, so the only temporaries are
+    per range, not per byte."""
+    if not ranges:
+        return []
+    values = numpy.frombuffer(data, dtype=numpy.uint8)
+    bounds = numpy.array(ranges, dtype=numpy.intp).reshape(-1, 2)
+    sums = numpy.zeros(len(bounds), dtype=numpy.uint64)
+    # reduceat sums values[i[k]:i[k + 1]], so interleaved bounds put each
+    # range at an even index. It sums a single element for an empty range,
+    # and an end of len(values) is not a valid index, so those are left out.
+    nonempty = bounds[:, 0] < bounds[:, 1]
+    inner = nonempty & (bounds[:, 1] < len(values))
+    if inner.any():
+        sums[inner] = numpy.add.reduceat(values, bounds[inner].ravel(), dtype=numpy.uint64)[::2]
+    for index in numpy.flatnonzero(nonempty & ~inner):
+        sums[index] = values[bounds[index, 0] :].sum(dtype=numpy.uint64)
+    return sums.tolist()
+
+
+def _joined(pieces):
+    return pieces[0] if len(pieces) == 1 else b"".join(pieces)
+
+
+def _crc16_table():
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _crc16_table()
+
+
+def _crc16_update(crc: int, data) -> int:
+    table = _CRC16_TABLE
+    for b in data:
+        crc = (crc >> 8) ^ table[(crc ^ b) & 0xFF]
+    return crc
+
+
+class ChecksumState(ABC):
+    """A running checksum fed one fragment at a time; from ChecksumService.new()."""
+
+    @abstractmethod
+    def update(self, data):
+        """Add a bytes-like fragment."""
+        pass
+
+    @abstractmethod
+    def digest(self):
+        """The checksum of everything passed to update() so far."""
+        pass
+
+
+class Crc16ChecksumState(ChecksumState):
+    def __init__(self):
+        self.crc = 0xFFFF
+
+    def update(self, data):
+        self.crc = _crc16_update(self.crc, data)
+
+    def digest(self):
+        return self.crc
+
+
+class Crc32ChecksumState(ChecksumState):
+    def __init__(self):
+        self.crc = 0
+
+    def update(self, data):
+        self.crc = zlib.crc32(data, self.crc)
+
+    def digest(self):
+        return self.crc & 0xFFFFFFFF
+
+
+class ByteSumChecksumState(ChecksumState):
+    """Sum of all bytes modulo 256, as used by SSE_BIN and SZSE_BIN."""
+
+    def __init__(self):
+        self.checksum = 0
+
+    def update(self, data):
+        self.checksum = (self.checksum + _byte_sum(data)) & 0xFF
+
+    def digest(self):
+        return self.checksum
+
+
 class ChecksumService(ABC, Generic[InputType, OutputType]):
     @abstractmethod
     def algorithm(self) -> str:
         pass
 
     @abstractmethod
-    def calc(self, data: InputType) -> OutputType:
+    def calc_bytes(self, data) -> OutputType:
+        """Checksum of a bytes-like object; memoryviews are not copied."""
         pass
-    
+
+    @abstractmethod
+    def new(self) -> ChecksumState:
+        """A fresh incremental state; feeding it a frame in any number of
+        fragments digests to the same value as calc_bytes() of the whole."""
+        pass
+
+    def calc(self, data: InputType) -> OutputType:
+        """Checksum of the unread bytes of ``data``."""
+        return self.calc_bytes(data.readable_view())
+
+    def calc_range(self, data: InputType, start: int, end: int) -> OutputType:
+        """Checksum of the written bytes ``[start, end)`` of ``data``, e.g. one
+        frame of a buffer holding several."""
+        return self.calc_bytes(data.view(start, end))
+
+    def calc_many(self, data, ranges) -> list:
+        """Checksums of several ``(start, end)`` ranges of a bytes-like object."""
+        view = memoryview(data)
+        return [self.calc_bytes(view[start:end]) for start, end in ranges]
 
     
 class Crc16ChecksumService(ChecksumService):
     def algorithm(self):
         return "CRC16"
 
-    def calc(self, data:ByteBuf):
-        crc = 0xFFFF
-        for b in data.to_bytes():
-            crc ^= b
-            for _ in range(8):
-                if crc & 1:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
-        return crc & 0xFFFF
+    def calc_bytes(self, data):
+        return _crc16_update(0xFFFF, data)
+
+    def new(self):
+        return Crc16ChecksumState()
 
     
 class Crc32ChecksumService(ChecksumService):
     def algorithm(self):
          return "CRC32"
 
-    def calc(self, data:ByteBuf):
-        val = zlib.crc32(data.to_bytes()) & 0xFFFFFFFF
+    def calc_bytes(self, data):
+        val = zlib.crc32(data) & 0xFFFFFFFF
         return val
 
+    def new(self):
+        return Crc32ChecksumState()
+
 class SsebinChecksumService(ChecksumService):
     def algorithm(self):
          return "SSE_BIN"
 
-    def calc(self, data:ByteBuf):
-        checksum = 0
-        for b in data.to_bytes():
-            checksum = (checksum + b) & 0xFF
-        return checksum
+    def calc_bytes(self, data):
+        return _byte_sum(data) & 0xFF
+
+    def new(self):
+        return ByteSumChecksumState()
+
+    def calc_many(self, data, ranges):
+        return [s & 0xFF for s in _byte_sums(data, ranges)]
 
 class SzsebinChecksumService(ChecksumService):
     def algorithm(self):
         return "SZSE_BIN"
 
-    def calc(self, data:ByteBuf):
-        checksum = 0
-        for b in data.to_bytes():
-            checksum += b
-        return checksum % 256
+    def calc_bytes(self, data):
+        return _byte_sum(data) % 256
+
+    def new(self):
+        return ByteSumChecksumState()
+
+    def calc_many(self, data, ranges):
+        return [s % 256 for s in _byte_sums(data, ranges)]
     
+class BjsebinChecksumService(SzsebinChecksumService):
+    """BJSE binary trailers use the same byte sum modulo 256 as SZSE."""
+
+    def algorithm(self):
+        return "BJSE_BIN"
+
+
+_services = {}
+
+
+def register_checksum_service(service: ChecksumService) -> ChecksumService:
+    """Register ``service`` under its algorithm() name, replacing any earlier
+    one. Codecs bind services when their module is imported, so register
+    custom algorithms before importing the codecs that use them."""
+    _services[service.algorithm()] = service
+    return service
+
+
 def create_checksum_service(algorithm: str) -> ChecksumService:
-    """Factory method to create checksum services by name."""
-    mapping = {
-        "CRC16": Crc16ChecksumService(),
-        "CRC32": Crc32ChecksumService(),
-        "SSE_BIN": SsebinChecksumService(),
-        "SZSE_BIN": SzsebinChecksumService()
-    }
-    return mapping[algorithm]
\ No newline at end of file
+    """The shared service for ``algorithm``; services are stateless, so one
+    instance per algorithm is reused. Raises KeyError for unknown names."""
+    return _services[algorithm]
+
+
+register_checksum_service(Crc16ChecksumService())
+register_checksum_service(Crc32ChecksumService())
+register_checksum_service(SsebinChecksumService())
+register_checksum_service(SzsebinChecksumService())
+register_checksum_service(BjsebinChecksumService())
+
+
+class ChecksumError(Exception):
+    """A decoded frame's trailer checksum does not match its bytes."""
+
+    def __init__(self, algorithm: str, expected, actual):
+        super().__init__(
+            "%s checksum mismatch: trailer %s, computed %s" % (algorithm, expected, actual)
+        )
+        self.algorithm = algorithm
+        self.expected = expected
+        self.actual = actual
+
+
+class ChecksumPolicy:
+    """What decoding does with a frame whose checksum does not match."""
+
+    IGNORE = "ignore"  # skip verification, checksum_valid stays None
+    FLAG = "flag"  # set checksum_valid on the decoded frame
+    COUNT = "count"  # flag, and count mismatches in ChecksumVerifier.failures
+    RAISE = "raise"  # raise ChecksumError
+
+
+class ChecksumVerifier:
+    """Checks decoded trailers against a service under a ChecksumPolicy.
+
+    Framing codecs hold one as the ``checksum_verifier`` class attribute;
+    change its policy (or replace it) to configure every decode.
+    """
+
+    def __init__(self, service: ChecksumService, policy: str = ChecksumPolicy.FLAG):
+        self.service = service
+        self.policy = policy
+        self.failures = 0
+
+    def check(self, expected, actual) -> bool:
+        if expected == actual:
+            return True
+        if self.policy == ChecksumPolicy.RAISE:
+            raise ChecksumError(self.service.algorithm(), expected, actual)
+        if self.policy == ChecksumPolicy.COUNT:
+            self.failures += 1
+        return False
+
+    def verify(self, buffer, start: int, end: int, expected):
+        """Verify the written range ``[start, end)`` of ``buffer``. Returns None
+        when the policy is IGNORE. Composite and ring buffers do not keep
+        consumed bytes addressable, so they raise TypeError; verify their
+        frames with verify_next() before decoding them."""
+        if self.policy == ChecksumPolicy.IGNORE:
+            return None
+        if not isinstance(buffer, ByteBuf):
+            raise TypeError(
+                "%s cannot verify consumed bytes, use verify_next()" % type(buffer).__name__
+            )
+        return self.check(expected, self.service.calc_range(buffer, start, end))
+
+    def verify_next(self, buffer, layout):
+        """Verify the frame at the read index of any Buf before it is
+        decoded, so RAISE leaves a bad frame unread. The frame is checksummed
+        from peek_views(), fragment by fragment where the storage splits it.
+
+        Returns None when the policy is IGNORE or the frame is incomplete,
+        in which case decoding it fails on its own.
+        """
+        if self.policy == ChecksumPolicy.IGNORE:
+            return None
+        if isinstance(buffer, ByteBuf):
+            # One view and unpack_from: this runs once per decoded frame.
+            data = buffer.readable_view()
+            if len(data) < layout.header_len:
+                return None
+            end = layout.header_len + layout.length.unpack_from(data, layout.length_offset)[0]
+            if len(data) < end + layout.trailer.size:
+                return None
+            return self.check(
+                layout.trailer.unpack_from(data, end)[0], self.service.calc_bytes(data[:end])
+            )
+        readable = buffer.readable_bytes_len()
+        if readable < layout.header_len:
+            return None
+        length = layout.length.unpack(
+            _joined(buffer.peek_views(layout.length.size, layout.length_offset))
+        )[0]
+        end = layout.header_len + length
+        if readable < end + layout.trailer.size:
+            return None
+        expected = layout.trailer.unpack(_joined(buffer.peek_views(layout.trailer.size, end)))[0]
+        pieces = buffer.peek_views(end)
+        if len(pieces) == 1:
+            return self.check(expected, self.service.calc_bytes(pieces[0]))
+        state = self.service.new()
+        for piece in pieces:
+            state.update(piece)
+        return self.check(expected, state.digest())
+
+    def verify_batch(self, data, frames) -> list:
+        """Verify many ``(start, end, expected)`` frames of ``data`` in one
+        pass; additive checksums are computed together with numpy."""
+        if self.policy == ChecksumPolicy.IGNORE:
+            return [None] * len(frames)
+        actual = self.service.calc_many(data, [(start, end) for start, end, _ in frames])
+        return [self.check(frame[2], value) for frame, value in zip(frames, actual)]
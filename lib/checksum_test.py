@@ -30,3 +30,143 @@ def test_ssebin_calculation(sample_data):
 def test_szsebin_calculation(sample_data):
     service = create_checksum_service("SZSE_BIN")
     assert service.calc(sample_data) == sum(b"123456789") % 256
+
+
+def test_calc_skips_consumed_bytes():
+    buf = ByteBuf()
+    buf.write_bytes(b"xx123456789")
+    buf.skip_bytes(2)
+    assert create_checksum_service("CRC32").calc(buf) == 0xCBF43926
+    assert create_checksum_service("SZSE_BIN").calc(buf) == sum(b"123456789") % 256
+
+
+def test_calc_range():
+    buf = ByteBuf()
+    buf.write_bytes(b"xx123456789yy")
+    buf.skip_bytes(5)
+    assert create_checksum_service("CRC32").calc_range(buf, 2, 11) == 0xCBF43926
+    assert create_checksum_service("CRC16").calc_range(buf, 2, 11) == 0x4B37
+    with pytest.raises(IndexError):
+        create_checksum_service("CRC32").calc_range(buf, 2, 14)
+
+
+@pytest.mark.parametrize("size", [0, 1, 64, 4095, 4096, 100000])
+def test_fast_checksums_match_per_byte_loops(size):
+    from benchmark import legacy_byte_sum, legacy_crc16
+
+    data = memoryview(bytearray((i * 37 + 11) & 0xFF for i in range(size)))
+    assert create_checksum_service("CRC16").calc_bytes(data) == legacy_crc16(data)
+    assert create_checksum_service("SSE_BIN").calc_bytes(data) == legacy_byte_sum(data)
+    assert create_checksum_service("SZSE_BIN").calc_bytes(data) == legacy_byte_sum(data)
+
+
+@pytest.mark.parametrize("algorithm", ["CRC16", "CRC32", "SSE_BIN", "SZSE_BIN"])
+def test_incremental_matches_calc(algorithm):
+    service = create_checksum_service(algorithm)
+    data = bytes((i * 131 + 7) & 0xFF for i in range(10000))
+    state = service.new()
+    assert state.digest() == service.calc_bytes(b"")
+    for start in range(0, len(data), 777):
+        state.update(memoryview(data)[start : start + 777])
+    assert state.digest() == service.calc_bytes(data)
+    state.update(b"")
+    assert state.digest() == service.calc_bytes(data)
+
+
+def test_incremental_over_composite_components():
+    from bytebuf import CompositeByteBuf
+
+    composite = CompositeByteBuf([b"1234", b"56"])
+    composite.write_bytes(b"789")
+    state = create_checksum_service("CRC32").new()
+    for view in composite.nio_buffers():
+        state.update(view)
+    assert state.digest() == 0xCBF43926
+
+
+@pytest.mark.parametrize("algorithm", ["CRC16", "CRC32", "SSE_BIN", "SZSE_BIN"])
+def test_calc_many(algorithm):
+    service = create_checksum_service(algorithm)
+    data = bytes(range(256)) * 40
+    ranges = [(0, 0), (0, 9), (9, 5000), (5000, len(data))]
+    assert service.calc_many(data, ranges) == [service.calc_bytes(data[s:e]) for s, e in ranges]
+    ranges = [(100, 200), (0, len(data)), (len(data), len(data)), (150, 160), (7, 8)]
+    assert service.calc_many(data, ranges) == [service.calc_bytes(data[s:e]) for s, e in ranges]
+    assert service.calc_many(b"", [(0, 0)]) == [service.calc_bytes(b"")]
+
+
+def test_verifier_policies():
+    from checksum import ChecksumError, ChecksumPolicy, ChecksumVerifier
+
+    data = b"123456789"
+    verifier = ChecksumVerifier(create_checksum_service("CRC32"))
+    frames = [(0, 9, 0xCBF43926), (0, 9, 0)]
+    assert verifier.verify_batch(data, frames) == [True, False]
+    verifier.policy = ChecksumPolicy.COUNT
+    assert verifier.verify_batch(data, frames) == [True, False]
+    assert verifier.failures == 1
+    verifier.policy = ChecksumPolicy.IGNORE
+    assert verifier.verify_batch(data, frames) == [None, None]
+    verifier.policy = ChecksumPolicy.RAISE
+    with pytest.raises(ChecksumError):
+        verifier.verify_batch(data, frames)
+
+
+def test_verify_next_peeks_split_frames():
+    from bytebuf import ByteBuf, CompositeByteBuf, RingByteBuf
+    from checksum import ChecksumPolicy, ChecksumVerifier
+    from codec import FrameLayout
+
+    layout = FrameLayout(0, ">H", 2, ">I")
+    frame = b"\x00\x09123456789" + (0xBA6FB7AE).to_bytes(4, "big")
+    verifier = ChecksumVerifier(create_checksum_service("CRC32"))
+    ring = RingByteBuf(16)
+    ring.write_bytes(bytes(10))
+    ring.skip_bytes(10)
+    ring.write_bytes(frame)
+    composite = CompositeByteBuf([frame[:1], frame[1:6], frame[6:13], frame[13:]])
+    for buf in (ByteBuf(frame), ring, composite):
+        assert verifier.verify_next(buf, layout) is True
+        assert buf.readable_bytes_len() == len(frame)
+    assert verifier.verify_next(ByteBuf(frame[:-1]), layout) is None
+    assert verifier.verify_next(ByteBuf(frame[:-1] + b"\x00"), layout) is False
+    with pytest.raises(TypeError):
+        verifier.verify(composite, 0, 11, 0)
+    verifier.policy = ChecksumPolicy.IGNORE
+    assert verifier.verify(composite, 0, 11, 0) is None
+    assert verifier.verify_next(composite, layout) is None
+
+
+def test_registry_returns_cached_services():
+    from checksum import ChecksumService, _services, register_checksum_service
+
+    assert create_checksum_service("CRC32") is create_checksum_service("CRC32")
+    with pytest.raises(KeyError):
+        create_checksum_service("XOR8")
+
+    class Xor8ChecksumService(ChecksumService):
+        def algorithm(self):
+            return "XOR8"
+
+        def calc_bytes(self, data):
+            checksum = 0
+            for b in data:
+                checksum ^= b
+            return checksum
+
+        def new(self):
+            raise NotImplementedError
+
+    service = register_checksum_service(Xor8ChecksumService())
+    try:
+        assert create_checksum_service("XOR8") is service
+        assert service.calc_bytes(b"\x01\x03") == 2
+    finally:
+        _services.pop("XOR8")
+
+
+def test_framing_codecs_bind_registered_service():
+    from sse_binary import SseBinary
+
+    assert SseBinary.checksum_service is create_checksum_service("SSE_BIN")
+    assert SseBinary.checksum_verifier.service is SseBinary.checksum_service
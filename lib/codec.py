@@ -1,17 +1,159 @@
 from abc import ABC, abstractmethod
+import struct
 
+import bytebuf
 from bytebuf import ByteBuf
 
 
 class BinaryCodec(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def encode(self, buffer: ByteBuf) -> None:
         pass
 
     @abstractmethod
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
+        """Decode into this instance. With ``reuse_body``, nested messages
+        left by the previous decode are decoded into again where their
+        type is unchanged, instead of being created anew."""
         pass
 
+# ByteBuf primitive structs by wire type: "u32", "i64_le", "bool", ...
+PRIMITIVES = {
+    name[1:].lower(): value
+    for name, value in vars(bytebuf).items()
+    if name.startswith("_") and isinstance(value, struct.Struct)
+}
+
+
+class FieldDescriptor:
+    """One field of a message, in wire order.
+
+    Generated classes list theirs in a ``_fields`` class attribute, which
+    schema.py builds MessageSchemas from. ``wire_type`` is a ByteBuf
+    primitive name (``u32``, ``i64_le``, ``bool``, ...), ``fixed_string``,
+    ``string``, ``list`` or ``message``. ``size`` is the wire size in bytes,
+    or None when it varies; ``offset`` is the byte offset from the start of
+    the message, or None when an earlier field varies in size (it is set by
+    MessageSchema). ``optional`` fields are only encoded under a condition.
+    ``message_class`` and ``factory`` may be given as names in the defining
+    module, for classes and factories defined further down.
+    """
+
+    def __init__(
+        self,
+        name,
+        wire_type: str,
+        size=None,
+        byte_order=None,
+        encoding=None,
+        pad_char=None,
+        pad_left=None,
+        length_type=None,
+        element=None,
+        message_class=None,
+        factory=None,
+        factory_key=None,
+        optional=False,
+    ):
+        primitive = PRIMITIVES.get(wire_type)
+        if primitive is not None:
+            size = primitive.size if size is None else size
+            if byte_order is None and primitive.format[0] in "<>":
+                byte_order = primitive.format[0]
+        elif wire_type == "fixed_string":
+            encoding = encoding or "utf-8"
+            pad_char = " " if pad_char is None else pad_char
+            pad_left = bool(pad_left)
+        elif wire_type == "string":
+            encoding = encoding or "utf-8"
+            byte_order = byte_order or ">"
+        self.name = name
+        self.wire_type = wire_type
+        self.size = size
+        self.offset = None
+        self.byte_order = byte_order
+        self.encoding = encoding
+        self.pad_char = pad_char
+        self.pad_left = pad_left
+        self.length_type = length_type
+        self.element = element
+        self.message_class = message_class
+        self.factory = factory
+        self.factory_key = factory_key
+        self.optional = optional
+
+    @property
+    def struct_format(self):
+        """The struct code of a fixed primitive or fixed string, else None."""
+        if self.wire_type == "fixed_string":
+            return "%ds" % self.size
+        s = PRIMITIVES.get(self.wire_type)
+        if s is None:
+            return None
+        return s.format.lstrip("<>!=@")
+
+    def __repr__(self):
+        return "FieldDescriptor(%r, %r, size=%r, offset=%r)" % (
+            self.name,
+            self.wire_type,
+            self.size,
+            self.offset,
+        )
+
+
+class FrameLayout:
+    """Where a framing codec keeps its body length and trailer checksum, so
+    complete frames can be located without decoding them."""
+
+    def __init__(self, length_offset: int, length_format: str, header_len: int, trailer_format: str):
+        self.length_offset = length_offset
+        self.length = struct.Struct(length_format)
+        self.header_len = header_len
+        self.trailer = struct.Struct(trailer_format)
+
+    def scan(self, data, limit: int = None) -> list:
+        """``(start, end, checksum)`` of each complete frame at the front of
+        ``data``, at most ``limit`` of them, where ``[start, end)`` is the
+        checksummed header and body."""
+        frames = []
+        pos = 0
+        size = len(data)
+        while pos + self.header_len <= size and len(frames) != limit:
+            end = pos + self.header_len + self.length.unpack_from(data, pos + self.length_offset)[0]
+            if end + self.trailer.size > size:
+                break
+            frames.append((pos, end, self.trailer.unpack_from(data, end)[0]))
+            pos = end + self.trailer.size
+        return frames
+
+
+# Frames decoded per decode_frames() call by default, so one call on a large
+# backlog does not hold every decoded packet at once.
+DECODE_BATCH_FRAMES = 4096
+
+
+def decode_frames(codec_cls, buffer: ByteBuf, max_frames: int = DECODE_BATCH_FRAMES) -> list:
+    """Decode up to ``max_frames`` complete frames readable in ``buffer``;
+    call again while it returns a full batch. None decodes them all.
+
+    The batch's checksums are verified together, under the class's
+    checksum_verifier policy, before any body is decoded. A trailing partial
+    frame, and frames past the batch, are left unread.
+    """
+    view = buffer.readable_view()
+    frames = codec_cls.frame_layout.scan(view, max_frames)
+    flags = codec_cls.checksum_verifier.verify_batch(view, frames)
+    del view
+    packets = []
+    for checksum_valid in flags:
+        packet = codec_cls()
+        packet._decode_frame(buffer)
+        packet.checksum_valid = checksum_valid
+        packets.append(packet)
+    return packets
+
 def write_len(buffer: ByteBuf, length: int, len_type: str) -> None:
     
     if len_type == 'u8':
@@ -117,17 +259,36 @@ def read_len_le(buffer: ByteBuf, len_type: str) -> int:
 def read_string(buffer: ByteBuf, len_type: str, encoding = 'utf-8') -> str:
     
     len = read_len(buffer, len_type)
-    return buffer.read_bytes(len).decode(encoding)
+    return str(buffer.read_bytes(len), encoding)
     
 def read_string_le(buffer: ByteBuf, len_type: str, encoding = 'utf-8', trim_pad_char:str = ' ', pad_left:bool = False) -> str:
     
     len = read_len_le(buffer, len_type)
     if pad_left:
-        return buffer.read_bytes(len).decode(encoding).rstrip(trim_pad_char)
+        return str(buffer.read_bytes(len), encoding).rstrip(trim_pad_char)
     else:
-        return buffer.read_bytes(len).decode(encoding).lstrip(trim_pad_char)
+        return str(buffer.read_bytes(len), encoding).lstrip(trim_pad_char)
     
     
+def pad_fixed_string(string: str, fixed_length: int, encoding: str = 'utf-8', pad_char: str = ' ', pad_left: bool = False) -> bytes:
+    """Encode ``string`` to exactly ``fixed_length`` bytes, truncating or padding
+    the way write_fixed_string does."""
+    encoded = string.encode(encoding)
+    if len(encoded) > fixed_length:
+        return encoded[:fixed_length]
+    if pad_left:
+        return encoded.rjust(fixed_length, pad_char.encode(encoding))
+    return encoded.ljust(fixed_length, pad_char.encode(encoding))
+
+
+def strip_fixed_string(raw_bytes, encoding: str = 'utf-8', trim_pad_char: str = ' ', pad_left: bool = False) -> str:
+    """Decode fixed-length ``raw_bytes`` the way read_fixed_string does."""
+    if pad_left:
+        return str(raw_bytes, encoding).rstrip(trim_pad_char)
+    else:
+        return str(raw_bytes, encoding).lstrip(trim_pad_char)
+
+
 def write_fixed_string(buffer: ByteBuf, string: str, fixed_length: int, encoding: str = 'utf-8', pad_char: str = ' ', pad_left: bool = False) -> None:
     """Write a fixed-length string to the buffer.
     
@@ -141,18 +302,14 @@ def write_fixed_string(buffer: ByteBuf, string: str, fixed_length: int, encoding
     Raises:
         ValueError: If the string cannot fit in the fixed length when encoded
     """
+    # pad_fixed_string() inlined: this runs once per fixed string field
     encoded = string.encode(encoding)
     if len(encoded) > fixed_length:
-        encoded = encoded[:fixed_length]
-        buffer.write_bytes(encoded)
-        return
-    
-    # Pad with null bytes if needed
-    if pad_left:
-        padded = encoded.rjust(fixed_length, pad_char.encode(encoding))
+        buffer.write_bytes(encoded[:fixed_length])
+    elif pad_left:
+        buffer.write_bytes(encoded.rjust(fixed_length, pad_char.encode(encoding)))
     else:
-        padded = encoded.ljust(fixed_length, pad_char.encode(encoding))
-    buffer.write_bytes(padded)
+        buffer.write_bytes(encoded.ljust(fixed_length, pad_char.encode(encoding)))
     
 def read_fixed_string(buffer: ByteBuf, fixed_length: int, encoding: str = 'utf-8', trim_pad_char: str = ' ', pad_left: bool = False) -> str:
     """Read a fixed-length string from the buffer.
@@ -164,8 +321,7 @@ def read_fixed_string(buffer: ByteBuf, fixed_length: int, encoding: str = 'utf-8
         trim_pad_char: The byte used for trimming pad_char (default: null byte)
         pad_left: Whether to trim pad_char from the left (default: False)
     """
-    raw_bytes = buffer.read_bytes(fixed_length)
+    # strip_fixed_string() inlined: this runs once per fixed string field
     if pad_left:
-        return raw_bytes.decode(encoding).rstrip(trim_pad_char)
-    else:
-        return raw_bytes.decode(encoding).lstrip(trim_pad_char)
\ No newline at end of file
+        return str(buffer.read_bytes(fixed_length), encoding).rstrip(trim_pad_char)
+    return str(buffer.read_bytes(fixed_length), encoding).lstrip(trim_pad_char)
@@ -0,0 +1,214 @@
+"""Codec plans for generated message classes.
+
+Generated encode/decode bodies touch one field per statement. A plan
+replaces them with methods built from the class's field descriptors (see
+schema.py) in which every run of adjacent fixed-width fields (primitives
+and fixed strings) is a single precompiled ``struct.Struct`` packed with
+write_struct() or unpacked with read_struct(). Nested messages from a
+factory, such as appl_extend, are encoded and decoded as the generated
+code does, so the bytes on the wire are identical.
+
+Only classes made of those fields get a plan: framing codecs (whose
+length and checksum fields are written after the body) and messages
+with lists, variable-length strings or conditional fields keep their
+generated methods. Plans are opt-in::
+
+    import codec_plan, szse_binary
+    codec_plan.install_plans(szse_binary)
+"""
+import struct
+from operator import attrgetter
+
+from codec import BinaryCodec
+from schema import is_framing, schema_of
+
+PLANNED_METHODS = ("encode", "decode")
+
+_installed = {}
+
+
+class CodecPlan:
+    """The planned methods for one class and the struct formats they use."""
+
+    def __init__(self, cls, methods: dict, formats: dict):
+        self.cls = cls
+        self.methods = methods
+        self.formats = formats
+
+    def __repr__(self):
+        return "CodecPlan(%s, %r)" % (self.cls.__qualname__, self.formats)
+
+
+def _fixed(field) -> bool:
+    if field.optional or field.struct_format is None:
+        return False
+    if field.wire_type == "fixed_string":
+        return len(field.pad_char.encode(field.encoding)) == 1
+    return True
+
+
+def _steps(fields):
+    """Split descriptors into runs of fixed fields sharing a byte order
+    (single bytes and fixed strings fit any order) and factory messages,
+    or None when a field cannot be planned."""
+    steps = []
+    run, order = [], None
+    for field in fields:
+        if _fixed(field) and (field.byte_order is None or order is None or field.byte_order == order):
+            run.append(field)
+            order = order or field.byte_order
+            continue
+        if run:
+            steps.append((run, order))
+        run, order = [], None
+        if _fixed(field):
+            run.append(field)
+            order = field.byte_order
+        elif field.wire_type == "message" and field.factory is not None and not field.optional:
+            steps.append(field)
+        else:
+            return None
+    if run:
+        steps.append((run, order))
+    return steps
+
+
+def _getter(names):
+    if len(names) == 1:
+        get = attrgetter(names[0])
+        return lambda message: (get(message),)
+    return attrgetter(*names)
+
+
+def _run_coders(run, order):
+    """(encode, decode) steps for one run, and its Struct."""
+    s = struct.Struct((order or ">") + "".join(f.struct_format for f in run))
+    names = [f.name for f in run]
+    get = _getter(names)
+    # pad_fixed_string() and strip_fixed_string() inlined, per string field
+    pads = [
+        (i, f.size, f.encoding, f.pad_char.encode(f.encoding), f.pad_left)
+        for i, f in enumerate(run)
+        if f.wire_type == "fixed_string"
+    ]
+    strips = [(i, encoding, pad.decode(encoding), pad_left) for i, _, encoding, pad, pad_left in pads]
+
+    def encode(message, buffer):
+        values = get(message)
+        if pads:
+            values = list(values)
+            for i, length, encoding, pad, pad_left in pads:
+                encoded = values[i].encode(encoding)
+                if pad_left:
+                    values[i] = encoded.rjust(length, pad)
+                else:
+                    values[i] = encoded.ljust(length, pad)
+        buffer.write_struct(s, *values)
+
+    def decode(message, buffer, reuse_body):
+        values = buffer.read_struct(s)
+        if strips:
+            values = list(values)
+            for i, encoding, pad, pad_left in strips:
+                if pad_left:
+                    values[i] = str(values[i], encoding).rstrip(pad)
+                else:
+                    values[i] = str(values[i], encoding).lstrip(pad)
+        for name, value in zip(names, values):
+            setattr(message, name, value)
+
+    return encode, decode, s
+
+
+def _message_coders(field):
+    """(encode, decode) steps for a nested message from a factory."""
+    name, factory = field.name, field.factory
+    get, get_key = attrgetter(name), attrgetter(field.factory_key)
+
+    def encode(message, buffer):
+        nested = get(message)
+        if nested is not None:
+            nested.encode(buffer)
+
+    def decode(message, buffer, reuse_body):
+        if reuse_body:
+            nested = factory.reuse(get(message), get_key(message))
+        else:
+            nested = factory.create(get_key(message))
+        setattr(message, name, nested)
+        nested.decode(buffer, reuse_body)
+
+    return encode, decode
+
+
+def compile_plan(cls) -> CodecPlan:
+    """Build, but do not install, the plan for one generated class. Its
+    methods are empty when the class has no run of two or more fixed
+    fields, or has a field a plan does not cover."""
+    steps = None if is_framing(cls) else _steps(schema_of(cls).fields)
+    if not steps or not any(isinstance(step, tuple) and len(step[0]) > 1 for step in steps):
+        return CodecPlan(cls, {}, {})
+    encoders, decoders, formats = [], [], []
+    for step in steps:
+        if isinstance(step, tuple):
+            encode, decode, s = _run_coders(*step)
+            formats.append(s.format)
+        else:
+            encode, decode = _message_coders(step)
+        encoders.append(encode)
+        decoders.append(decode)
+    encoders, decoders = tuple(encoders), tuple(decoders)
+
+    def encode(self, buffer):
+        for step in encoders:
+            step(self, buffer)
+
+    def decode(self, buffer, reuse_body=False):
+        for step in decoders:
+            step(self, buffer, reuse_body)
+
+    methods = {"encode": encode, "decode": decode}
+    for name, method in methods.items():
+        method.__qualname__ = "%s.%s" % (cls.__qualname__, name)
+    return CodecPlan(cls, methods, {name: list(formats) for name in methods})
+
+
+def install_plan(cls) -> CodecPlan:
+    """Replace the class's generated methods with its plan's; idempotent."""
+    if cls in _installed:
+        return _installed[cls][0]
+    plan = compile_plan(cls)
+    originals = {name: cls.__dict__[name] for name in plan.methods}
+    for name, method in plan.methods.items():
+        setattr(cls, name, method)
+    _installed[cls] = (plan, originals)
+    return plan
+
+
+def uninstall_plan(cls):
+    """Restore the generated methods of a class with an installed plan."""
+    plan, originals = _installed.pop(cls)
+    for name, method in originals.items():
+        setattr(cls, name, method)
+
+
+def codec_classes(module) -> list:
+    """The BinaryCodec classes defined in a generated module, in order."""
+    return [
+        value
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, BinaryCodec)
+        and value.__module__ == module.__name__
+    ]
+
+
+def install_plans(module) -> list:
+    """install_plan() for every BinaryCodec class of a generated module."""
+    return [install_plan(cls) for cls in codec_classes(module)]
+
+
+def uninstall_plans(module):
+    for cls in codec_classes(module):
+        if cls in _installed:
+            uninstall_plan(cls)
@@ -0,0 +1,120 @@
+import unittest
+
+import codec_plan
+from bytebuf import ByteBuf, CompositeByteBuf
+from sample_packets_test import GENERATED, sample_packets
+
+
+class TestCodecPlan(unittest.TestCase):
+    def test_plans_are_byte_identical(self):
+        for module_name, test_module_name in GENERATED:
+            module = __import__(module_name)
+            packets = list(sample_packets(test_module_name))
+            expected = []
+            for _, packet in packets:
+                buf = ByteBuf()
+                packet.encode(buf)
+                expected.append(bytes(buf.to_bytes()))
+            codec_plan.install_plans(module)
+            try:
+                for (name, packet), frame in zip(packets, expected):
+                    with self.subTest(module=module_name, test=name):
+                        actual = ByteBuf()
+                        packet.encode(actual)
+                        self.assertEqual(frame, bytes(actual.to_bytes()))
+                        decoded = packet.__class__()
+                        decoded.decode(actual)
+                        self.assertEqual(packet, decoded)
+                        self.assertEqual(0, actual.readable_bytes_len())
+            finally:
+                codec_plan.uninstall_plans(module)
+
+    def test_merges_fixed_fields(self):
+        import sse_binary
+
+        plan = codec_plan.compile_plan(sse_binary.NewOrderSingle)
+        self.assertEqual([">I8s10s12s13sB1sqq1s1sQ2s8s8s32s"], plan.formats["encode"])
+        self.assertEqual(plan.formats["encode"], plan.formats["decode"])
+        self.assertEqual({}, codec_plan.compile_plan(sse_binary.Heartbeat).methods)
+
+    def test_plans_need_no_source(self):
+        import inspect
+        from unittest import mock
+
+        import szse_binary
+
+        with mock.patch.object(inspect, "getsource", side_effect=OSError):
+            plan = codec_plan.compile_plan(szse_binary.ExecutionReport)
+        self.assertEqual({"encode", "decode"}, set(plan.methods))
+        self.assertEqual({}, codec_plan.compile_plan(szse_binary.SzseBinary).methods)
+
+    def test_planned_decode_honours_reuse_body(self):
+        from samples import sample_execution_report
+
+        report = sample_execution_report()
+        buf = ByteBuf()
+        for _ in range(4):
+            report.encode(buf)
+        expected = report.__class__()
+        expected.decode(buf)
+        decoded = report.__class__()
+        codec_plan.install_plan(report.__class__)
+        try:
+            decoded.decode(buf)
+            appl_extend = decoded.appl_extend
+            decoded.decode(buf, reuse_body=True)
+            self.assertIs(appl_extend, decoded.appl_extend)
+            decoded.decode(buf)
+            self.assertIsNot(appl_extend, decoded.appl_extend)
+        finally:
+            codec_plan.uninstall_plan(report.__class__)
+        self.assertEqual(expected, decoded)
+
+    def test_install_and_uninstall(self):
+        import sse_binary
+
+        generated = sse_binary.NewOrderSingle.encode
+        plan = codec_plan.install_plan(sse_binary.NewOrderSingle)
+        try:
+            self.assertIs(plan, codec_plan.install_plan(sse_binary.NewOrderSingle))
+            self.assertIsNot(generated, sse_binary.NewOrderSingle.encode)
+        finally:
+            codec_plan.uninstall_plan(sse_binary.NewOrderSingle)
+        self.assertIs(generated, sse_binary.NewOrderSingle.encode)
+
+    def test_fixed_string_padding_and_truncation(self):
+        import sse_binary
+
+        order = sse_binary.NewOrderSingle()
+        order.biz_pbu = "123456789"
+        order.cl_ord_id = " lead"
+        order.security_id = "证券"
+        expected = ByteBuf()
+        order.encode(expected)
+        codec_plan.install_plan(sse_binary.NewOrderSingle)
+        try:
+            actual = ByteBuf()
+            order.encode(actual)
+            self.assertEqual(bytes(expected.to_bytes()), bytes(actual.to_bytes()))
+            decoded = sse_binary.NewOrderSingle()
+            decoded.decode(CompositeByteBuf([actual.read_bytes(20), actual.readable_view()]))
+        finally:
+            codec_plan.uninstall_plan(sse_binary.NewOrderSingle)
+        generated = sse_binary.NewOrderSingle()
+        generated.decode(expected)
+        self.assertEqual(generated, decoded)
+        self.assertEqual("12345678", decoded.biz_pbu)
+
+    def test_short_buffer_still_raises(self):
+        import sse_binary
+
+        codec_plan.install_plan(sse_binary.NewOrderSingle)
+        try:
+            with self.assertRaises(Exception):
+                sse_binary.NewOrderSingle().decode(ByteBuf(b"\x00" * 20))
+        finally:
+            codec_plan.uninstall_plan(sse_binary.NewOrderSingle)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,4 +27,20 @@ class MessageFactory(Generic[T, M],metaclass=SingleMeta):
         cls = self._creators.get(msg_type)
         if not cls:
             raise ValueError(f"Message type {msg_type} not registered.")
-        return cls()
\ No newline at end of file
+        return cls()
+
+    def create_cached(self, msg_type:T, cache:Dict[T,M]) -> M:
+        """create(), but hand back the instance ``cache`` already holds for
+        msg_type so it can be decoded into again."""
+        message = cache.get(msg_type)
+        if message is None:
+            message = cache[msg_type] = self.create(msg_type)
+        return message
+
+    def reuse(self, current:M, msg_type:T) -> M:
+        """``current`` if it is already of the class registered for msg_type,
+        otherwise a new instance from create()."""
+        cls = self._creators.get(msg_type)
+        if cls is not None and current.__class__ is cls:
+            return current
+        return self.create(msg_type)
\ No newline at end of file
@@ -21,4 +21,24 @@ def test_message_factory():
         factory1.create("DUMMY")
         assert False, "Expected ValueError for unregistered message type"
     except ValueError:
-        pass
\ No newline at end of file
+        pass
+
+
+class OtherMessage: ...
+
+def test_message_factory_create_cached():
+    factory.register("DUMMY", DummyMessage)
+    cache = {}
+    message = factory.create_cached("DUMMY", cache)
+    assert isinstance(message, DummyMessage)
+    assert factory.create_cached("DUMMY", cache) is message
+    assert factory.create_cached("DUMMY", {}) is not message
+
+def test_message_factory_reuse():
+    factory.register("DUMMY", DummyMessage)
+    factory.register("OTHER", OtherMessage)
+    message = factory.reuse(None, "DUMMY")
+    assert isinstance(message, DummyMessage)
+    assert factory.reuse(message, "DUMMY") is message
+    assert isinstance(factory.reuse(message, "OTHER"), OtherMessage)
+    factory.remove("OTHER")
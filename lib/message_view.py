@@ -0,0 +1,167 @@
+"""Read-only flyweight views over encoded message bodies.
+
+A view wraps the bytes of one message body and exposes every field of the
+generated class under the same name. Fields at a fixed offset (see
+schema.py) are unpacked from the wrapped bytes each time they are read, so
+reading a few fields of a large report builds no message objects at all.
+Fields after the first variable-size field, and lists and nested messages,
+are read from ``materialize()``, which decodes the full message once::
+
+    from message_view import frame_views
+    for report in frame_views(SzseBinary, stream):
+        if report.last_qty:
+            handle(report.cl_ord_id, report.last_px)
+
+A view aliases the storage it wraps and is not copied. Appending to the
+ByteBuf it came from is safe (growth moves to new storage while views are
+exported), but reusing the storage in place is not: after ``clear()``,
+``discard_read_bytes()`` or ``compact()``, later writes overwrite the bytes
+live views read from, and they silently return other fields. Drop or
+``wrap()`` views before recycling a buffer. An MmapByteBuf's ``close()``
+raises BufferError while views of its mapping are alive.
+"""
+import struct
+
+from bytebuf import ByteBuf
+from codec import DECODE_BATCH_FRAMES, strip_fixed_string
+from schema import lookup, schema_of
+
+_views = {}
+
+
+class MessageView:
+    """Base of the view classes built by view_class()."""
+
+    __slots__ = ("_data", "_message", "checksum_valid")
+    message_class = None
+    schema = None
+
+    def __init__(self, data=b""):
+        self.wrap(data)
+
+    def wrap(self, data):
+        """Point this view at another body of the same message type."""
+        self._data = data
+        self._message = None
+        self.checksum_valid = None
+        return self
+
+    @property
+    def raw(self):
+        """The wrapped body bytes."""
+        return self._data
+
+    def materialize(self):
+        """The body decoded into a new instance of the generated class."""
+        if self._message is None:
+            message = self.message_class()
+            message.decode(ByteBuf(self._data))
+            self._message = message
+        return self._message
+
+    def __repr__(self):
+        return "%s(%d bytes)" % (self.__class__.__name__, len(self._data))
+
+
+def _fixed_property(field):
+    if field.wire_type == "fixed_string":
+        start, end = field.offset, field.offset + field.size
+        args = (field.encoding, field.pad_char, field.pad_left)
+
+        def get(self):
+            return strip_fixed_string(self._data[start:end], *args)
+
+    else:
+        unpack_from = struct.Struct((field.byte_order or ">") + field.struct_format).unpack_from
+        offset = field.offset
+
+        def get(self):
+            return unpack_from(self._data, offset)[0]
+
+    return property(get, doc="%s at offset %d" % (field.wire_type, field.offset))
+
+
+def _decoded_property(field):
+    name = field.name
+
+    def get(self):
+        return getattr(self.materialize(), name)
+
+    return property(get, doc="%s, read from materialize()" % field.wire_type)
+
+
+def view_class(message_class):
+    """The cached MessageView subclass for a generated message class."""
+    cls = _views.get(message_class)
+    if cls is None:
+        schema = schema_of(message_class)
+        namespace = {"__slots__": (), "message_class": message_class, "schema": schema}
+        for field in schema.fields:
+            if field.name is None:
+                continue
+            if field.offset is not None and field.struct_format is not None and not field.optional:
+                namespace[field.name] = _fixed_property(field)
+            else:
+                namespace[field.name] = _decoded_property(field)
+        cls = _views[message_class] = type(message_class.__name__ + "View", (MessageView,), namespace)
+    return cls
+
+
+class _FrameReader:
+    """Header offsets of one framing class and its view classes by msg_type."""
+
+    def __init__(self, codec_cls):
+        self.protocol = codec_cls.__module__
+        self.layout = codec_cls.frame_layout
+        field = schema_of(codec_cls).field("msg_type")
+        self.msg_type = struct.Struct((field.byte_order or ">") + field.struct_format)
+        self.msg_type_offset = field.offset
+        self.views = {}
+
+    def view(self, data, start: int) -> MessageView:
+        layout = self.layout
+        body_start = start + layout.header_len
+        body_len = layout.length.unpack_from(data, start + layout.length_offset)[0]
+        msg_type = self.msg_type.unpack_from(data, start + self.msg_type_offset)[0]
+        cls = self.views.get(msg_type)
+        if cls is None:
+            cls = self.views[msg_type] = view_class(lookup(self.protocol, msg_type).message_class)
+        return cls(memoryview(data)[body_start : body_start + body_len])
+
+
+_frame_readers = {}
+
+
+def _frame_reader(codec_cls) -> _FrameReader:
+    reader = _frame_readers.get(codec_cls)
+    if reader is None:
+        reader = _frame_readers[codec_cls] = _FrameReader(codec_cls)
+    return reader
+
+
+def frame_view(codec_cls, data, start: int = 0) -> MessageView:
+    """A view of the body of the frame of framing class ``codec_cls`` that
+    starts at ``start`` in ``data``. The checksum is not verified."""
+    return _frame_reader(codec_cls).view(data, start)
+
+
+def frame_views(codec_cls, buffer: ByteBuf, max_frames: int = DECODE_BATCH_FRAMES) -> list:
+    """Views of the bodies of up to ``max_frames`` complete frames readable
+    in ``buffer``, which is advanced past them.
+
+    Checksums are verified in one batch under the class's checksum_verifier
+    policy and recorded on each view's checksum_valid, as decode_frames()
+    does for decoded packets. A trailing partial frame is left unread.
+    """
+    data = buffer.readable_view()
+    frames = codec_cls.frame_layout.scan(data, max_frames)
+    flags = codec_cls.checksum_verifier.verify_batch(data, frames)
+    reader = _frame_reader(codec_cls)
+    views = []
+    for (start, _, _), checksum_valid in zip(frames, flags):
+        view = reader.view(data, start)
+        view.checksum_valid = checksum_valid
+        views.append(view)
+    if frames:
+        buffer.skip_bytes(frames[-1][1] + codec_cls.frame_layout.trailer.size)
+    return views
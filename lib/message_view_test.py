@@ -0,0 +1,116 @@
+import unittest
+
+import message_view
+from bytebuf import ByteBuf
+from checksum import ChecksumError, ChecksumPolicy, ChecksumVerifier
+from sample_packets_test import GENERATED, sample_packets
+from samples import sample_execution_report
+
+
+def encoded(message) -> bytes:
+    buf = ByteBuf()
+    message.encode(buf)
+    return bytes(buf.to_bytes())
+
+
+class TestMessageView(unittest.TestCase):
+    def test_views_read_every_field_as_decoded(self):
+        for module_name, test_module_name in GENERATED:
+            for name, packet in sample_packets(test_module_name):
+                with self.subTest(module=module_name, test=name):
+                    data = encoded(packet)
+                    decoded = packet.__class__()
+                    decoded.decode(ByteBuf(data))
+                    view = message_view.view_class(packet.__class__)(memoryview(data))
+                    for field_name in view.schema.field_names():
+                        self.assertEqual(getattr(decoded, field_name), getattr(view, field_name), field_name)
+                    self.assertEqual(decoded, view.materialize())
+
+    def test_fixed_fields_do_not_materialize(self):
+        report = sample_execution_report()
+        view = message_view.view_class(report.__class__)(encoded(report))
+        self.assertEqual((1000, 101000, 10000), (view.report_index, view.last_px, view.last_qty))
+        self.assertEqual("C000000001", view.cl_ord_id)
+        self.assertIsNone(view._message)
+        self.assertEqual(report.appl_extend, view.appl_extend)
+        self.assertIs(view.materialize(), view.materialize())
+
+    def test_view_class_is_cached(self):
+        import sse_binary
+
+        cls = message_view.view_class(sse_binary.Report)
+        self.assertIs(cls, message_view.view_class(sse_binary.Report))
+        self.assertEqual("ReportView", cls.__name__)
+        self.assertFalse(hasattr(cls(), "__dict__"))
+
+    def test_wrap_repoints_view(self):
+        import sse_binary
+
+        first, second = sse_binary.Report(), sse_binary.Report()
+        first.report_index, second.report_index = 1, 2
+        view = message_view.view_class(sse_binary.Report)(encoded(first))
+        first_message = view.materialize()
+        self.assertIs(view, view.wrap(encoded(second)))
+        self.assertEqual(2, view.report_index)
+        self.assertIsNot(first_message, view.materialize())
+        self.assertEqual(2, view.materialize().report_index)
+
+
+class TestFrameViews(unittest.TestCase):
+    def setUp(self):
+        from szse_binary import SzseBinary
+
+        self.packet = SzseBinary()
+        self.packet.msg_type = 200115
+        self.packet.body = sample_execution_report()
+        self.verifier = SzseBinary.checksum_verifier
+        SzseBinary.checksum_verifier = ChecksumVerifier(self.verifier.service)
+
+    def tearDown(self):
+        self.packet.__class__.checksum_verifier = self.verifier
+
+    def test_frame_view(self):
+        from szse_binary import Heartbeat, SzseBinary
+
+        data = encoded(self.packet)
+        view = message_view.frame_view(SzseBinary, data)
+        self.assertEqual("ExecutionReportView", view.__class__.__name__)
+        self.assertEqual(self.packet.body.report_index, view.report_index)
+        heartbeat = SzseBinary()
+        heartbeat.msg_type = 3
+        heartbeat.body = Heartbeat()
+        view = message_view.frame_view(SzseBinary, data + encoded(heartbeat), len(data))
+        self.assertEqual("HeartbeatView", view.__class__.__name__)
+        self.assertEqual(0, len(view.raw))
+
+    def test_frame_views(self):
+        from szse_binary import SzseBinary
+
+        stream = ByteBuf()
+        for index in range(3):
+            self.packet.body.report_index = index
+            self.packet.encode(stream)
+        stream.buf[stream.write_index - 5] ^= 0x01
+        complete = stream.write_index
+        self.packet.encode(stream)
+        stream.write_index -= 1
+        views = message_view.frame_views(SzseBinary, stream)
+        self.assertEqual([0, 1, 2], [view.report_index for view in views])
+        self.assertEqual([True, True, False], [view.checksum_valid for view in views])
+        self.assertEqual(complete, stream.read_index)
+        self.assertEqual([], message_view.frame_views(SzseBinary, ByteBuf()))
+
+    def test_frame_views_raise_before_reading(self):
+        from szse_binary import SzseBinary
+
+        SzseBinary.checksum_verifier.policy = ChecksumPolicy.RAISE
+        stream = ByteBuf()
+        self.packet.encode(stream)
+        stream.buf[stream.write_index - 1] ^= 0x01
+        with self.assertRaises(ChecksumError):
+            message_view.frame_views(SzseBinary, stream)
+        self.assertEqual(0, stream.read_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,22 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
 from bytebuf import ByteBuf
 from checksum import create_checksum_service
 from message_factory import MessageFactory
 from codec import *
 
 class NewOrder(BinaryCodec):
+    __slots__ = ("unique_order_id", "cl_ord_id", "security_id", "side", "price", "order_qty", "ord_type", "account")
+    _fields = (
+        FieldDescriptor('unique_order_id', 'string', length_type='u32'),
+        FieldDescriptor('cl_ord_id', 'string', length_type='u32'),
+        FieldDescriptor('security_id', 'string', length_type='u32'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('price', 'u64'),
+        FieldDescriptor('order_qty', 'u64'),
+        FieldDescriptor('ord_type', 'fixed_string', size=1),
+        FieldDescriptor('account', 'string', length_type='u32'),
+    )
     def __init__(self):
         self.unique_order_id = ''
         self.cl_ord_id = ''
@@ -15,6 +27,16 @@ class NewOrder(BinaryCodec):
         self.ord_type = ''
         self.account = ''
     
+    def reset(self):
+        self.unique_order_id = ''
+        self.cl_ord_id = ''
+        self.security_id = ''
+        self.side = ''
+        self.price = 0
+        self.order_qty = 0
+        self.ord_type = ''
+        self.account = ''
+    
     def encode(self, buffer: ByteBuf):
         write_string(buffer, self.unique_order_id, 'u32')
         write_string(buffer, self.cl_ord_id, 'u32')
@@ -25,7 +47,7 @@ class NewOrder(BinaryCodec):
         write_fixed_string(buffer, self.ord_type, 1, 'utf-8')
         write_string(buffer, self.account, 'u32')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.unique_order_id = read_string(buffer,'u32')
         self.cl_ord_id = read_string(buffer,'u32')
         self.security_id = read_string(buffer,'u32')
@@ -53,6 +75,15 @@ class NewOrder(BinaryCodec):
 
 
 class OrderConfirm(BinaryCodec):
+    __slots__ = ("unique_order_id", "unique_orig_order_id", "cl_ord_id", "exec_type", "ord_rej_reason", "ord_cnfm_id")
+    _fields = (
+        FieldDescriptor('unique_order_id', 'string', length_type='u32'),
+        FieldDescriptor('unique_orig_order_id', 'string', length_type='u32'),
+        FieldDescriptor('cl_ord_id', 'string', length_type='u32'),
+        FieldDescriptor('exec_type', 'fixed_string', size=1),
+        FieldDescriptor('ord_rej_reason', 'u32'),
+        FieldDescriptor('ord_cnfm_id', 'string', length_type='u32'),
+    )
     def __init__(self):
         self.unique_order_id = ''
         self.unique_orig_order_id = ''
@@ -61,6 +92,14 @@ class OrderConfirm(BinaryCodec):
         self.ord_rej_reason = 0
         self.ord_cnfm_id = ''
     
+    def reset(self):
+        self.unique_order_id = ''
+        self.unique_orig_order_id = ''
+        self.cl_ord_id = ''
+        self.exec_type = ''
+        self.ord_rej_reason = 0
+        self.ord_cnfm_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_string(buffer, self.unique_order_id, 'u32')
         write_string(buffer, self.unique_orig_order_id, 'u32')
@@ -69,7 +108,7 @@ class OrderConfirm(BinaryCodec):
         buffer.write_u32(self.ord_rej_reason)
         write_string(buffer, self.ord_cnfm_id, 'u32')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.unique_order_id = read_string(buffer,'u32')
         self.unique_orig_order_id = read_string(buffer,'u32')
         self.cl_ord_id = read_string(buffer,'u32')
@@ -93,6 +132,15 @@ class OrderConfirm(BinaryCodec):
 
 
 class ExecutionReport(BinaryCodec):
+    __slots__ = ("unique_order_id", "cl_ord_id", "ord_cnfm_id", "last_px", "last_qty", "ord_status")
+    _fields = (
+        FieldDescriptor('unique_order_id', 'string', length_type='u32'),
+        FieldDescriptor('cl_ord_id', 'string', length_type='u32'),
+        FieldDescriptor('ord_cnfm_id', 'string', length_type='u32'),
+        FieldDescriptor('last_px', 'u64'),
+        FieldDescriptor('last_qty', 'u64'),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.unique_order_id = ''
         self.cl_ord_id = ''
@@ -101,6 +149,14 @@ class ExecutionReport(BinaryCodec):
         self.last_qty = 0
         self.ord_status = ''
     
+    def reset(self):
+        self.unique_order_id = ''
+        self.cl_ord_id = ''
+        self.ord_cnfm_id = ''
+        self.last_px = 0
+        self.last_qty = 0
+        self.ord_status = ''
+    
     def encode(self, buffer: ByteBuf):
         write_string(buffer, self.unique_order_id, 'u32')
         write_string(buffer, self.cl_ord_id, 'u32')
@@ -109,7 +165,7 @@ class ExecutionReport(BinaryCodec):
         buffer.write_u64(self.last_qty)
         write_fixed_string(buffer, self.ord_status, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.unique_order_id = read_string(buffer,'u32')
         self.cl_ord_id = read_string(buffer,'u32')
         self.ord_cnfm_id = read_string(buffer,'u32')
@@ -133,6 +189,14 @@ class ExecutionReport(BinaryCodec):
 
 
 class OrderCancel(BinaryCodec):
+    __slots__ = ("unique_order_id", "unique_orig_order_id", "cl_ord_id", "orig_cl_ord_id", "security_id")
+    _fields = (
+        FieldDescriptor('unique_order_id', 'string', length_type='u32'),
+        FieldDescriptor('unique_orig_order_id', 'string', length_type='u32'),
+        FieldDescriptor('cl_ord_id', 'string', length_type='u32'),
+        FieldDescriptor('orig_cl_ord_id', 'string', length_type='u32'),
+        FieldDescriptor('security_id', 'string', length_type='u32'),
+    )
     def __init__(self):
         self.unique_order_id = ''
         self.unique_orig_order_id = ''
@@ -140,6 +204,13 @@ class OrderCancel(BinaryCodec):
         self.orig_cl_ord_id = ''
         self.security_id = ''
     
+    def reset(self):
+        self.unique_order_id = ''
+        self.unique_orig_order_id = ''
+        self.cl_ord_id = ''
+        self.orig_cl_ord_id = ''
+        self.security_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_string(buffer, self.unique_order_id, 'u32')
         write_string(buffer, self.unique_orig_order_id, 'u32')
@@ -147,7 +218,7 @@ class OrderCancel(BinaryCodec):
         write_string(buffer, self.orig_cl_ord_id, 'u32')
         write_string(buffer, self.security_id, 'u32')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.unique_order_id = read_string(buffer,'u32')
         self.unique_orig_order_id = read_string(buffer,'u32')
         self.cl_ord_id = read_string(buffer,'u32')
@@ -169,6 +240,14 @@ class OrderCancel(BinaryCodec):
 
 
 class CancelReject(BinaryCodec):
+    __slots__ = ("unique_order_id", "unique_orig_order_id", "cl_ord_id", "orig_cl_ord_id", "cxl_rej_reason")
+    _fields = (
+        FieldDescriptor('unique_order_id', 'string', length_type='u32'),
+        FieldDescriptor('unique_orig_order_id', 'string', length_type='u32'),
+        FieldDescriptor('cl_ord_id', 'string', length_type='u32'),
+        FieldDescriptor('orig_cl_ord_id', 'string', length_type='u32'),
+        FieldDescriptor('cxl_rej_reason', 'u32'),
+    )
     def __init__(self):
         self.unique_order_id = ''
         self.unique_orig_order_id = ''
@@ -176,6 +255,13 @@ class CancelReject(BinaryCodec):
         self.orig_cl_ord_id = ''
         self.cxl_rej_reason = 0
     
+    def reset(self):
+        self.unique_order_id = ''
+        self.unique_orig_order_id = ''
+        self.cl_ord_id = ''
+        self.orig_cl_ord_id = ''
+        self.cxl_rej_reason = 0
+    
     def encode(self, buffer: ByteBuf):
         write_string(buffer, self.unique_order_id, 'u32')
         write_string(buffer, self.unique_orig_order_id, 'u32')
@@ -183,7 +269,7 @@ class CancelReject(BinaryCodec):
         write_string(buffer, self.orig_cl_ord_id, 'u32')
         buffer.write_u32(self.cxl_rej_reason)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.unique_order_id = read_string(buffer,'u32')
         self.unique_orig_order_id = read_string(buffer,'u32')
         self.cl_ord_id = read_string(buffer,'u32')
@@ -205,17 +291,28 @@ class CancelReject(BinaryCodec):
 
 
 class RiskResult(BinaryCodec):
+    __slots__ = ("unique_order_id", "risk_status", "risk_reason")
+    _fields = (
+        FieldDescriptor('unique_order_id', 'string', length_type='u32'),
+        FieldDescriptor('risk_status', 'u8'),
+        FieldDescriptor('risk_reason', 'string', length_type='u32'),
+    )
     def __init__(self):
         self.unique_order_id = ''
         self.risk_status = 0
         self.risk_reason = ''
     
+    def reset(self):
+        self.unique_order_id = ''
+        self.risk_status = 0
+        self.risk_reason = ''
+    
     def encode(self, buffer: ByteBuf):
         write_string(buffer, self.unique_order_id, 'u32')
         buffer.write_u8(self.risk_status)
         write_string(buffer, self.risk_reason, 'u32')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.unique_order_id = read_string(buffer,'u32')
         self.risk_status = buffer.read_u8()
         self.risk_reason = read_string(buffer,'u32')
@@ -243,11 +340,25 @@ rcBinaryMessageFactory.register(800001, RiskResult)
 
 
 class RcBinary(BinaryCodec):
+    __slots__ = ("msg_type", "version", "msg_body_len", "body", "body_cache")
+    _fields = (
+        FieldDescriptor('msg_type', 'u32'),
+        FieldDescriptor('version', 'u32'),
+        FieldDescriptor('msg_body_len', 'u32'),
+        FieldDescriptor('body', 'message', factory='rcBinaryMessageFactory', factory_key='msg_type'),
+    )
     def __init__(self):
         self.msg_type = 0
         self.version = 0
         self.msg_body_len = 0
         self.body = None
+        self.body_cache = None
+    
+    def reset(self):
+        self.msg_type = 0
+        self.version = 0
+        self.msg_body_len = 0
+        self.body = None
     
     def encode(self, buffer: ByteBuf):
         buffer.write_u32(self.msg_type)
@@ -260,12 +371,17 @@ class RcBinary(BinaryCodec):
         self.msg_body_len = body_end - body_start
         buffer.write_u32_at(msg_body_len_pos, self.msg_body_len)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.msg_type = buffer.read_u32()
         self.version = buffer.read_u32()
         self.msg_body_len = buffer.read_u32()
-        self.body = rcBinaryMessageFactory.create(self.msg_type)
-        self.body.decode(buffer)
+        if reuse_body:
+            if self.body_cache is None:
+                self.body_cache = {}
+            self.body = rcBinaryMessageFactory.create_cached(self.msg_type, self.body_cache)
+        else:
+            self.body = rcBinaryMessageFactory.create(self.msg_type)
+        self.body.decode(buffer.read_verified_slice(self.msg_body_len), reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
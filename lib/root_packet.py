@@ -1,10 +1,36 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
 from bytebuf import ByteBuf
-from checksum import create_checksum_service
+from checksum import ChecksumVerifier, create_checksum_service
 from message_factory import MessageFactory
 from codec import *
 
 class BasicPacket(BinaryCodec):
+    __slots__ = ("field_i_8", "field_i_16", "field_i_32", "field_i_64", "field_char", "field_u_8", "field_u_16", "field_u_32", "field_u_64", "field_f_32", "field_f_64", "field_i_8_list", "field_i_16_list", "field_i_32_list", "field_i_64_list", "field_char_list", "field_u_8_list", "field_u_16_list", "field_u_32_list", "field_u_64_list", "field_f_32_list", "field_f_64_list")
+    _fields = (
+        FieldDescriptor('field_i_8', 'i8'),
+        FieldDescriptor('field_i_16', 'i16_le'),
+        FieldDescriptor('field_i_32', 'i32_le'),
+        FieldDescriptor('field_i_64', 'i64_le'),
+        FieldDescriptor('field_char', 'fixed_string', size=1, pad_char='0', pad_left=True),
+        FieldDescriptor('field_u_8', 'u8'),
+        FieldDescriptor('field_u_16', 'u16_le'),
+        FieldDescriptor('field_u_32', 'u32_le'),
+        FieldDescriptor('field_u_64', 'u64_le'),
+        FieldDescriptor('field_f_32', 'f32_le'),
+        FieldDescriptor('field_f_64', 'f64_le'),
+        FieldDescriptor('field_i_8_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'i8')),
+        FieldDescriptor('field_i_16_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'i16_le')),
+        FieldDescriptor('field_i_32_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'i32_le')),
+        FieldDescriptor('field_i_64_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'i64_le')),
+        FieldDescriptor('field_char_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'fixed_string', size=1, pad_char='0', pad_left=True)),
+        FieldDescriptor('field_u_8_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'u8')),
+        FieldDescriptor('field_u_16_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'u16_le')),
+        FieldDescriptor('field_u_32_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'u32_le')),
+        FieldDescriptor('field_u_64_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'u64_le')),
+        FieldDescriptor('field_f_32_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'f32_le')),
+        FieldDescriptor('field_f_64_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'f64_le')),
+    )
     def __init__(self):
         self.field_i_8 = 0
         self.field_i_16 = 0
@@ -29,6 +55,30 @@ class BasicPacket(BinaryCodec):
         self.field_f_32_list = []
         self.field_f_64_list = []
     
+    def reset(self):
+        self.field_i_8 = 0
+        self.field_i_16 = 0
+        self.field_i_32 = 0
+        self.field_i_64 = 0
+        self.field_char = ''
+        self.field_u_8 = 0
+        self.field_u_16 = 0
+        self.field_u_32 = 0
+        self.field_u_64 = 0
+        self.field_f_32 = 0
+        self.field_f_64 = 0
+        self.field_i_8_list = []
+        self.field_i_16_list = []
+        self.field_i_32_list = []
+        self.field_i_64_list = []
+        self.field_char_list = []
+        self.field_u_8_list = []
+        self.field_u_16_list = []
+        self.field_u_32_list = []
+        self.field_u_64_list = []
+        self.field_f_32_list = []
+        self.field_f_64_list = []
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i8(self.field_i_8)
         buffer.write_i16_le(self.field_i_16)
@@ -43,23 +93,19 @@ class BasicPacket(BinaryCodec):
         buffer.write_f64_le(self.field_f_64)
         size = len(self.field_i_8_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_i8(self.field_i_8_list[i])
+        buffer.write_i8_array(self.field_i_8_list)
         
         size = len(self.field_i_16_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_i16_le(self.field_i_16_list[i])
+        buffer.write_i16_le_array(self.field_i_16_list)
         
         size = len(self.field_i_32_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_i32_le(self.field_i_32_list[i])
+        buffer.write_i32_le_array(self.field_i_32_list)
         
         size = len(self.field_i_64_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_i64_le(self.field_i_64_list[i])
+        buffer.write_i64_le_array(self.field_i_64_list)
         
         size = len(self.field_char_list)
         buffer.write_u16_le(size)
@@ -68,36 +114,30 @@ class BasicPacket(BinaryCodec):
         
         size = len(self.field_u_8_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_u8(self.field_u_8_list[i])
+        buffer.write_u8_array(self.field_u_8_list)
         
         size = len(self.field_u_16_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_u16_le(self.field_u_16_list[i])
+        buffer.write_u16_le_array(self.field_u_16_list)
         
         size = len(self.field_u_32_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_u32_le(self.field_u_32_list[i])
+        buffer.write_u32_le_array(self.field_u_32_list)
         
         size = len(self.field_u_64_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_u64_le(self.field_u_64_list[i])
+        buffer.write_u64_le_array(self.field_u_64_list)
         
         size = len(self.field_f_32_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_f32_le(self.field_f_32_list[i])
+        buffer.write_f32_le_array(self.field_f_32_list)
         
         size = len(self.field_f_64_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_f64_le(self.field_f_64_list[i])
+        buffer.write_f64_le_array(self.field_f_64_list)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.field_i_8 = buffer.read_i8()
         self.field_i_16 = buffer.read_i16_le()
         self.field_i_32 = buffer.read_i32_le()
@@ -110,48 +150,39 @@ class BasicPacket(BinaryCodec):
         self.field_f_32 = buffer.read_f32_le()
         self.field_f_64 = buffer.read_f64_le()
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_i_8_list.append(buffer.read_i8())
+        self.field_i_8_list = buffer.read_i8_array(size)
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_i_16_list.append(buffer.read_i16_le())
+        self.field_i_16_list = buffer.read_i16_le_array(size)
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_i_32_list.append(buffer.read_i32_le())
+        self.field_i_32_list = buffer.read_i32_le_array(size)
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_i_64_list.append(buffer.read_i64_le())
+        self.field_i_64_list = buffer.read_i64_le_array(size)
         
         size = read_len_le(buffer, 'u16')
+        self.field_char_list = []
         for i in range(size):
             self.field_char_list.append(read_fixed_string(buffer, 1, 'utf-8', '0', True))
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_u_8_list.append(buffer.read_u8())
+        self.field_u_8_list = buffer.read_u8_array(size)
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_u_16_list.append(buffer.read_u16_le())
+        self.field_u_16_list = buffer.read_u16_le_array(size)
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_u_32_list.append(buffer.read_u32_le())
+        self.field_u_32_list = buffer.read_u32_le_array(size)
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_u_64_list.append(buffer.read_u64_le())
+        self.field_u_64_list = buffer.read_u64_le_array(size)
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_f_32_list.append(buffer.read_f32_le())
+        self.field_f_32_list = buffer.read_f32_le_array(size)
         
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_f_64_list.append(buffer.read_f64_le())
+        self.field_f_64_list = buffer.read_f64_le_array(size)
         
     
     def __eq__(self, other):
@@ -186,6 +217,21 @@ class BasicPacket(BinaryCodec):
 
 
 class StringPacket(BinaryCodec):
+    __slots__ = ("field_dynamic_string", "field_dynamic_string_1", "field_fixed_string_1", "field_fixed_string_10", "field_fixed_string_10_pad", "field_fixed_string_10_pad_with_null_terminator", "field_dynamic_string_list", "field_dynamic_string_1_list", "field_fixed_string_1_list", "field_fixed_string_10_list", "field_fixed_string_10_list_pad", "field_fixed_string_10_pad_with_null_terminator_list")
+    _fields = (
+        FieldDescriptor('field_dynamic_string', 'string', byte_order='<', length_type='u16'),
+        FieldDescriptor('field_dynamic_string_1', 'string', byte_order='<', length_type='u16'),
+        FieldDescriptor('field_fixed_string_1', 'fixed_string', size=1, pad_char='0', pad_left=True),
+        FieldDescriptor('field_fixed_string_10', 'fixed_string', size=10, pad_char='0', pad_left=True),
+        FieldDescriptor('field_fixed_string_10_pad', 'fixed_string', size=10, pad_left=True),
+        FieldDescriptor('field_fixed_string_10_pad_with_null_terminator', 'fixed_string', size=10, pad_char='\x00'),
+        FieldDescriptor('field_dynamic_string_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'string', byte_order='<', length_type='u16')),
+        FieldDescriptor('field_dynamic_string_1_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'string', byte_order='<', length_type='u16')),
+        FieldDescriptor('field_fixed_string_1_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'fixed_string', size=1, pad_char='0', pad_left=True)),
+        FieldDescriptor('field_fixed_string_10_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'fixed_string', size=10, pad_char='0', pad_left=True)),
+        FieldDescriptor('field_fixed_string_10_list_pad', 'list', length_type='u16_le', element=FieldDescriptor(None, 'fixed_string', size=10, pad_char='0')),
+        FieldDescriptor('field_fixed_string_10_pad_with_null_terminator_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'fixed_string', size=10, pad_char='\x00')),
+    )
     def __init__(self):
         self.field_dynamic_string = ''
         self.field_dynamic_string_1 = ''
@@ -200,6 +246,20 @@ class StringPacket(BinaryCodec):
         self.field_fixed_string_10_list_pad = []
         self.field_fixed_string_10_pad_with_null_terminator_list = []
     
+    def reset(self):
+        self.field_dynamic_string = ''
+        self.field_dynamic_string_1 = ''
+        self.field_fixed_string_1 = ''
+        self.field_fixed_string_10 = ''
+        self.field_fixed_string_10_pad = ''
+        self.field_fixed_string_10_pad_with_null_terminator = ''
+        self.field_dynamic_string_list = []
+        self.field_dynamic_string_1_list = []
+        self.field_fixed_string_1_list = []
+        self.field_fixed_string_10_list = []
+        self.field_fixed_string_10_list_pad = []
+        self.field_fixed_string_10_pad_with_null_terminator_list = []
+    
     def encode(self, buffer: ByteBuf):
         write_string_le(buffer, self.field_dynamic_string, 'u16')
         write_string_le(buffer, self.field_dynamic_string_1, 'u16')
@@ -238,7 +298,7 @@ class StringPacket(BinaryCodec):
             write_fixed_string(buffer, self.field_fixed_string_10_pad_with_null_terminator_list[i], 10, 'utf-8', '\x00', False)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.field_dynamic_string = read_string_le(buffer,'u16')
         self.field_dynamic_string_1 = read_string_le(buffer,'u16')
         self.field_fixed_string_1 = read_fixed_string(buffer, 1, 'utf-8', '0', True)
@@ -246,26 +306,32 @@ class StringPacket(BinaryCodec):
         self.field_fixed_string_10_pad = read_fixed_string(buffer, 10, 'utf-8', ' ', True)
         self.field_fixed_string_10_pad_with_null_terminator = read_fixed_string(buffer, 10, 'utf-8', '\x00', False)
         size = read_len_le(buffer, 'u16')
+        self.field_dynamic_string_list = []
         for i in range(size):
             self.field_dynamic_string_list.append(read_string_le(buffer,'u16'))
         
         size = read_len_le(buffer, 'u16')
+        self.field_dynamic_string_1_list = []
         for i in range(size):
             self.field_dynamic_string_1_list.append(read_string_le(buffer,'u16'))
         
         size = read_len_le(buffer, 'u16')
+        self.field_fixed_string_1_list = []
         for i in range(size):
             self.field_fixed_string_1_list.append(read_fixed_string(buffer, 1, 'utf-8', '0', True))
         
         size = read_len_le(buffer, 'u16')
+        self.field_fixed_string_10_list = []
         for i in range(size):
             self.field_fixed_string_10_list.append(read_fixed_string(buffer, 10, 'utf-8', '0', True))
         
         size = read_len_le(buffer, 'u16')
+        self.field_fixed_string_10_list_pad = []
         for i in range(size):
             self.field_fixed_string_10_list_pad.append(read_fixed_string(buffer, 10, 'utf-8', '0', False))
         
         size = read_len_le(buffer, 'u16')
+        self.field_fixed_string_10_pad_with_null_terminator_list = []
         for i in range(size):
             self.field_fixed_string_10_pad_with_null_terminator_list.append(read_fixed_string(buffer, 10, 'utf-8', '\x00', False))
         
@@ -292,23 +358,30 @@ class StringPacket(BinaryCodec):
 
 
 class SubPacket(BinaryCodec):
+    __slots__ = ("field_u_32", "field_i_16_list")
+    _fields = (
+        FieldDescriptor('field_u_32', 'u32_le'),
+        FieldDescriptor('field_i_16_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'i16_le')),
+    )
     def __init__(self):
         self.field_u_32 = 0
         self.field_i_16_list = []
     
+    def reset(self):
+        self.field_u_32 = 0
+        self.field_i_16_list = []
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u32_le(self.field_u_32)
         size = len(self.field_i_16_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_i16_le(self.field_i_16_list[i])
+        buffer.write_i16_le_array(self.field_i_16_list)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.field_u_32 = buffer.read_u32_le()
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_i_16_list.append(buffer.read_i16_le())
+        self.field_i_16_list = buffer.read_i16_le_array(size)
         
     
     def __eq__(self, other):
@@ -323,23 +396,30 @@ class SubPacket(BinaryCodec):
 
 
 class InerPacket(BinaryCodec):
+    __slots__ = ("field_u_32", "field_i_16_list")
+    _fields = (
+        FieldDescriptor('field_u_32', 'u32_le'),
+        FieldDescriptor('field_i_16_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'i16_le')),
+    )
     def __init__(self):
         self.field_u_32 = 0
         self.field_i_16_list = []
     
+    def reset(self):
+        self.field_u_32 = 0
+        self.field_i_16_list = []
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u32_le(self.field_u_32)
         size = len(self.field_i_16_list)
         buffer.write_u16_le(size)
-        for i in range(size):
-            buffer.write_i16_le(self.field_i_16_list[i])
+        buffer.write_i16_le_array(self.field_i_16_list)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.field_u_32 = buffer.read_u32_le()
         size = read_len_le(buffer, 'u16')
-        for i in range(size):
-            self.field_i_16_list.append(buffer.read_i16_le())
+        self.field_i_16_list = buffer.read_i16_le_array(size)
         
     
     def __eq__(self, other):
@@ -353,11 +433,22 @@ class InerPacket(BinaryCodec):
     
 
 class NestedPacket(BinaryCodec):
+    __slots__ = ("sub_packet", "sub_packet_list", "iner_packet")
+    _fields = (
+        FieldDescriptor('sub_packet', 'message', message_class='SubPacket'),
+        FieldDescriptor('sub_packet_list', 'list', length_type='u16_le', element=FieldDescriptor(None, 'message', message_class='SubPacket')),
+        FieldDescriptor('iner_packet', 'message', message_class='InerPacket'),
+    )
     def __init__(self):
         self.sub_packet = None
         self.sub_packet_list = []
         self.iner_packet = None
     
+    def reset(self):
+        self.sub_packet = None
+        self.sub_packet_list = []
+        self.iner_packet = None
+    
     def encode(self, buffer: ByteBuf):
         self.sub_packet.encode(buffer)
         size = len(self.sub_packet_list)
@@ -367,17 +458,20 @@ class NestedPacket(BinaryCodec):
         
         self.iner_packet.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
-        self.sub_packet = SubPacket()
-        self.sub_packet.decode(buffer)
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
+        if not reuse_body or self.sub_packet is None:
+            self.sub_packet = SubPacket()
+        self.sub_packet.decode(buffer, reuse_body)
         size = read_len_le(buffer, 'u16')
+        self.sub_packet_list = []
         for i in range(size):
             _sub_packet = SubPacket()
             _sub_packet.decode(buffer)
             self.sub_packet_list.append(_sub_packet)
         
-        self.iner_packet = InerPacket()
-        self.iner_packet.decode(buffer)
+        if not reuse_body or self.iner_packet is None:
+            self.iner_packet = InerPacket()
+        self.iner_packet.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -394,13 +488,18 @@ class NestedPacket(BinaryCodec):
 
 
 class EmptyPacket(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -419,13 +518,34 @@ rootPacketMessageFactory.register(4, EmptyPacket)
 
 
 class RootPacket(BinaryCodec):
+    __slots__ = ("msg_type", "payload_len", "payload", "checksum", "checksum_valid", "body_cache")
+    _fields = (
+        FieldDescriptor('msg_type', 'u16_le'),
+        FieldDescriptor('payload_len', 'u32_le'),
+        FieldDescriptor('payload', 'message', factory='rootPacketMessageFactory', factory_key='msg_type'),
+        FieldDescriptor('checksum', 'u32_le'),
+    )
+    frame_layout = FrameLayout(2, "<I", 6, "<I")
+    checksum_service = create_checksum_service("CRC32")
+    checksum_verifier = ChecksumVerifier(checksum_service)
+
     def __init__(self):
         self.msg_type = 0
         self.payload_len = 0
         self.payload = None
         self.checksum = 0
+        self.checksum_valid = None
+        self.body_cache = None
+    
+    def reset(self):
+        self.msg_type = 0
+        self.payload_len = 0
+        self.payload = None
+        self.checksum = 0
+        self.checksum_valid = None
     
     def encode(self, buffer: ByteBuf):
+        frame_start = buffer.write_index
         buffer.write_u16_le(self.msg_type)
         payload_len_pos = buffer.write_index
         buffer.write_u32_le(0)
@@ -434,16 +554,30 @@ class RootPacket(BinaryCodec):
         payload_end = buffer.write_index
         self.payload_len = payload_end - payload_start
         buffer.write_u32_le_at(payload_len_pos, self.payload_len)
-        service = create_checksum_service("CRC32")
+        service = self.checksum_service
         if service :
-            self.checksum = service.calc(buffer)
+            self.checksum = service.calc_range(buffer, frame_start, buffer.write_index)
         buffer.write_u32_le(self.checksum)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
+        checksum_valid = self.checksum_verifier.verify_next(buffer, self.frame_layout)
+        self._decode_frame(buffer, reuse_body)
+        self.checksum_valid = checksum_valid
+
+    @classmethod
+    def decode_batch(cls, buffer: ByteBuf) -> list:
+        return decode_frames(cls, buffer)
+    
+    def _decode_frame(self, buffer: ByteBuf, reuse_body: bool = False):
         self.msg_type = buffer.read_u16_le()
         self.payload_len = buffer.read_u32_le()
-        self.payload = rootPacketMessageFactory.create(self.msg_type)
-        self.payload.decode(buffer)
+        if reuse_body:
+            if self.body_cache is None:
+                self.body_cache = {}
+            self.payload = rootPacketMessageFactory.create_cached(self.msg_type, self.body_cache)
+        else:
+            self.payload = rootPacketMessageFactory.create(self.msg_type)
+        self.payload.decode(buffer.read_verified_slice(self.payload_len), reuse_body)
         self.checksum = buffer.read_u32_le()
     
     def __eq__(self, other):
@@ -1,4 +1,5 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
 import unittest
 
 from root_packet import *
@@ -42,6 +43,27 @@ class TestRootPacket(unittest.TestCase):
         decoded_packet.decode(buf)
         self.assertEqual(decoded_packet, self.packet)
 
+    def test_decode_reuse_body(self):
+        buf = ByteBuf()
+        self.packet.encode(buf)
+        self.packet.encode(buf)
+        decoded_packet = RootPacket()
+        decoded_packet.decode(buf, reuse_body=True)
+        payload = decoded_packet.payload
+        decoded_packet.decode(buf, reuse_body=True)
+        self.assertIs(payload, decoded_packet.payload)
+        self.assertEqual(decoded_packet, self.packet)
+        self.assertEqual(["x"], decoded_packet.payload.field_char_list)
+
+    def test_reset(self):
+        self.packet.reset()
+        self.assertEqual(RootPacket(), self.packet)
+        payload = BasicPacket()
+        payload.field_char_list = ["x"]
+        payload.field_i_8 = 1
+        payload.reset()
+        self.assertEqual(BasicPacket(), payload)
+
 
 
 class TestBasicPacket(unittest.TestCase):
@@ -130,6 +152,26 @@ class TestNestedPacket(unittest.TestCase):
         decoded_packet.decode(buf)
         self.assertEqual(decoded_packet, self.packet)
 
+    def test_decode_reuse_body_reuses_nested_packets(self):
+        frame = RootPacket()
+        frame.msg_type = 3
+        frame.payload = self.packet
+        buf = ByteBuf()
+        for _ in range(3):
+            frame.encode(buf)
+        decoded_frame = RootPacket()
+        decoded_frame.decode(buf, reuse_body=True)
+        nested = decoded_frame.payload
+        sub_packet, iner_packet = nested.sub_packet, nested.iner_packet
+        decoded_frame.decode(buf, reuse_body=True)
+        self.assertIs(nested, decoded_frame.payload)
+        self.assertIs(sub_packet, nested.sub_packet)
+        self.assertIs(iner_packet, nested.iner_packet)
+        self.assertEqual(self.packet, nested)
+        nested.decode(ByteBuf(bytes(buf.to_bytes())[buf.read_index + 6 : -4]))
+        self.assertIsNot(sub_packet, nested.sub_packet)
+        self.assertEqual(self.packet, nested)
+
 
 
 class TestSubPacket(unittest.TestCase):
@@ -0,0 +1,25 @@
+"""Round-trip packets harvested from the generated test modules.
+
+Test-side support only: lib/ modules must not import this.
+"""
+import unittest
+
+GENERATED = (
+    ("sse_binary", "sse_binary_test"),
+    ("szse_binary", "szse_binary_test"),
+    ("bjse_binary", "bjse_binary_test"),
+    ("rc_binary", "rc_binary_test"),
+    ("root_packet", "root_packet_test"),
+)
+
+
+def sample_packets(test_module_name):
+    """The packet built by setUp() of every generated round-trip test."""
+    test_module = __import__(test_module_name)
+    for value in vars(test_module).values():
+        if isinstance(value, type) and issubclass(value, unittest.TestCase):
+            if value.__module__ != test_module_name or "test_encode_decode" not in vars(value):
+                continue
+            case = value("test_encode_decode")
+            case.setUp()
+            yield value.__name__, case.packet
@@ -0,0 +1,59 @@
+"""Populated sample messages shared by the benchmarks and tests."""
+
+
+def sample_execution_report():
+    """A fully populated SZSE ExecutionReport (msg_type 200115)."""
+    from szse_binary import ExecutionReport, Extend200115
+
+    report = ExecutionReport()
+    report.partition_no = 1
+    report.report_index = 1000
+    report.appl_id = "010"
+    report.reporting_pbuid = "000001"
+    report.submitting_pbuid = "000001"
+    report.security_id = "000001"
+    report.security_id_source = "102"
+    report.owner_type = 1
+    report.clearing_firm = "01"
+    report.transact_time = 20250101093000000
+    report.user_info = "user"
+    report.order_id = "O000000000000001"
+    report.cl_ord_id = "C000000001"
+    report.quote_msg_id = ""
+    report.exec_id = "E000000000000001"
+    report.exec_type = "F"
+    report.ord_status = "2"
+    report.last_px = 101000
+    report.last_qty = 10000
+    report.leaves_qty = 0
+    report.cum_qty = 10000
+    report.side = "1"
+    report.account_id = "0000000001"
+    report.branch_id = "0001"
+    report.appl_extend = Extend200115()
+    report.appl_extend.cash_margin = "1"
+    return report
+
+
+def sample_new_order_single():
+    """A fully populated SSE NewOrderSingle (msg_type 58)."""
+    from sse_binary import NewOrderSingle
+
+    order = NewOrderSingle()
+    order.biz_id = 300060
+    order.biz_pbu = "12345"
+    order.cl_ord_id = "C000000001"
+    order.security_id = "600000"
+    order.account = "A123456789"
+    order.owner_type = 1
+    order.side = "1"
+    order.price = 101000
+    order.order_qty = 10000
+    order.ord_type = "2"
+    order.time_in_force = "0"
+    order.transact_time = 20250101093000000
+    order.credit_tag = "XY"
+    order.clearing_firm = "00001"
+    order.branch_id = "0001"
+    order.user_info = "user"
+    return order
@@ -0,0 +1,132 @@
+"""Runtime field layouts of the generated message classes.
+
+The layout of a message (field order, wire types, fixed lengths, padding,
+byte order and offsets) comes from the FieldDescriptors fin-protoc emits
+in each generated class's ``_fields``. Schemas are built lazily and
+cached::
+
+    from schema import lookup, schema_of
+    lookup("szse_binary", 200115).field("appl_extend")
+    schema_of(NewOrderSingle).fixed_size
+"""
+import importlib
+import sys
+
+from codec import BinaryCodec, FieldDescriptor
+
+PROTOCOLS = ("sse_binary", "szse_binary", "bjse_binary", "rc_binary", "root_packet")
+
+_schemas = {}
+
+
+class MessageSchema:
+    """The ordered fields of one generated message class."""
+
+    def __init__(self, protocol: str, message_class, msg_type, fields):
+        self.protocol = protocol
+        self.message_class = message_class
+        self.msg_type = msg_type
+        self.fields = tuple(fields)
+        self._by_name = {f.name: f for f in self.fields if f.name is not None}
+        offset = 0
+        for f in self.fields:
+            f.offset = offset
+            if offset is not None and f.size is not None and not f.optional:
+                offset += f.size
+            else:
+                offset = None
+        self.fixed_size = offset
+
+    def field(self, name: str) -> FieldDescriptor:
+        return self._by_name[name]
+
+    def field_names(self) -> list:
+        return [f.name for f in self.fields if f.name is not None]
+
+    def __repr__(self):
+        return "MessageSchema(%s.%s, msg_type=%r, fixed_size=%r)" % (
+            self.protocol,
+            self.message_class.__name__,
+            self.msg_type,
+            self.fixed_size,
+        )
+
+
+def _is_codec(value) -> bool:
+    return isinstance(value, type) and issubclass(value, BinaryCodec)
+
+
+def _resolve(field: FieldDescriptor, module) -> FieldDescriptor:
+    """Resolve a descriptor's class and factory names against the module
+    that defines it, and size fields of fixed-size message classes."""
+    if isinstance(field.message_class, str):
+        field.message_class = getattr(module, field.message_class)
+    if isinstance(field.factory, str):
+        field.factory = getattr(module, field.factory)
+    if field.element is not None:
+        _resolve(field.element, module)
+    if field.wire_type == "message" and field.message_class is not None:
+        field.size = schema_of(field.message_class).fixed_size
+    return field
+
+
+def _protocol(cls) -> str:
+    return cls.__module__
+
+
+def _root_factory(protocol: str):
+    module = importlib.import_module(protocol)
+    head, *rest = protocol.split("_")
+    return getattr(module, head + "".join(p.title() for p in rest) + "MessageFactory")
+
+
+def _msg_type(cls):
+    try:
+        creators = _root_factory(_protocol(cls))._creators
+    except (AttributeError, ImportError):
+        return None
+    for msg_type, registered in creators.items():
+        if registered is cls:
+            return msg_type
+    return None
+
+
+def is_framing(cls) -> bool:
+    """Whether ``cls`` frames bodies from its protocol's root factory."""
+    try:
+        root = _root_factory(_protocol(cls))
+    except (AttributeError, ImportError):
+        return False
+    return any(field.factory is root for field in schema_of(cls).fields)
+
+
+def schema_of(cls) -> MessageSchema:
+    """The cached schema of a generated BinaryCodec class."""
+    schema = _schemas.get(cls)
+    if schema is None:
+        descriptors = cls.__dict__.get("_fields")
+        if descriptors is None:
+            raise ValueError("%s has no _fields descriptors" % cls.__qualname__)
+        module = sys.modules[cls.__module__]
+        fields = [_resolve(field, module) for field in descriptors]
+        schema = _schemas[cls] = MessageSchema(_protocol(cls), cls, _msg_type(cls), fields)
+    return schema
+
+
+def protocol_schemas(protocol: str) -> list:
+    """Schemas of every BinaryCodec class in a protocol module, in order."""
+    module = importlib.import_module(protocol)
+    return [
+        schema_of(value)
+        for value in vars(module).values()
+        if _is_codec(value) and value.__module__ == module.__name__
+    ]
+
+
+def lookup(protocol: str, msg_type) -> MessageSchema:
+    """The schema of the body registered for ``msg_type`` in a protocol's
+    framing factory. Raises ValueError for unregistered types."""
+    creators = _root_factory(protocol)._creators
+    if msg_type not in creators:
+        raise ValueError(f"Message type {msg_type} not registered.")
+    return schema_of(creators[msg_type])
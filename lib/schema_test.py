@@ -0,0 +1,122 @@
+import struct
+import unittest
+
+import schema
+from bytebuf import ByteBuf
+from codec import strip_fixed_string
+from samples import sample_execution_report, sample_new_order_single
+
+
+class TestSchema(unittest.TestCase):
+    def test_every_generated_class_has_a_schema(self):
+        for protocol in schema.PROTOCOLS:
+            for message_schema in schema.protocol_schemas(protocol):
+                with self.subTest(schema=message_schema):
+                    instance = message_schema.message_class()
+                    for name in message_schema.field_names():
+                        self.assertTrue(hasattr(instance, name), name)
+                    if message_schema.fixed_size is not None:
+                        buf = ByteBuf()
+                        instance.encode(buf)
+                        self.assertEqual(message_schema.fixed_size, buf.write_index)
+
+    def test_messages_have_no_instance_dict(self):
+        for protocol in schema.PROTOCOLS:
+            for message_schema in schema.protocol_schemas(protocol):
+                instance = message_schema.message_class()
+                self.assertFalse(hasattr(instance, "__dict__"), message_schema)
+
+    def test_offsets_match_encoding(self):
+        order = sample_new_order_single()
+        buf = ByteBuf()
+        order.encode(buf)
+        message_schema = schema.schema_of(order.__class__)
+        self.assertEqual(58, message_schema.msg_type)
+        self.assertEqual(buf.write_index, message_schema.fixed_size)
+        decoded = order.__class__()
+        decoded.decode(ByteBuf(buf.to_bytes()))
+        for field in message_schema.fields:
+            raw = struct.unpack_from(">" + field.struct_format, buf.to_bytes(), field.offset)[0]
+            if field.wire_type == "fixed_string":
+                raw = strip_fixed_string(raw, field.encoding, field.pad_char, field.pad_left)
+            self.assertEqual(getattr(decoded, field.name), raw)
+
+    def test_lookup(self):
+        report = schema.lookup("szse_binary", 200115)
+        self.assertEqual("ExecutionReport", report.message_class.__name__)
+        self.assertIsNone(report.fixed_size)
+        self.assertEqual(162, report.field("appl_extend").offset)
+        self.assertEqual("appl_id", report.field("appl_extend").factory_key)
+        self.assertIs(report, schema.lookup("szse_binary", 200115))
+        with self.assertRaises(ValueError):
+            schema.lookup("szse_binary", -1)
+
+    def test_framing_schema(self):
+        import sse_binary
+
+        frame = schema.schema_of(sse_binary.SseBinary)
+        self.assertEqual(
+            ["msg_type", "msg_seq_num", "msg_body_len", "body", "checksum"],
+            frame.field_names(),
+        )
+        self.assertEqual(12, frame.field("msg_body_len").offset)
+        self.assertIsNone(frame.field("checksum").offset)
+
+    def test_lists_and_strings(self):
+        import root_packet
+
+        basic = schema.schema_of(root_packet.BasicPacket)
+        field = basic.field("field_i_16_list")
+        self.assertEqual(("list", "u16_le", "i16_le"), (field.wire_type, field.length_type, field.element.wire_type))
+        strings = schema.schema_of(root_packet.StringPacket)
+        field = strings.field("field_fixed_string_10_pad_with_null_terminator")
+        self.assertEqual((10, "\x00", False), (field.size, field.pad_char, field.pad_left))
+        self.assertEqual("u16", strings.field("field_dynamic_string").length_type)
+        nested = schema.schema_of(root_packet.NestedPacket)
+        self.assertIs(root_packet.SubPacket, nested.field("sub_packet_list").element.message_class)
+
+    def test_schemas_need_no_source(self):
+        import inspect
+        from unittest import mock
+
+        import szse_binary
+
+        cls = szse_binary.ExecutionReport
+        expected = repr(schema.schema_of(cls).fields)
+        cached = schema._schemas.pop(cls)
+        try:
+            with mock.patch.object(inspect, "getsource", side_effect=OSError):
+                self.assertEqual(expected, repr(schema.schema_of(cls).fields))
+        finally:
+            schema._schemas[cls] = cached
+
+    def test_schemas_with_plans_installed(self):
+        import codec_plan
+        import message_view
+        import szse_binary
+
+        classes = codec_plan.codec_classes(szse_binary)
+        expected = {cls: repr(schema.schema_of(cls).fields) for cls in classes}
+        cached = {cls: schema._schemas.pop(cls) for cls in classes}
+        views = {cls: message_view._views.pop(cls, None) for cls in classes}
+        codec_plan.install_plans(szse_binary)
+        try:
+            for cls in classes:
+                self.assertEqual(expected[cls], repr(schema.schema_of(cls).fields), cls)
+            report = sample_execution_report()
+            buf = ByteBuf()
+            report.encode(buf)
+            view = message_view.view_class(report.__class__)(buf.to_bytes())
+            self.assertEqual(report.cl_ord_id, view.cl_ord_id)
+            installed = codec_plan._installed[report.__class__][0]
+            self.assertEqual(installed.formats, codec_plan.compile_plan(report.__class__).formats)
+        finally:
+            codec_plan.uninstall_plans(szse_binary)
+            schema._schemas.update(cached)
+            for cls, view_cls in views.items():
+                if view_cls is not None:
+                    message_view._views[cls] = view_cls
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,23 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
 from bytebuf import ByteBuf
-from checksum import create_checksum_service
+from checksum import ChecksumVerifier, create_checksum_service
 from message_factory import MessageFactory
 from codec import *
 
 class Heartbeat(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -22,6 +28,15 @@ class Heartbeat(BinaryCodec):
 
 
 class Logon(BinaryCodec):
+    __slots__ = ("sender_comp_id", "target_comp_id", "heart_bt_int", "prtcl_version", "trade_date", "q_size")
+    _fields = (
+        FieldDescriptor('sender_comp_id', 'fixed_string', size=32),
+        FieldDescriptor('target_comp_id', 'fixed_string', size=32),
+        FieldDescriptor('heart_bt_int', 'u16'),
+        FieldDescriptor('prtcl_version', 'fixed_string', size=8),
+        FieldDescriptor('trade_date', 'u32'),
+        FieldDescriptor('q_size', 'u32'),
+    )
     def __init__(self):
         self.sender_comp_id = ''
         self.target_comp_id = ''
@@ -30,6 +45,14 @@ class Logon(BinaryCodec):
         self.trade_date = 0
         self.q_size = 0
     
+    def reset(self):
+        self.sender_comp_id = ''
+        self.target_comp_id = ''
+        self.heart_bt_int = 0
+        self.prtcl_version = ''
+        self.trade_date = 0
+        self.q_size = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.sender_comp_id, 32, 'utf-8')
         write_fixed_string(buffer, self.target_comp_id, 32, 'utf-8')
@@ -38,7 +61,7 @@ class Logon(BinaryCodec):
         buffer.write_u32(self.trade_date)
         buffer.write_u32(self.q_size)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.sender_comp_id = read_fixed_string(buffer, 32, 'utf-8')
         self.target_comp_id = read_fixed_string(buffer, 32, 'utf-8')
         self.heart_bt_int = buffer.read_u16()
@@ -62,15 +85,24 @@ class Logon(BinaryCodec):
 
 
 class Logout(BinaryCodec):
+    __slots__ = ("session_status", "text")
+    _fields = (
+        FieldDescriptor('session_status', 'u32'),
+        FieldDescriptor('text', 'fixed_string', size=64),
+    )
     def __init__(self):
         self.session_status = 0
         self.text = ''
     
+    def reset(self):
+        self.session_status = 0
+        self.text = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u32(self.session_status)
         write_fixed_string(buffer, self.text, 64, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.session_status = buffer.read_u32()
         self.text = read_fixed_string(buffer, 64, 'utf-8')
     
@@ -86,6 +118,25 @@ class Logout(BinaryCodec):
 
 
 class NewOrderSingle(BinaryCodec):
+    __slots__ = ("biz_id", "biz_pbu", "cl_ord_id", "security_id", "account", "owner_type", "side", "price", "order_qty", "ord_type", "time_in_force", "transact_time", "credit_tag", "clearing_firm", "branch_id", "user_info")
+    _fields = (
+        FieldDescriptor('biz_id', 'u32'),
+        FieldDescriptor('biz_pbu', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('security_id', 'fixed_string', size=12),
+        FieldDescriptor('account', 'fixed_string', size=13),
+        FieldDescriptor('owner_type', 'u8'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('price', 'i64'),
+        FieldDescriptor('order_qty', 'i64'),
+        FieldDescriptor('ord_type', 'fixed_string', size=1),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('transact_time', 'u64'),
+        FieldDescriptor('credit_tag', 'fixed_string', size=2),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=8),
+        FieldDescriptor('branch_id', 'fixed_string', size=8),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+    )
     def __init__(self):
         self.biz_id = 0
         self.biz_pbu = ''
@@ -104,6 +155,24 @@ class NewOrderSingle(BinaryCodec):
         self.branch_id = ''
         self.user_info = ''
     
+    def reset(self):
+        self.biz_id = 0
+        self.biz_pbu = ''
+        self.cl_ord_id = ''
+        self.security_id = ''
+        self.account = ''
+        self.owner_type = 0
+        self.side = ''
+        self.price = 0
+        self.order_qty = 0
+        self.ord_type = ''
+        self.time_in_force = ''
+        self.transact_time = 0
+        self.credit_tag = ''
+        self.clearing_firm = ''
+        self.branch_id = ''
+        self.user_info = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u32(self.biz_id)
         write_fixed_string(buffer, self.biz_pbu, 8, 'utf-8')
@@ -122,7 +191,7 @@ class NewOrderSingle(BinaryCodec):
         write_fixed_string(buffer, self.branch_id, 8, 'utf-8')
         write_fixed_string(buffer, self.user_info, 32, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.biz_id = buffer.read_u32()
         self.biz_pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.cl_ord_id = read_fixed_string(buffer, 10, 'utf-8')
@@ -166,6 +235,20 @@ class NewOrderSingle(BinaryCodec):
 
 
 class OrderCancel(BinaryCodec):
+    __slots__ = ("biz_id", "biz_pbu", "cl_ord_id", "security_id", "account", "owner_type", "side", "orig_cl_ord_id", "transact_time", "branch_id", "user_info")
+    _fields = (
+        FieldDescriptor('biz_id', 'u32'),
+        FieldDescriptor('biz_pbu', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('security_id', 'fixed_string', size=12),
+        FieldDescriptor('account', 'fixed_string', size=13),
+        FieldDescriptor('owner_type', 'u8'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('transact_time', 'u64'),
+        FieldDescriptor('branch_id', 'fixed_string', size=8),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+    )
     def __init__(self):
         self.biz_id = 0
         self.biz_pbu = ''
@@ -179,6 +262,19 @@ class OrderCancel(BinaryCodec):
         self.branch_id = ''
         self.user_info = ''
     
+    def reset(self):
+        self.biz_id = 0
+        self.biz_pbu = ''
+        self.cl_ord_id = ''
+        self.security_id = ''
+        self.account = ''
+        self.owner_type = 0
+        self.side = ''
+        self.orig_cl_ord_id = ''
+        self.transact_time = 0
+        self.branch_id = ''
+        self.user_info = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u32(self.biz_id)
         write_fixed_string(buffer, self.biz_pbu, 8, 'utf-8')
@@ -192,7 +288,7 @@ class OrderCancel(BinaryCodec):
         write_fixed_string(buffer, self.branch_id, 8, 'utf-8')
         write_fixed_string(buffer, self.user_info, 32, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.biz_id = buffer.read_u32()
         self.biz_pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.cl_ord_id = read_fixed_string(buffer, 10, 'utf-8')
@@ -226,6 +322,37 @@ class OrderCancel(BinaryCodec):
 
 
 class Confirm(BinaryCodec):
+    __slots__ = ("pbu", "set_id", "report_index", "biz_id", "exec_type", "biz_pbu", "cl_ord_id", "security_id", "account", "owner_type", "side", "price", "order_qty", "leaves_qty", "cxl_qty", "ord_type", "time_in_force", "ord_status", "credit_tag", "orig_cl_ord_id", "clearing_firm", "branch_id", "ord_rej_reason", "ord_cnfm_id", "orig_ord_cnfm_id", "trade_date", "transact_time", "user_info")
+    _fields = (
+        FieldDescriptor('pbu', 'fixed_string', size=8),
+        FieldDescriptor('set_id', 'u32'),
+        FieldDescriptor('report_index', 'u64'),
+        FieldDescriptor('biz_id', 'u32'),
+        FieldDescriptor('exec_type', 'fixed_string', size=1),
+        FieldDescriptor('biz_pbu', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('security_id', 'fixed_string', size=12),
+        FieldDescriptor('account', 'fixed_string', size=13),
+        FieldDescriptor('owner_type', 'u8'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('price', 'i64'),
+        FieldDescriptor('order_qty', 'i64'),
+        FieldDescriptor('leaves_qty', 'i64'),
+        FieldDescriptor('cxl_qty', 'i64'),
+        FieldDescriptor('ord_type', 'fixed_string', size=1),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+        FieldDescriptor('credit_tag', 'fixed_string', size=2),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=8),
+        FieldDescriptor('branch_id', 'fixed_string', size=8),
+        FieldDescriptor('ord_rej_reason', 'u32'),
+        FieldDescriptor('ord_cnfm_id', 'fixed_string', size=16),
+        FieldDescriptor('orig_ord_cnfm_id', 'fixed_string', size=16),
+        FieldDescriptor('trade_date', 'u32'),
+        FieldDescriptor('transact_time', 'u64'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+    )
     def __init__(self):
         self.pbu = ''
         self.set_id = 0
@@ -256,6 +383,36 @@ class Confirm(BinaryCodec):
         self.transact_time = 0
         self.user_info = ''
     
+    def reset(self):
+        self.pbu = ''
+        self.set_id = 0
+        self.report_index = 0
+        self.biz_id = 0
+        self.exec_type = ''
+        self.biz_pbu = ''
+        self.cl_ord_id = ''
+        self.security_id = ''
+        self.account = ''
+        self.owner_type = 0
+        self.side = ''
+        self.price = 0
+        self.order_qty = 0
+        self.leaves_qty = 0
+        self.cxl_qty = 0
+        self.ord_type = ''
+        self.time_in_force = ''
+        self.ord_status = ''
+        self.credit_tag = ''
+        self.orig_cl_ord_id = ''
+        self.clearing_firm = ''
+        self.branch_id = ''
+        self.ord_rej_reason = 0
+        self.ord_cnfm_id = ''
+        self.orig_ord_cnfm_id = ''
+        self.trade_date = 0
+        self.transact_time = 0
+        self.user_info = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.pbu, 8, 'utf-8')
         buffer.write_u32(self.set_id)
@@ -286,7 +443,7 @@ class Confirm(BinaryCodec):
         buffer.write_u64(self.transact_time)
         write_fixed_string(buffer, self.user_info, 32, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.set_id = buffer.read_u32()
         self.report_index = buffer.read_u64()
@@ -354,6 +511,22 @@ class Confirm(BinaryCodec):
 
 
 class CancelReject(BinaryCodec):
+    __slots__ = ("pbu", "set_id", "report_index", "biz_id", "biz_pbu", "cl_ord_id", "security_id", "orig_cl_ord_id", "branch_id", "cxl_rej_reason", "trade_date", "transact_time", "user_info")
+    _fields = (
+        FieldDescriptor('pbu', 'fixed_string', size=8),
+        FieldDescriptor('set_id', 'u32'),
+        FieldDescriptor('report_index', 'u64'),
+        FieldDescriptor('biz_id', 'u32'),
+        FieldDescriptor('biz_pbu', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('security_id', 'fixed_string', size=12),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('branch_id', 'fixed_string', size=8),
+        FieldDescriptor('cxl_rej_reason', 'u32'),
+        FieldDescriptor('trade_date', 'u32'),
+        FieldDescriptor('transact_time', 'u64'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+    )
     def __init__(self):
         self.pbu = ''
         self.set_id = 0
@@ -369,6 +542,21 @@ class CancelReject(BinaryCodec):
         self.transact_time = 0
         self.user_info = ''
     
+    def reset(self):
+        self.pbu = ''
+        self.set_id = 0
+        self.report_index = 0
+        self.biz_id = 0
+        self.biz_pbu = ''
+        self.cl_ord_id = ''
+        self.security_id = ''
+        self.orig_cl_ord_id = ''
+        self.branch_id = ''
+        self.cxl_rej_reason = 0
+        self.trade_date = 0
+        self.transact_time = 0
+        self.user_info = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.pbu, 8, 'utf-8')
         buffer.write_u32(self.set_id)
@@ -384,7 +572,7 @@ class CancelReject(BinaryCodec):
         buffer.write_u64(self.transact_time)
         write_fixed_string(buffer, self.user_info, 32, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.set_id = buffer.read_u32()
         self.report_index = buffer.read_u64()
@@ -422,6 +610,35 @@ class CancelReject(BinaryCodec):
 
 
 class Report(BinaryCodec):
+    __slots__ = ("pbu", "set_id", "report_index", "biz_id", "exec_type", "biz_pbu", "cl_ord_id", "security_id", "account", "owner_type", "order_entry_time", "last_px", "last_qty", "gross_trade_amt", "side", "order_qty", "leaves_qty", "ord_status", "credit_tag", "clearing_firm", "branch_id", "trd_cnfm_id", "ord_cnfm_id", "trade_date", "transact_time", "user_info")
+    _fields = (
+        FieldDescriptor('pbu', 'fixed_string', size=8),
+        FieldDescriptor('set_id', 'u32'),
+        FieldDescriptor('report_index', 'u64'),
+        FieldDescriptor('biz_id', 'u32'),
+        FieldDescriptor('exec_type', 'fixed_string', size=1),
+        FieldDescriptor('biz_pbu', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('security_id', 'fixed_string', size=12),
+        FieldDescriptor('account', 'fixed_string', size=13),
+        FieldDescriptor('owner_type', 'u8'),
+        FieldDescriptor('order_entry_time', 'u64'),
+        FieldDescriptor('last_px', 'i64'),
+        FieldDescriptor('last_qty', 'i64'),
+        FieldDescriptor('gross_trade_amt', 'i64'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('order_qty', 'i64'),
+        FieldDescriptor('leaves_qty', 'i64'),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+        FieldDescriptor('credit_tag', 'fixed_string', size=2),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=8),
+        FieldDescriptor('branch_id', 'fixed_string', size=8),
+        FieldDescriptor('trd_cnfm_id', 'fixed_string', size=16),
+        FieldDescriptor('ord_cnfm_id', 'fixed_string', size=16),
+        FieldDescriptor('trade_date', 'u32'),
+        FieldDescriptor('transact_time', 'u64'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+    )
     def __init__(self):
         self.pbu = ''
         self.set_id = 0
@@ -450,6 +667,34 @@ class Report(BinaryCodec):
         self.transact_time = 0
         self.user_info = ''
     
+    def reset(self):
+        self.pbu = ''
+        self.set_id = 0
+        self.report_index = 0
+        self.biz_id = 0
+        self.exec_type = ''
+        self.biz_pbu = ''
+        self.cl_ord_id = ''
+        self.security_id = ''
+        self.account = ''
+        self.owner_type = 0
+        self.order_entry_time = 0
+        self.last_px = 0
+        self.last_qty = 0
+        self.gross_trade_amt = 0
+        self.side = ''
+        self.order_qty = 0
+        self.leaves_qty = 0
+        self.ord_status = ''
+        self.credit_tag = ''
+        self.clearing_firm = ''
+        self.branch_id = ''
+        self.trd_cnfm_id = ''
+        self.ord_cnfm_id = ''
+        self.trade_date = 0
+        self.transact_time = 0
+        self.user_info = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.pbu, 8, 'utf-8')
         buffer.write_u32(self.set_id)
@@ -478,7 +723,7 @@ class Report(BinaryCodec):
         buffer.write_u64(self.transact_time)
         write_fixed_string(buffer, self.user_info, 32, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.set_id = buffer.read_u32()
         self.report_index = buffer.read_u64()
@@ -542,6 +787,17 @@ class Report(BinaryCodec):
 
 
 class OrderReject(BinaryCodec):
+    __slots__ = ("biz_id", "biz_pbu", "cl_ord_id", "security_id", "ord_rej_reason", "trade_date", "transact_time", "user_info")
+    _fields = (
+        FieldDescriptor('biz_id', 'u32'),
+        FieldDescriptor('biz_pbu', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('security_id', 'fixed_string', size=12),
+        FieldDescriptor('ord_rej_reason', 'u32'),
+        FieldDescriptor('trade_date', 'u32'),
+        FieldDescriptor('transact_time', 'u64'),
+        FieldDescriptor('user_info', 'fixed_string', size=32),
+    )
     def __init__(self):
         self.biz_id = 0
         self.biz_pbu = ''
@@ -552,6 +808,16 @@ class OrderReject(BinaryCodec):
         self.transact_time = 0
         self.user_info = ''
     
+    def reset(self):
+        self.biz_id = 0
+        self.biz_pbu = ''
+        self.cl_ord_id = ''
+        self.security_id = ''
+        self.ord_rej_reason = 0
+        self.trade_date = 0
+        self.transact_time = 0
+        self.user_info = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u32(self.biz_id)
         write_fixed_string(buffer, self.biz_pbu, 8, 'utf-8')
@@ -562,7 +828,7 @@ class OrderReject(BinaryCodec):
         buffer.write_u64(self.transact_time)
         write_fixed_string(buffer, self.user_info, 32, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.biz_id = buffer.read_u32()
         self.biz_pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.cl_ord_id = read_fixed_string(buffer, 10, 'utf-8')
@@ -590,15 +856,24 @@ class OrderReject(BinaryCodec):
 
 
 class PlatformState(BinaryCodec):
+    __slots__ = ("platform_id", "platform_state")
+    _fields = (
+        FieldDescriptor('platform_id', 'u16'),
+        FieldDescriptor('platform_state', 'u16'),
+    )
     def __init__(self):
         self.platform_id = 0
         self.platform_state = 0
     
+    def reset(self):
+        self.platform_id = 0
+        self.platform_state = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16(self.platform_id)
         buffer.write_u16(self.platform_state)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.platform_id = buffer.read_u16()
         self.platform_state = buffer.read_u16()
     
@@ -614,11 +889,22 @@ class PlatformState(BinaryCodec):
 
 
 class ExecRptInfo(BinaryCodec):
+    __slots__ = ("platform_id", "pbu", "set_id")
+    _fields = (
+        FieldDescriptor('platform_id', 'u16'),
+        FieldDescriptor('pbu', 'list', length_type='u16', element=FieldDescriptor(None, 'fixed_string', size=8)),
+        FieldDescriptor('set_id', 'list', length_type='u16', element=FieldDescriptor(None, 'u32')),
+    )
     def __init__(self):
         self.platform_id = 0
         self.pbu = []
         self.set_id = []
     
+    def reset(self):
+        self.platform_id = 0
+        self.pbu = []
+        self.set_id = []
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16(self.platform_id)
         size = len(self.pbu)
@@ -628,19 +914,18 @@ class ExecRptInfo(BinaryCodec):
         
         size = len(self.set_id)
         buffer.write_u16(size)
-        for i in range(size):
-            buffer.write_u32(self.set_id[i])
+        buffer.write_u32_array(self.set_id)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.platform_id = buffer.read_u16()
         size = read_len(buffer, 'u16')
+        self.pbu = []
         for i in range(size):
             self.pbu.append(read_fixed_string(buffer,  8, 'utf-8'))
         
         size = read_len(buffer, 'u16')
-        for i in range(size):
-            self.set_id.append(buffer.read_u32())
+        self.set_id = buffer.read_u32_array(size)
         
     
     def __eq__(self, other):
@@ -656,17 +941,28 @@ class ExecRptInfo(BinaryCodec):
 
 
 class SubExecRptSync(BinaryCodec):
+    __slots__ = ("pbu", "set_id", "begin_report_index")
+    _fields = (
+        FieldDescriptor('pbu', 'fixed_string', size=8),
+        FieldDescriptor('set_id', 'u32'),
+        FieldDescriptor('begin_report_index', 'u64'),
+    )
     def __init__(self):
         self.pbu = ''
         self.set_id = 0
         self.begin_report_index = 0
     
+    def reset(self):
+        self.pbu = ''
+        self.set_id = 0
+        self.begin_report_index = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.pbu, 8, 'utf-8')
         buffer.write_u32(self.set_id)
         buffer.write_u64(self.begin_report_index)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.set_id = buffer.read_u32()
         self.begin_report_index = buffer.read_u64()
@@ -683,9 +979,16 @@ class SubExecRptSync(BinaryCodec):
     
 
 class ExecRptSync(BinaryCodec):
+    __slots__ = ("sub_exec_rpt_sync",)
+    _fields = (
+        FieldDescriptor('sub_exec_rpt_sync', 'list', length_type='u16', element=FieldDescriptor(None, 'message', message_class='SubExecRptSync')),
+    )
     def __init__(self):
         self.sub_exec_rpt_sync = []
     
+    def reset(self):
+        self.sub_exec_rpt_sync = []
+    
     def encode(self, buffer: ByteBuf):
         size = len(self.sub_exec_rpt_sync)
         buffer.write_u16(size)
@@ -693,8 +996,9 @@ class ExecRptSync(BinaryCodec):
             self.sub_exec_rpt_sync[i].encode(buffer)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         size = read_len(buffer, 'u16')
+        self.sub_exec_rpt_sync = []
         for i in range(size):
             _sub_exec_rpt_sync = SubExecRptSync()
             _sub_exec_rpt_sync.decode(buffer)
@@ -712,6 +1016,15 @@ class ExecRptSync(BinaryCodec):
 
 
 class SubExecRptSyncRsp(BinaryCodec):
+    __slots__ = ("pbu", "set_id", "begin_report_index", "end_report_index", "rej_reason", "text")
+    _fields = (
+        FieldDescriptor('pbu', 'fixed_string', size=8),
+        FieldDescriptor('set_id', 'u32'),
+        FieldDescriptor('begin_report_index', 'u64'),
+        FieldDescriptor('end_report_index', 'u64'),
+        FieldDescriptor('rej_reason', 'u32'),
+        FieldDescriptor('text', 'fixed_string', size=64),
+    )
     def __init__(self):
         self.pbu = ''
         self.set_id = 0
@@ -720,6 +1033,14 @@ class SubExecRptSyncRsp(BinaryCodec):
         self.rej_reason = 0
         self.text = ''
     
+    def reset(self):
+        self.pbu = ''
+        self.set_id = 0
+        self.begin_report_index = 0
+        self.end_report_index = 0
+        self.rej_reason = 0
+        self.text = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.pbu, 8, 'utf-8')
         buffer.write_u32(self.set_id)
@@ -728,7 +1049,7 @@ class SubExecRptSyncRsp(BinaryCodec):
         buffer.write_u32(self.rej_reason)
         write_fixed_string(buffer, self.text, 64, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.set_id = buffer.read_u32()
         self.begin_report_index = buffer.read_u64()
@@ -751,9 +1072,16 @@ class SubExecRptSyncRsp(BinaryCodec):
     
 
 class ExecRptSyncRsp(BinaryCodec):
+    __slots__ = ("sub_exec_rpt_sync_rsp",)
+    _fields = (
+        FieldDescriptor('sub_exec_rpt_sync_rsp', 'list', length_type='u16', element=FieldDescriptor(None, 'message', message_class='SubExecRptSyncRsp')),
+    )
     def __init__(self):
         self.sub_exec_rpt_sync_rsp = []
     
+    def reset(self):
+        self.sub_exec_rpt_sync_rsp = []
+    
     def encode(self, buffer: ByteBuf):
         size = len(self.sub_exec_rpt_sync_rsp)
         buffer.write_u16(size)
@@ -761,8 +1089,9 @@ class ExecRptSyncRsp(BinaryCodec):
             self.sub_exec_rpt_sync_rsp[i].encode(buffer)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         size = read_len(buffer, 'u16')
+        self.sub_exec_rpt_sync_rsp = []
         for i in range(size):
             _sub_exec_rpt_sync_rsp = SubExecRptSyncRsp()
             _sub_exec_rpt_sync_rsp.decode(buffer)
@@ -780,17 +1109,28 @@ class ExecRptSyncRsp(BinaryCodec):
 
 
 class ExecRptEndOfStream(BinaryCodec):
+    __slots__ = ("pbu", "set_id", "end_report_index")
+    _fields = (
+        FieldDescriptor('pbu', 'fixed_string', size=8),
+        FieldDescriptor('set_id', 'u32'),
+        FieldDescriptor('end_report_index', 'u64'),
+    )
     def __init__(self):
         self.pbu = ''
         self.set_id = 0
         self.end_report_index = 0
     
+    def reset(self):
+        self.pbu = ''
+        self.set_id = 0
+        self.end_report_index = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.pbu, 8, 'utf-8')
         buffer.write_u32(self.set_id)
         buffer.write_u64(self.end_report_index)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.pbu = read_fixed_string(buffer, 8, 'utf-8')
         self.set_id = buffer.read_u32()
         self.end_report_index = buffer.read_u64()
@@ -826,14 +1166,37 @@ sseBinaryMessageFactory.register(210, ExecRptEndOfStream)
 
 
 class SseBinary(BinaryCodec):
+    __slots__ = ("msg_type", "msg_seq_num", "msg_body_len", "body", "checksum", "checksum_valid", "body_cache")
+    _fields = (
+        FieldDescriptor('msg_type', 'u32'),
+        FieldDescriptor('msg_seq_num', 'u64'),
+        FieldDescriptor('msg_body_len', 'u32'),
+        FieldDescriptor('body', 'message', factory='sseBinaryMessageFactory', factory_key='msg_type'),
+        FieldDescriptor('checksum', 'u32'),
+    )
+    frame_layout = FrameLayout(12, ">I", 16, ">I")
+    checksum_service = create_checksum_service("SSE_BIN")
+    checksum_verifier = ChecksumVerifier(checksum_service)
+
     def __init__(self):
         self.msg_type = 0
         self.msg_seq_num = 0
         self.msg_body_len = 0
         self.body = None
         self.checksum = 0
+        self.checksum_valid = None
+        self.body_cache = None
+    
+    def reset(self):
+        self.msg_type = 0
+        self.msg_seq_num = 0
+        self.msg_body_len = 0
+        self.body = None
+        self.checksum = 0
+        self.checksum_valid = None
     
     def encode(self, buffer: ByteBuf):
+        frame_start = buffer.write_index
         buffer.write_u32(self.msg_type)
         buffer.write_u64(self.msg_seq_num)
         msg_body_len_pos = buffer.write_index
@@ -843,17 +1206,31 @@ class SseBinary(BinaryCodec):
         body_end = buffer.write_index
         self.msg_body_len = body_end - body_start
         buffer.write_u32_at(msg_body_len_pos, self.msg_body_len)
-        service = create_checksum_service("SSE_BIN")
+        service = self.checksum_service
         if service :
-            self.checksum = service.calc(buffer)
+            self.checksum = service.calc_range(buffer, frame_start, buffer.write_index)
         buffer.write_u32(self.checksum)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
+        checksum_valid = self.checksum_verifier.verify_next(buffer, self.frame_layout)
+        self._decode_frame(buffer, reuse_body)
+        self.checksum_valid = checksum_valid
+
+    @classmethod
+    def decode_batch(cls, buffer: ByteBuf) -> list:
+        return decode_frames(cls, buffer)
+    
+    def _decode_frame(self, buffer: ByteBuf, reuse_body: bool = False):
         self.msg_type = buffer.read_u32()
         self.msg_seq_num = buffer.read_u64()
         self.msg_body_len = buffer.read_u32()
-        self.body = sseBinaryMessageFactory.create(self.msg_type)
-        self.body.decode(buffer)
+        if reuse_body:
+            if self.body_cache is None:
+                self.body_cache = {}
+            self.body = sseBinaryMessageFactory.create_cached(self.msg_type, self.body_cache)
+        else:
+            self.body = sseBinaryMessageFactory.create(self.msg_type)
+        self.body.decode(buffer.read_verified_slice(self.msg_body_len), reuse_body)
         self.checksum = buffer.read_u32()
     
     def __eq__(self, other):
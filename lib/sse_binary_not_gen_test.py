@@ -1,6 +1,8 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
 import unittest
 
+from checksum import ChecksumError, ChecksumPolicy, ChecksumVerifier
 from sse_binary import *
 
 class TestSseBinaryNotGen(unittest.TestCase):
@@ -19,6 +21,17 @@ class TestSseBinaryNotGen(unittest.TestCase):
         self.packet.msg_type = 40
         self.packet.body = body
         self.packet.checksum = 4
+        self.verifier = SseBinary.checksum_verifier
+        SseBinary.checksum_verifier = ChecksumVerifier(self.verifier.service)
+
+    def tearDown(self):
+        SseBinary.checksum_verifier = self.verifier
+
+    def corrupted_frame(self):
+        buf = ByteBuf()
+        self.packet.encode(buf)
+        buf.buf[20] ^= 0x01
+        return buf
         
 
     def test_encode_decode(self):
@@ -28,7 +41,200 @@ class TestSseBinaryNotGen(unittest.TestCase):
         decoded_packet.decode(buf)
         self.assertEqual(decoded_packet, self.packet)
 
+    def test_decode_zero_copy(self):
+        buf = ByteBuf()
+        self.packet.encode(buf)
+        decoded_packet = SseBinary()
+        decoded_packet.decode(ByteBuf(bytes(buf.to_bytes()), zero_copy=True))
+        self.assertEqual(decoded_packet, self.packet)
+
+
+    def test_body_cannot_overrun_trailer(self):
+        buf = ByteBuf()
+        self.packet.encode(buf)
+        buf.write_u32_at(12, self.packet.msg_body_len - 1)
+        with self.assertRaises(Exception):
+            SseBinary().decode(buf)
+
+    def test_body_length_skips_unknown_trailing_body_bytes(self):
+        buf = ByteBuf()
+        buf.write_u32(33)
+        buf.write_u64(1)
+        buf.write_u32(3)
+        buf.write_bytes(b"abc")
+        buf.write_u32(7)
+        decoded_packet = SseBinary()
+        decoded_packet.decode(buf)
+        self.assertEqual(Heartbeat(), decoded_packet.body)
+        self.assertEqual(7, decoded_packet.checksum)
+
+    def test_checksum_covers_own_frame_only(self):
+        single = ByteBuf()
+        self.packet.encode(single)
+        expected = self.packet.checksum
+        stream = ByteBuf()
+        stream.write_bytes(b"\xff" * 16)
+        for _ in range(3):
+            self.packet.encode(stream)
+            self.assertEqual(expected, self.packet.checksum)
+        stream.skip_bytes(16)
+        for _ in range(3):
+            decoded_packet = SseBinary()
+            decoded_packet.decode(stream)
+            self.assertEqual(expected, decoded_packet.checksum)
+
+
+    def test_decode_flags_checksum(self):
+        buf = ByteBuf()
+        self.packet.encode(buf)
+        decoded_packet = SseBinary()
+        decoded_packet.decode(buf)
+        self.assertTrue(decoded_packet.checksum_valid)
+        decoded_packet = SseBinary()
+        decoded_packet.decode(self.corrupted_frame())
+        self.assertFalse(decoded_packet.checksum_valid)
+        self.assertEqual(0, SseBinary.checksum_verifier.failures)
+
+    def test_decode_counts_checksum_failures(self):
+        SseBinary.checksum_verifier.policy = ChecksumPolicy.COUNT
+        for _ in range(2):
+            SseBinary().decode(self.corrupted_frame())
+        self.assertEqual(2, SseBinary.checksum_verifier.failures)
+
+    def test_decode_raises_on_checksum_mismatch(self):
+        SseBinary.checksum_verifier.policy = ChecksumPolicy.RAISE
+        with self.assertRaises(ChecksumError):
+            SseBinary().decode(self.corrupted_frame())
+
+    def test_decode_raises_before_consuming(self):
+        SseBinary.checksum_verifier.policy = ChecksumPolicy.RAISE
+        buf = self.corrupted_frame()
+        with self.assertRaises(ChecksumError):
+            SseBinary().decode(buf)
+        self.assertEqual(0, buf.read_index)
+
+    def test_decode_verifies_ring_and_composite_buffers(self):
+        from bytebuf import CompositeByteBuf, RingByteBuf
+
+        good = bytes(self.corrupted_frame().to_bytes())
+        good = good[:-1] + bytes([good[-1] ^ 0x01])
+        bad = bytes(self.corrupted_frame().to_bytes())
+        ring = RingByteBuf(len(good) + 7)
+        ring.write_bytes(bytes(7))
+        ring.skip_bytes(7)
+        for data, checksum_valid in ((good, True), (bad, False)):
+            composite = CompositeByteBuf([data[:5], data[5:20], data[20:]])
+            ring.write_bytes(data)
+            for buf in (composite, ring):
+                decoded_packet = SseBinary()
+                decoded_packet.decode(buf)
+                self.assertEqual(checksum_valid, decoded_packet.checksum_valid)
+                self.assertEqual(0, buf.readable_bytes_len())
+        SseBinary.checksum_verifier.policy = ChecksumPolicy.RAISE
+        for buf in (CompositeByteBuf([bad[:5], bad[5:]]), RingByteBuf(len(bad))):
+            if isinstance(buf, RingByteBuf):
+                buf.write_bytes(bad)
+            with self.assertRaises(ChecksumError):
+                SseBinary().decode(buf)
+            self.assertEqual(len(bad), buf.readable_bytes_len())
+
+    def test_decode_ignores_checksum(self):
+        SseBinary.checksum_verifier.policy = ChecksumPolicy.IGNORE
+        decoded_packet = SseBinary()
+        decoded_packet.decode(self.corrupted_frame())
+        self.assertIsNone(decoded_packet.checksum_valid)
+
+    def test_decode_reuse_body(self):
+        stream = ByteBuf()
+        for seq in range(3):
+            self.packet.msg_seq_num = seq
+            self.packet.encode(stream)
+        decoded_packet = SseBinary()
+        bodies = []
+        for seq in range(3):
+            decoded_packet.decode(stream, reuse_body=True)
+            bodies.append(decoded_packet.body)
+            self.assertEqual(seq, decoded_packet.msg_seq_num)
+            self.assertEqual(self.packet.body, decoded_packet.body)
+        self.assertTrue(all(body is bodies[0] for body in bodies))
+        stream.read_index = 0
+        fresh = SseBinary()
+        fresh.decode(stream)
+        self.assertIsNot(bodies[0], fresh.body)
+        self.assertEqual(bodies[0], self.packet.body)
+
+    def test_decode_reuse_body_per_msg_type(self):
+        stream = ByteBuf()
+        self.packet.encode(stream)
+        heartbeat = SseBinary()
+        heartbeat.msg_type = 33
+        heartbeat.body = Heartbeat()
+        heartbeat.encode(stream)
+        self.packet.encode(stream)
+        decoded_packet = SseBinary()
+        bodies = []
+        for _ in range(3):
+            decoded_packet.decode(stream, reuse_body=True)
+            bodies.append(decoded_packet.body)
+        self.assertIsInstance(bodies[1], Heartbeat)
+        self.assertIs(bodies[0], bodies[2])
+        self.assertEqual(self.packet.body, bodies[2])
+
+    def test_reset(self):
+        decoded_packet = SseBinary()
+        buf = ByteBuf()
+        self.packet.encode(buf)
+        decoded_packet.decode(buf, reuse_body=True)
+        body = decoded_packet.body
+        body.reset()
+        self.assertEqual(Logon(), body)
+        decoded_packet.reset()
+        self.assertEqual(SseBinary(), decoded_packet)
+        self.assertIsNone(decoded_packet.checksum_valid)
+        buf.read_index = 0
+        decoded_packet.decode(buf, reuse_body=True)
+        self.assertIs(body, decoded_packet.body)
+
+    def test_decode_batch(self):
+        stream = ByteBuf()
+        for seq in range(3):
+            self.packet.msg_seq_num = seq
+            self.packet.encode(stream)
+        stream.buf[stream.write_index - 1] ^= 0x01
+        self.packet.encode(stream)
+        partial = stream.write_index
+        self.packet.encode(stream)
+        stream.write_index -= 1
+        packets = SseBinary.decode_batch(stream)
+        self.assertEqual([0, 1, 2, 2], [p.msg_seq_num for p in packets])
+        self.assertEqual([True, True, False, True], [p.checksum_valid for p in packets])
+        self.assertEqual(partial, stream.read_index)
+
+    def test_decode_frames_in_bounded_batches(self):
+        from codec import decode_frames
+
+        stream = ByteBuf()
+        for seq in range(5):
+            self.packet.msg_seq_num = seq
+            self.packet.encode(stream)
+        batches = []
+        while True:
+            packets = decode_frames(SseBinary, stream, 2)
+            batches.append([p.msg_seq_num for p in packets])
+            if len(packets) < 2:
+                break
+        self.assertEqual([[0, 1], [2, 3], [4]], batches)
+        self.assertEqual(0, stream.readable_bytes_len())
 
+    def test_decode_batch_raises_before_decoding(self):
+        SseBinary.checksum_verifier.policy = ChecksumPolicy.RAISE
+        stream = ByteBuf()
+        self.packet.encode(stream)
+        corrupted = self.corrupted_frame()
+        stream.write_bytes(corrupted.to_bytes())
+        with self.assertRaises(ChecksumError):
+            SseBinary.decode_batch(stream)
+        self.assertEqual(0, stream.read_index)
 
 
 if __name__ == '__main__':
@@ -1,10 +1,19 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
 from bytebuf import ByteBuf
-from checksum import create_checksum_service
+from checksum import ChecksumVerifier, create_checksum_service
 from message_factory import MessageFactory
 from codec import *
 
 class Logon(BinaryCodec):
+    __slots__ = ("sender_comp_id", "target_comp_id", "heart_btint", "password", "default_appl_ver_id")
+    _fields = (
+        FieldDescriptor('sender_comp_id', 'fixed_string', size=20),
+        FieldDescriptor('target_comp_id', 'fixed_string', size=20),
+        FieldDescriptor('heart_btint', 'i32'),
+        FieldDescriptor('password', 'fixed_string', size=16),
+        FieldDescriptor('default_appl_ver_id', 'fixed_string', size=32),
+    )
     def __init__(self):
         self.sender_comp_id = ''
         self.target_comp_id = ''
@@ -12,6 +21,13 @@ class Logon(BinaryCodec):
         self.password = ''
         self.default_appl_ver_id = ''
     
+    def reset(self):
+        self.sender_comp_id = ''
+        self.target_comp_id = ''
+        self.heart_btint = 0
+        self.password = ''
+        self.default_appl_ver_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.sender_comp_id, 20, 'utf-8')
         write_fixed_string(buffer, self.target_comp_id, 20, 'utf-8')
@@ -19,7 +35,7 @@ class Logon(BinaryCodec):
         write_fixed_string(buffer, self.password, 16, 'utf-8')
         write_fixed_string(buffer, self.default_appl_ver_id, 32, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.sender_comp_id = read_fixed_string(buffer, 20, 'utf-8')
         self.target_comp_id = read_fixed_string(buffer, 20, 'utf-8')
         self.heart_btint = buffer.read_i32()
@@ -41,15 +57,24 @@ class Logon(BinaryCodec):
 
 
 class Logout(BinaryCodec):
+    __slots__ = ("session_status", "text")
+    _fields = (
+        FieldDescriptor('session_status', 'i32'),
+        FieldDescriptor('text', 'fixed_string', size=200),
+    )
     def __init__(self):
         self.session_status = 0
         self.text = ''
     
+    def reset(self):
+        self.session_status = 0
+        self.text = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32(self.session_status)
         write_fixed_string(buffer, self.text, 200, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.session_status = buffer.read_i32()
         self.text = read_fixed_string(buffer, 200, 'utf-8')
     
@@ -65,13 +90,18 @@ class Logout(BinaryCodec):
 
 
 class Heartbeat(BinaryCodec):
+    __slots__ = ()
+    _fields = ()
     def __init__(self):
         pass
     
+    def reset(self):
+        pass
+    
     def encode(self, buffer: ByteBuf):
         pass
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         pass
     
     def __eq__(self, other):
@@ -82,6 +112,14 @@ class Heartbeat(BinaryCodec):
 
 
 class Extend100101(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "cash_margin")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -89,6 +127,13 @@ class Extend100101(BinaryCodec):
         self.time_in_force = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
@@ -96,7 +141,7 @@ class Extend100101(BinaryCodec):
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -117,19 +162,32 @@ class Extend100101(BinaryCodec):
     
 
 class Extend100201(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
         self.max_price_levels = 0
         self.time_in_force = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
         buffer.write_u16(self.max_price_levels)
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -148,19 +206,32 @@ class Extend100201(BinaryCodec):
     
 
 class Extend100301(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
         self.max_price_levels = 0
         self.time_in_force = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
         buffer.write_u16(self.max_price_levels)
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -179,15 +250,24 @@ class Extend100301(BinaryCodec):
     
 
 class Extend100501(BinaryCodec):
+    __slots__ = ("confirm_id", "cash_margin")
+    _fields = (
+        FieldDescriptor('confirm_id', 'fixed_string', size=8),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.confirm_id = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.confirm_id = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.confirm_id, 8, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.confirm_id = read_fixed_string(buffer, 8, 'utf-8')
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
@@ -202,13 +282,20 @@ class Extend100501(BinaryCodec):
     
 
 class Extend100601(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -221,17 +308,28 @@ class Extend100601(BinaryCodec):
     
 
 class Extend100701(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16()
         self.expiration_type = buffer.read_u8()
         self.share_property = read_fixed_string(buffer, 2, 'utf-8')
@@ -248,13 +346,20 @@ class Extend100701(BinaryCodec):
     
 
 class Extend101501(BinaryCodec):
+    __slots__ = ("share_property",)
+    _fields = (
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.share_property = ''
     
+    def reset(self):
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.share_property = read_fixed_string(buffer, 2, 'utf-8')
     
     def __eq__(self, other):
@@ -267,13 +372,20 @@ class Extend101501(BinaryCodec):
     
 
 class Extend101601(BinaryCodec):
+    __slots__ = ("contract_account_code",)
+    _fields = (
+        FieldDescriptor('contract_account_code', 'fixed_string', size=6),
+    )
     def __init__(self):
         self.contract_account_code = ''
     
+    def reset(self):
+        self.contract_account_code = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.contract_account_code, 6, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.contract_account_code = read_fixed_string(buffer, 6, 'utf-8')
     
     def __eq__(self, other):
@@ -286,13 +398,20 @@ class Extend101601(BinaryCodec):
     
 
 class Extend101701(BinaryCodec):
+    __slots__ = ("cash_order_qty",)
+    _fields = (
+        FieldDescriptor('cash_order_qty', 'i64'),
+    )
     def __init__(self):
         self.cash_order_qty = 0
     
+    def reset(self):
+        self.cash_order_qty = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.cash_order_qty)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_order_qty = buffer.read_i64()
     
     def __eq__(self, other):
@@ -305,13 +424,20 @@ class Extend101701(BinaryCodec):
     
 
 class Extend101801(BinaryCodec):
+    __slots__ = ("tenderer",)
+    _fields = (
+        FieldDescriptor('tenderer', 'fixed_string', size=6),
+    )
     def __init__(self):
         self.tenderer = ''
     
+    def reset(self):
+        self.tenderer = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.tenderer, 6, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.tenderer = read_fixed_string(buffer, 6, 'utf-8')
     
     def __eq__(self, other):
@@ -324,15 +450,24 @@ class Extend101801(BinaryCodec):
     
 
 class Extend102701(BinaryCodec):
+    __slots__ = ("disposal_pbu", "disposal_account_id")
+    _fields = (
+        FieldDescriptor('disposal_pbu', 'fixed_string', size=6),
+        FieldDescriptor('disposal_account_id', 'fixed_string', size=12),
+    )
     def __init__(self):
         self.disposal_pbu = ''
         self.disposal_account_id = ''
     
+    def reset(self):
+        self.disposal_pbu = ''
+        self.disposal_account_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.disposal_pbu, 6, 'utf-8')
         write_fixed_string(buffer, self.disposal_account_id, 12, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.disposal_pbu = read_fixed_string(buffer, 6, 'utf-8')
         self.disposal_account_id = read_fixed_string(buffer, 12, 'utf-8')
     
@@ -347,15 +482,24 @@ class Extend102701(BinaryCodec):
     
 
 class Extend102801(BinaryCodec):
+    __slots__ = ("lender_pbu", "lender_account_id")
+    _fields = (
+        FieldDescriptor('lender_pbu', 'fixed_string', size=6),
+        FieldDescriptor('lender_account_id', 'fixed_string', size=12),
+    )
     def __init__(self):
         self.lender_pbu = ''
         self.lender_account_id = ''
     
+    def reset(self):
+        self.lender_pbu = ''
+        self.lender_account_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.lender_pbu, 6, 'utf-8')
         write_fixed_string(buffer, self.lender_account_id, 12, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.lender_pbu = read_fixed_string(buffer, 6, 'utf-8')
         self.lender_account_id = read_fixed_string(buffer, 12, 'utf-8')
     
@@ -370,15 +514,24 @@ class Extend102801(BinaryCodec):
     
 
 class Extend102901(BinaryCodec):
+    __slots__ = ("deduction_pbu", "deduction_account_id")
+    _fields = (
+        FieldDescriptor('deduction_pbu', 'fixed_string', size=6),
+        FieldDescriptor('deduction_account_id', 'fixed_string', size=12),
+    )
     def __init__(self):
         self.deduction_pbu = ''
         self.deduction_account_id = ''
     
+    def reset(self):
+        self.deduction_pbu = ''
+        self.deduction_account_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.deduction_pbu, 6, 'utf-8')
         write_fixed_string(buffer, self.deduction_account_id, 12, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.deduction_pbu = read_fixed_string(buffer, 6, 'utf-8')
         self.deduction_account_id = read_fixed_string(buffer, 12, 'utf-8')
     
@@ -393,6 +546,14 @@ class Extend102901(BinaryCodec):
     
 
 class Extend106301(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "lot_type")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('lot_type', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -400,6 +561,13 @@ class Extend106301(BinaryCodec):
         self.time_in_force = ''
         self.lot_type = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.lot_type = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
@@ -407,7 +575,7 @@ class Extend106301(BinaryCodec):
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
         write_fixed_string(buffer, self.lot_type, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -428,13 +596,20 @@ class Extend106301(BinaryCodec):
     
 
 class Extend103501(BinaryCodec):
+    __slots__ = ("contract_account_code",)
+    _fields = (
+        FieldDescriptor('contract_account_code', 'fixed_string', size=6),
+    )
     def __init__(self):
         self.contract_account_code = ''
     
+    def reset(self):
+        self.contract_account_code = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.contract_account_code, 6, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.contract_account_code = read_fixed_string(buffer, 6, 'utf-8')
     
     def __eq__(self, other):
@@ -447,13 +622,20 @@ class Extend103501(BinaryCodec):
     
 
 class Extend103701(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -466,6 +648,14 @@ class Extend103701(BinaryCodec):
     
 
 class Extend104101(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "cash_margin")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -473,6 +663,13 @@ class Extend104101(BinaryCodec):
         self.time_in_force = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
@@ -480,7 +677,7 @@ class Extend104101(BinaryCodec):
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -501,6 +698,26 @@ class Extend104101(BinaryCodec):
     
 
 class Extend104128(BinaryCodec):
+    __slots__ = ("member_id", "investor_type", "investor_id", "investor_name", "trader_code", "secondary_order_id", "bid_trans_type", "bid_exec_inst_type", "low_limit_price", "high_limit_price", "min_qty", "trade_date", "settl_type", "settl_period", "pre_trade_anonymity", "cash_margin", "memo")
+    _fields = (
+        FieldDescriptor('member_id', 'fixed_string', size=6),
+        FieldDescriptor('investor_type', 'fixed_string', size=2),
+        FieldDescriptor('investor_id', 'fixed_string', size=10),
+        FieldDescriptor('investor_name', 'fixed_string', size=120),
+        FieldDescriptor('trader_code', 'fixed_string', size=8),
+        FieldDescriptor('secondary_order_id', 'fixed_string', size=16),
+        FieldDescriptor('bid_trans_type', 'u16'),
+        FieldDescriptor('bid_exec_inst_type', 'u16'),
+        FieldDescriptor('low_limit_price', 'i64'),
+        FieldDescriptor('high_limit_price', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('trade_date', 'u32'),
+        FieldDescriptor('settl_type', 'u16'),
+        FieldDescriptor('settl_period', 'u8'),
+        FieldDescriptor('pre_trade_anonymity', 'u8'),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('memo', 'fixed_string', size=160),
+    )
     def __init__(self):
         self.member_id = ''
         self.investor_type = ''
@@ -520,6 +737,25 @@ class Extend104128(BinaryCodec):
         self.cash_margin = ''
         self.memo = ''
     
+    def reset(self):
+        self.member_id = ''
+        self.investor_type = ''
+        self.investor_id = ''
+        self.investor_name = ''
+        self.trader_code = ''
+        self.secondary_order_id = ''
+        self.bid_trans_type = 0
+        self.bid_exec_inst_type = 0
+        self.low_limit_price = 0
+        self.high_limit_price = 0
+        self.min_qty = 0
+        self.trade_date = 0
+        self.settl_type = 0
+        self.settl_period = 0
+        self.pre_trade_anonymity = 0
+        self.cash_margin = ''
+        self.memo = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.member_id, 6, 'utf-8')
         write_fixed_string(buffer, self.investor_type, 2, 'utf-8')
@@ -539,7 +775,7 @@ class Extend104128(BinaryCodec):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         write_fixed_string(buffer, self.memo, 160, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.member_id = read_fixed_string(buffer, 6, 'utf-8')
         self.investor_type = read_fixed_string(buffer, 2, 'utf-8')
         self.investor_id = read_fixed_string(buffer, 10, 'utf-8')
@@ -584,13 +820,20 @@ class Extend104128(BinaryCodec):
     
 
 class Extend104701(BinaryCodec):
+    __slots__ = ("secondary_order_id",)
+    _fields = (
+        FieldDescriptor('secondary_order_id', 'fixed_string', size=16),
+    )
     def __init__(self):
         self.secondary_order_id = ''
     
+    def reset(self):
+        self.secondary_order_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.secondary_order_id, 16, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.secondary_order_id = read_fixed_string(buffer, 16, 'utf-8')
     
     def __eq__(self, other):
@@ -635,6 +878,26 @@ newOrderMessageFactory.register("470", Extend104701)
 
 
 class NewOrder(BinaryCodec):
+    __slots__ = ("appl_id", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "cl_ord_id", "account_id", "branch_id", "order_restrictions", "side", "ord_type", "order_qty", "price", "appl_extend")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64'),
+        FieldDescriptor('user_info', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('account_id', 'fixed_string', size=12),
+        FieldDescriptor('branch_id', 'fixed_string', size=4),
+        FieldDescriptor('order_restrictions', 'fixed_string', size=4),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('ord_type', 'fixed_string', size=1),
+        FieldDescriptor('order_qty', 'i64'),
+        FieldDescriptor('price', 'i64'),
+        FieldDescriptor('appl_extend', 'message', factory='newOrderMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.appl_id = ''
         self.submitting_pbuid = ''
@@ -654,6 +917,25 @@ class NewOrder(BinaryCodec):
         self.price = 0
         self.appl_extend = None
     
+    def reset(self):
+        self.appl_id = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.cl_ord_id = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.order_restrictions = ''
+        self.side = ''
+        self.ord_type = ''
+        self.order_qty = 0
+        self.price = 0
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         write_fixed_string(buffer, self.submitting_pbuid, 6, 'utf-8')
@@ -674,7 +956,7 @@ class NewOrder(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.security_id = read_fixed_string(buffer, 8, 'utf-8')
@@ -691,8 +973,11 @@ class NewOrder(BinaryCodec):
         self.ord_type = read_fixed_string(buffer, 1, 'utf-8')
         self.order_qty = buffer.read_i64()
         self.price = buffer.read_i64()
-        self.appl_extend = newOrderMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = newOrderMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = newOrderMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -727,6 +1012,17 @@ class NewOrder(BinaryCodec):
 
 
 class Extend101401(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "position_effect", "covered_or_uncovered", "contract_account_code", "secondary_order_id")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('position_effect', 'fixed_string', size=1),
+        FieldDescriptor('covered_or_uncovered', 'u8'),
+        FieldDescriptor('contract_account_code', 'fixed_string', size=6),
+        FieldDescriptor('secondary_order_id', 'fixed_string', size=16),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -737,6 +1033,16 @@ class Extend101401(BinaryCodec):
         self.contract_account_code = ''
         self.secondary_order_id = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.position_effect = ''
+        self.covered_or_uncovered = 0
+        self.contract_account_code = ''
+        self.secondary_order_id = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
@@ -747,7 +1053,7 @@ class Extend101401(BinaryCodec):
         write_fixed_string(buffer, self.contract_account_code, 6, 'utf-8')
         write_fixed_string(buffer, self.secondary_order_id, 16, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -807,6 +1113,14 @@ class Extend101401(BinaryCodec):
 
 
 class Extend200102(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "cash_margin")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -814,6 +1128,13 @@ class Extend200102(BinaryCodec):
         self.time_in_force = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
@@ -821,7 +1142,7 @@ class Extend200102(BinaryCodec):
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -842,19 +1163,32 @@ class Extend200102(BinaryCodec):
     
 
 class Extend200202(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
         self.max_price_levels = 0
         self.time_in_force = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
         buffer.write_u16(self.max_price_levels)
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -873,19 +1207,32 @@ class Extend200202(BinaryCodec):
     
 
 class Extend200302(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
         self.max_price_levels = 0
         self.time_in_force = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
         buffer.write_u16(self.max_price_levels)
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -904,15 +1251,24 @@ class Extend200302(BinaryCodec):
     
 
 class Extend200502(BinaryCodec):
+    __slots__ = ("confirm_id", "cash_margin")
+    _fields = (
+        FieldDescriptor('confirm_id', 'fixed_string', size=8),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.confirm_id = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.confirm_id = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.confirm_id, 8, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.confirm_id = read_fixed_string(buffer, 8, 'utf-8')
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
@@ -927,13 +1283,20 @@ class Extend200502(BinaryCodec):
     
 
 class Extend200602(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -946,17 +1309,28 @@ class Extend200602(BinaryCodec):
     
 
 class Extend200702(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16()
         self.expiration_type = buffer.read_u8()
         self.share_property = read_fixed_string(buffer, 2, 'utf-8')
@@ -973,13 +1347,20 @@ class Extend200702(BinaryCodec):
     
 
 class Extend201502(BinaryCodec):
+    __slots__ = ("share_property",)
+    _fields = (
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.share_property = ''
     
+    def reset(self):
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.share_property = read_fixed_string(buffer, 2, 'utf-8')
     
     def __eq__(self, other):
@@ -992,13 +1373,20 @@ class Extend201502(BinaryCodec):
     
 
 class Extend201602(BinaryCodec):
+    __slots__ = ("contract_account_code",)
+    _fields = (
+        FieldDescriptor('contract_account_code', 'fixed_string', size=6),
+    )
     def __init__(self):
         self.contract_account_code = ''
     
+    def reset(self):
+        self.contract_account_code = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.contract_account_code, 6, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.contract_account_code = read_fixed_string(buffer, 6, 'utf-8')
     
     def __eq__(self, other):
@@ -1011,13 +1399,20 @@ class Extend201602(BinaryCodec):
     
 
 class Extend201702(BinaryCodec):
+    __slots__ = ("cash_order_qty",)
+    _fields = (
+        FieldDescriptor('cash_order_qty', 'i64'),
+    )
     def __init__(self):
         self.cash_order_qty = 0
     
+    def reset(self):
+        self.cash_order_qty = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.cash_order_qty)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_order_qty = buffer.read_i64()
     
     def __eq__(self, other):
@@ -1030,13 +1425,20 @@ class Extend201702(BinaryCodec):
     
 
 class Extend201802(BinaryCodec):
+    __slots__ = ("tenderer",)
+    _fields = (
+        FieldDescriptor('tenderer', 'fixed_string', size=6),
+    )
     def __init__(self):
         self.tenderer = ''
     
+    def reset(self):
+        self.tenderer = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.tenderer, 6, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.tenderer = read_fixed_string(buffer, 6, 'utf-8')
     
     def __eq__(self, other):
@@ -1049,15 +1451,24 @@ class Extend201802(BinaryCodec):
     
 
 class Extend202702(BinaryCodec):
+    __slots__ = ("disposal_pbu", "disposal_account_id")
+    _fields = (
+        FieldDescriptor('disposal_pbu', 'fixed_string', size=6),
+        FieldDescriptor('disposal_account_id', 'fixed_string', size=12),
+    )
     def __init__(self):
         self.disposal_pbu = ''
         self.disposal_account_id = ''
     
+    def reset(self):
+        self.disposal_pbu = ''
+        self.disposal_account_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.disposal_pbu, 6, 'utf-8')
         write_fixed_string(buffer, self.disposal_account_id, 12, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.disposal_pbu = read_fixed_string(buffer, 6, 'utf-8')
         self.disposal_account_id = read_fixed_string(buffer, 12, 'utf-8')
     
@@ -1072,15 +1483,24 @@ class Extend202702(BinaryCodec):
     
 
 class Extend202802(BinaryCodec):
+    __slots__ = ("lender_pbu", "lender_account_id")
+    _fields = (
+        FieldDescriptor('lender_pbu', 'fixed_string', size=6),
+        FieldDescriptor('lender_account_id', 'fixed_string', size=12),
+    )
     def __init__(self):
         self.lender_pbu = ''
         self.lender_account_id = ''
     
+    def reset(self):
+        self.lender_pbu = ''
+        self.lender_account_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.lender_pbu, 6, 'utf-8')
         write_fixed_string(buffer, self.lender_account_id, 12, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.lender_pbu = read_fixed_string(buffer, 6, 'utf-8')
         self.lender_account_id = read_fixed_string(buffer, 12, 'utf-8')
     
@@ -1095,15 +1515,24 @@ class Extend202802(BinaryCodec):
     
 
 class Extend202902(BinaryCodec):
+    __slots__ = ("deduction_pbu", "deduction_account_id")
+    _fields = (
+        FieldDescriptor('deduction_pbu', 'fixed_string', size=6),
+        FieldDescriptor('deduction_account_id', 'fixed_string', size=12),
+    )
     def __init__(self):
         self.deduction_pbu = ''
         self.deduction_account_id = ''
     
+    def reset(self):
+        self.deduction_pbu = ''
+        self.deduction_account_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.deduction_pbu, 6, 'utf-8')
         write_fixed_string(buffer, self.deduction_account_id, 12, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.deduction_pbu = read_fixed_string(buffer, 6, 'utf-8')
         self.deduction_account_id = read_fixed_string(buffer, 12, 'utf-8')
     
@@ -1118,6 +1547,17 @@ class Extend202902(BinaryCodec):
     
 
 class Extend206302(BinaryCodec):
+    __slots__ = ("reject_text", "stop_px", "min_qty", "max_price_levels", "time_in_force", "lot_type", "imc_reject_text_len", "imc_reject_text")
+    _fields = (
+        FieldDescriptor('reject_text', 'fixed_string', size=16),
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('lot_type', 'fixed_string', size=1),
+        FieldDescriptor('imc_reject_text_len', 'u32'),
+        FieldDescriptor('imc_reject_text', 'string', length_type='u32'),
+    )
     def __init__(self):
         self.reject_text = ''
         self.stop_px = 0
@@ -1128,6 +1568,16 @@ class Extend206302(BinaryCodec):
         self.imc_reject_text_len = 0
         self.imc_reject_text = ''
     
+    def reset(self):
+        self.reject_text = ''
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.lot_type = ''
+        self.imc_reject_text_len = 0
+        self.imc_reject_text = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.reject_text, 16, 'utf-8')
         buffer.write_i64(self.stop_px)
@@ -1138,7 +1588,7 @@ class Extend206302(BinaryCodec):
         buffer.write_u32(self.imc_reject_text_len)
         write_string(buffer, self.imc_reject_text, 'u32')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.reject_text = read_fixed_string(buffer, 16, 'utf-8')
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
@@ -1165,13 +1615,20 @@ class Extend206302(BinaryCodec):
     
 
 class Extend203502(BinaryCodec):
+    __slots__ = ("contract_account_code",)
+    _fields = (
+        FieldDescriptor('contract_account_code', 'fixed_string', size=6),
+    )
     def __init__(self):
         self.contract_account_code = ''
     
+    def reset(self):
+        self.contract_account_code = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.contract_account_code, 6, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.contract_account_code = read_fixed_string(buffer, 6, 'utf-8')
     
     def __eq__(self, other):
@@ -1184,13 +1641,20 @@ class Extend203502(BinaryCodec):
     
 
 class Extend203702(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -1203,6 +1667,14 @@ class Extend203702(BinaryCodec):
     
 
 class Extend204102(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "cash_margin")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -1210,6 +1682,13 @@ class Extend204102(BinaryCodec):
         self.time_in_force = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
@@ -1217,7 +1696,7 @@ class Extend204102(BinaryCodec):
         write_fixed_string(buffer, self.time_in_force, 1, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -1238,6 +1717,26 @@ class Extend204102(BinaryCodec):
     
 
 class Extend204129(BinaryCodec):
+    __slots__ = ("member_id", "investor_type", "investor_id", "investor_name", "trader_code", "secondary_order_id", "bid_trans_type", "bid_exec_inst_type", "low_limit_price", "high_limit_price", "min_qty", "trade_date", "settl_type", "settl_period", "pre_trade_anonymity", "cash_margin", "memo")
+    _fields = (
+        FieldDescriptor('member_id', 'fixed_string', size=6),
+        FieldDescriptor('investor_type', 'fixed_string', size=2),
+        FieldDescriptor('investor_id', 'fixed_string', size=10),
+        FieldDescriptor('investor_name', 'fixed_string', size=120),
+        FieldDescriptor('trader_code', 'fixed_string', size=8),
+        FieldDescriptor('secondary_order_id', 'fixed_string', size=16),
+        FieldDescriptor('bid_trans_type', 'u16'),
+        FieldDescriptor('bid_exec_inst_type', 'u16'),
+        FieldDescriptor('low_limit_price', 'i64'),
+        FieldDescriptor('high_limit_price', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('trade_date', 'u32'),
+        FieldDescriptor('settl_type', 'u16'),
+        FieldDescriptor('settl_period', 'u8'),
+        FieldDescriptor('pre_trade_anonymity', 'u8'),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('memo', 'fixed_string', size=160),
+    )
     def __init__(self):
         self.member_id = ''
         self.investor_type = ''
@@ -1257,6 +1756,25 @@ class Extend204129(BinaryCodec):
         self.cash_margin = ''
         self.memo = ''
     
+    def reset(self):
+        self.member_id = ''
+        self.investor_type = ''
+        self.investor_id = ''
+        self.investor_name = ''
+        self.trader_code = ''
+        self.secondary_order_id = ''
+        self.bid_trans_type = 0
+        self.bid_exec_inst_type = 0
+        self.low_limit_price = 0
+        self.high_limit_price = 0
+        self.min_qty = 0
+        self.trade_date = 0
+        self.settl_type = 0
+        self.settl_period = 0
+        self.pre_trade_anonymity = 0
+        self.cash_margin = ''
+        self.memo = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.member_id, 6, 'utf-8')
         write_fixed_string(buffer, self.investor_type, 2, 'utf-8')
@@ -1276,7 +1794,7 @@ class Extend204129(BinaryCodec):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         write_fixed_string(buffer, self.memo, 160, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.member_id = read_fixed_string(buffer, 6, 'utf-8')
         self.investor_type = read_fixed_string(buffer, 2, 'utf-8')
         self.investor_id = read_fixed_string(buffer, 10, 'utf-8')
@@ -1321,13 +1839,20 @@ class Extend204129(BinaryCodec):
     
 
 class Extend204702(BinaryCodec):
+    __slots__ = ("secondary_order_id",)
+    _fields = (
+        FieldDescriptor('secondary_order_id', 'fixed_string', size=16),
+    )
     def __init__(self):
         self.secondary_order_id = ''
     
+    def reset(self):
+        self.secondary_order_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.secondary_order_id, 16, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.secondary_order_id = read_fixed_string(buffer, 16, 'utf-8')
     
     def __eq__(self, other):
@@ -1372,6 +1897,38 @@ executionConfirmMessageFactory.register("470", Extend204702)
 
 
 class ExecutionConfirm(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "order_id", "cl_ord_id", "quote_msg_id", "orig_cl_ord_id", "exec_id", "exec_type", "ord_status", "ord_rej_reason", "leaves_qty", "cum_qty", "side", "ord_type", "order_qty", "price", "account_id", "branch_id", "order_restrictions", "appl_extend")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32'),
+        FieldDescriptor('report_index', 'i64'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64'),
+        FieldDescriptor('user_info', 'fixed_string', size=8),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_msg_id', 'fixed_string', size=10),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('exec_type', 'fixed_string', size=1),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+        FieldDescriptor('ord_rej_reason', 'u16'),
+        FieldDescriptor('leaves_qty', 'i64'),
+        FieldDescriptor('cum_qty', 'i64'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('ord_type', 'fixed_string', size=1),
+        FieldDescriptor('order_qty', 'i64'),
+        FieldDescriptor('price', 'i64'),
+        FieldDescriptor('account_id', 'fixed_string', size=12),
+        FieldDescriptor('branch_id', 'fixed_string', size=4),
+        FieldDescriptor('order_restrictions', 'fixed_string', size=4),
+        FieldDescriptor('appl_extend', 'message', factory='executionConfirmMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -1403,6 +1960,37 @@ class ExecutionConfirm(BinaryCodec):
         self.order_restrictions = ''
         self.appl_extend = None
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.order_id = ''
+        self.cl_ord_id = ''
+        self.quote_msg_id = ''
+        self.orig_cl_ord_id = ''
+        self.exec_id = ''
+        self.exec_type = ''
+        self.ord_status = ''
+        self.ord_rej_reason = 0
+        self.leaves_qty = 0
+        self.cum_qty = 0
+        self.side = ''
+        self.ord_type = ''
+        self.order_qty = 0
+        self.price = 0
+        self.account_id = ''
+        self.branch_id = ''
+        self.order_restrictions = ''
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32(self.partition_no)
         buffer.write_i64(self.report_index)
@@ -1435,7 +2023,7 @@ class ExecutionConfirm(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32()
         self.report_index = buffer.read_i64()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -1464,8 +2052,11 @@ class ExecutionConfirm(BinaryCodec):
         self.account_id = read_fixed_string(buffer, 12, 'utf-8')
         self.branch_id = read_fixed_string(buffer, 4, 'utf-8')
         self.order_restrictions = read_fixed_string(buffer, 4, 'utf-8')
-        self.appl_extend = executionConfirmMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = executionConfirmMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = executionConfirmMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -1512,6 +2103,17 @@ class ExecutionConfirm(BinaryCodec):
 
 
 class Extend200402(BinaryCodec):
+    __slots__ = ("stop_px", "min_qty", "max_price_levels", "time_in_force", "position_effect", "covered_or_uncovered", "contract_account_code", "secondary_order_id")
+    _fields = (
+        FieldDescriptor('stop_px', 'i64'),
+        FieldDescriptor('min_qty', 'i64'),
+        FieldDescriptor('max_price_levels', 'u16'),
+        FieldDescriptor('time_in_force', 'fixed_string', size=1),
+        FieldDescriptor('position_effect', 'fixed_string', size=1),
+        FieldDescriptor('covered_or_uncovered', 'u8'),
+        FieldDescriptor('contract_account_code', 'fixed_string', size=6),
+        FieldDescriptor('secondary_order_id', 'fixed_string', size=16),
+    )
     def __init__(self):
         self.stop_px = 0
         self.min_qty = 0
@@ -1522,6 +2124,16 @@ class Extend200402(BinaryCodec):
         self.contract_account_code = ''
         self.secondary_order_id = ''
     
+    def reset(self):
+        self.stop_px = 0
+        self.min_qty = 0
+        self.max_price_levels = 0
+        self.time_in_force = ''
+        self.position_effect = ''
+        self.covered_or_uncovered = 0
+        self.contract_account_code = ''
+        self.secondary_order_id = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i64(self.stop_px)
         buffer.write_i64(self.min_qty)
@@ -1532,7 +2144,7 @@ class Extend200402(BinaryCodec):
         write_fixed_string(buffer, self.contract_account_code, 6, 'utf-8')
         write_fixed_string(buffer, self.secondary_order_id, 16, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.stop_px = buffer.read_i64()
         self.min_qty = buffer.read_i64()
         self.max_price_levels = buffer.read_u16()
@@ -1566,6 +2178,15 @@ class Extend200402(BinaryCodec):
 
 
 class Extend201202(BinaryCodec):
+    __slots__ = ("insufficient_security_id", "no_security", "underlying_security_id", "underlying_security_id_source", "delivery_qty", "subst_cash")
+    _fields = (
+        FieldDescriptor('insufficient_security_id', 'fixed_string', size=8),
+        FieldDescriptor('no_security', 'u32'),
+        FieldDescriptor('underlying_security_id', 'fixed_string', size=8),
+        FieldDescriptor('underlying_security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('delivery_qty', 'i64'),
+        FieldDescriptor('subst_cash', 'i64'),
+    )
     def __init__(self):
         self.insufficient_security_id = ''
         self.no_security = 0
@@ -1574,6 +2195,14 @@ class Extend201202(BinaryCodec):
         self.delivery_qty = 0
         self.subst_cash = 0
     
+    def reset(self):
+        self.insufficient_security_id = ''
+        self.no_security = 0
+        self.underlying_security_id = ''
+        self.underlying_security_id_source = ''
+        self.delivery_qty = 0
+        self.subst_cash = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.insufficient_security_id, 8, 'utf-8')
         buffer.write_u32(self.no_security)
@@ -1582,7 +2211,7 @@ class Extend201202(BinaryCodec):
         buffer.write_i64(self.delivery_qty)
         buffer.write_i64(self.subst_cash)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.insufficient_security_id = read_fixed_string(buffer, 8, 'utf-8')
         self.no_security = buffer.read_u32()
         self.underlying_security_id = read_fixed_string(buffer, 8, 'utf-8')
@@ -1620,6 +2249,14 @@ class Extend201202(BinaryCodec):
 
 
 class Extend203102(BinaryCodec):
+    __slots__ = ("insufficient_security_id", "no_security", "underlying_security_id", "underlying_security_id_source", "delivery_qty")
+    _fields = (
+        FieldDescriptor('insufficient_security_id', 'fixed_string', size=8),
+        FieldDescriptor('no_security', 'u32'),
+        FieldDescriptor('underlying_security_id', 'fixed_string', size=8),
+        FieldDescriptor('underlying_security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('delivery_qty', 'i64'),
+    )
     def __init__(self):
         self.insufficient_security_id = ''
         self.no_security = 0
@@ -1627,6 +2264,13 @@ class Extend203102(BinaryCodec):
         self.underlying_security_id_source = ''
         self.delivery_qty = 0
     
+    def reset(self):
+        self.insufficient_security_id = ''
+        self.no_security = 0
+        self.underlying_security_id = ''
+        self.underlying_security_id_source = ''
+        self.delivery_qty = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.insufficient_security_id, 8, 'utf-8')
         buffer.write_u32(self.no_security)
@@ -1634,7 +2278,7 @@ class Extend203102(BinaryCodec):
         write_fixed_string(buffer, self.underlying_security_id_source, 4, 'utf-8')
         buffer.write_i64(self.delivery_qty)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.insufficient_security_id = read_fixed_string(buffer, 8, 'utf-8')
         self.no_security = buffer.read_u32()
         self.underlying_security_id = read_fixed_string(buffer, 8, 'utf-8')
@@ -1668,13 +2312,20 @@ class Extend203102(BinaryCodec):
 
 
 class Extend200115(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -1687,13 +2338,20 @@ class Extend200115(BinaryCodec):
     
 
 class Extend200215(BinaryCodec):
+    __slots__ = ("maturity_date",)
+    _fields = (
+        FieldDescriptor('maturity_date', 'u32'),
+    )
     def __init__(self):
         self.maturity_date = 0
     
+    def reset(self):
+        self.maturity_date = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u32(self.maturity_date)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.maturity_date = buffer.read_u32()
     
     def __eq__(self, other):
@@ -1706,13 +2364,20 @@ class Extend200215(BinaryCodec):
     
 
 class Extend200315(BinaryCodec):
+    __slots__ = ("maturity_date",)
+    _fields = (
+        FieldDescriptor('maturity_date', 'u32'),
+    )
     def __init__(self):
         self.maturity_date = 0
     
+    def reset(self):
+        self.maturity_date = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u32(self.maturity_date)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.maturity_date = buffer.read_u32()
     
     def __eq__(self, other):
@@ -1725,15 +2390,24 @@ class Extend200315(BinaryCodec):
     
 
 class Extend200515(BinaryCodec):
+    __slots__ = ("confirm_id", "cash_margin")
+    _fields = (
+        FieldDescriptor('confirm_id', 'fixed_string', size=8),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.confirm_id = ''
         self.cash_margin = ''
     
+    def reset(self):
+        self.confirm_id = ''
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.confirm_id, 8, 'utf-8')
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.confirm_id = read_fixed_string(buffer, 8, 'utf-8')
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
@@ -1748,13 +2422,20 @@ class Extend200515(BinaryCodec):
     
 
 class Extend200615(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -1767,19 +2448,32 @@ class Extend200615(BinaryCodec):
     
 
 class Extend200715(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "maturity_date", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('maturity_date', 'u32'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.maturity_date = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.maturity_date = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         buffer.write_u32(self.maturity_date)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16()
         self.expiration_type = buffer.read_u8()
         self.maturity_date = buffer.read_u32()
@@ -1798,13 +2492,20 @@ class Extend200715(BinaryCodec):
     
 
 class Extend206315(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -1817,13 +2518,20 @@ class Extend206315(BinaryCodec):
     
 
 class Extend203715(BinaryCodec):
+    __slots__ = ("cash_margin",)
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+    )
     def __init__(self):
         self.cash_margin = ''
     
+    def reset(self):
+        self.cash_margin = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
     
     def __eq__(self, other):
@@ -1836,6 +2544,17 @@ class Extend203715(BinaryCodec):
     
 
 class Extend204115(BinaryCodec):
+    __slots__ = ("cash_margin", "settl_type", "settl_period", "counterparty_member_id", "counterparty_investor_type", "counterparty_investor_id", "counterparty_investor_name", "counterparty_trader_code")
+    _fields = (
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('settl_type', 'u16'),
+        FieldDescriptor('settl_period', 'u8'),
+        FieldDescriptor('counterparty_member_id', 'fixed_string', size=6),
+        FieldDescriptor('counterparty_investor_type', 'fixed_string', size=2),
+        FieldDescriptor('counterparty_investor_id', 'fixed_string', size=10),
+        FieldDescriptor('counterparty_investor_name', 'fixed_string', size=120),
+        FieldDescriptor('counterparty_trader_code', 'fixed_string', size=8),
+    )
     def __init__(self):
         self.cash_margin = ''
         self.settl_type = 0
@@ -1846,6 +2565,16 @@ class Extend204115(BinaryCodec):
         self.counterparty_investor_name = ''
         self.counterparty_trader_code = ''
     
+    def reset(self):
+        self.cash_margin = ''
+        self.settl_type = 0
+        self.settl_period = 0
+        self.counterparty_member_id = ''
+        self.counterparty_investor_type = ''
+        self.counterparty_investor_id = ''
+        self.counterparty_investor_name = ''
+        self.counterparty_trader_code = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         buffer.write_u16(self.settl_type)
@@ -1856,7 +2585,7 @@ class Extend204115(BinaryCodec):
         write_fixed_string(buffer, self.counterparty_investor_name, 120, 'utf-8')
         write_fixed_string(buffer, self.counterparty_trader_code, 8, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.cash_margin = read_fixed_string(buffer, 1, 'utf-8')
         self.settl_type = buffer.read_u16()
         self.settl_period = buffer.read_u8()
@@ -1883,6 +2612,26 @@ class Extend204115(BinaryCodec):
     
 
 class Extend204130(BinaryCodec):
+    __slots__ = ("member_id", "investor_type", "investor_id", "investor_name", "trader_code", "counterparty_member_id", "counterparty_investor_type", "counterparty_investor_id", "counterparty_investor_name", "counterparty_trader_code", "secondary_order_id", "bid_trans_type", "bid_exec_inst_type", "settl_type", "settl_period", "cash_margin", "memo")
+    _fields = (
+        FieldDescriptor('member_id', 'fixed_string', size=6),
+        FieldDescriptor('investor_type', 'fixed_string', size=2),
+        FieldDescriptor('investor_id', 'fixed_string', size=10),
+        FieldDescriptor('investor_name', 'fixed_string', size=120),
+        FieldDescriptor('trader_code', 'fixed_string', size=8),
+        FieldDescriptor('counterparty_member_id', 'fixed_string', size=6),
+        FieldDescriptor('counterparty_investor_type', 'fixed_string', size=2),
+        FieldDescriptor('counterparty_investor_id', 'fixed_string', size=10),
+        FieldDescriptor('counterparty_investor_name', 'fixed_string', size=120),
+        FieldDescriptor('counterparty_trader_code', 'fixed_string', size=8),
+        FieldDescriptor('secondary_order_id', 'fixed_string', size=16),
+        FieldDescriptor('bid_trans_type', 'u16'),
+        FieldDescriptor('bid_exec_inst_type', 'u16'),
+        FieldDescriptor('settl_type', 'u16'),
+        FieldDescriptor('settl_period', 'u8'),
+        FieldDescriptor('cash_margin', 'fixed_string', size=1),
+        FieldDescriptor('memo', 'fixed_string', size=160),
+    )
     def __init__(self):
         self.member_id = ''
         self.investor_type = ''
@@ -1902,6 +2651,25 @@ class Extend204130(BinaryCodec):
         self.cash_margin = ''
         self.memo = ''
     
+    def reset(self):
+        self.member_id = ''
+        self.investor_type = ''
+        self.investor_id = ''
+        self.investor_name = ''
+        self.trader_code = ''
+        self.counterparty_member_id = ''
+        self.counterparty_investor_type = ''
+        self.counterparty_investor_id = ''
+        self.counterparty_investor_name = ''
+        self.counterparty_trader_code = ''
+        self.secondary_order_id = ''
+        self.bid_trans_type = 0
+        self.bid_exec_inst_type = 0
+        self.settl_type = 0
+        self.settl_period = 0
+        self.cash_margin = ''
+        self.memo = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.member_id, 6, 'utf-8')
         write_fixed_string(buffer, self.investor_type, 2, 'utf-8')
@@ -1921,7 +2689,7 @@ class Extend204130(BinaryCodec):
         write_fixed_string(buffer, self.cash_margin, 1, 'utf-8')
         write_fixed_string(buffer, self.memo, 160, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.member_id = read_fixed_string(buffer, 6, 'utf-8')
         self.investor_type = read_fixed_string(buffer, 2, 'utf-8')
         self.investor_id = read_fixed_string(buffer, 10, 'utf-8')
@@ -1966,19 +2734,32 @@ class Extend204130(BinaryCodec):
     
 
 class Extend204715(BinaryCodec):
+    __slots__ = ("expiration_days", "expiration_type", "maturity_date", "share_property")
+    _fields = (
+        FieldDescriptor('expiration_days', 'u16'),
+        FieldDescriptor('expiration_type', 'u8'),
+        FieldDescriptor('maturity_date', 'u32'),
+        FieldDescriptor('share_property', 'fixed_string', size=2),
+    )
     def __init__(self):
         self.expiration_days = 0
         self.expiration_type = 0
         self.maturity_date = 0
         self.share_property = ''
     
+    def reset(self):
+        self.expiration_days = 0
+        self.expiration_type = 0
+        self.maturity_date = 0
+        self.share_property = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16(self.expiration_days)
         buffer.write_u8(self.expiration_type)
         buffer.write_u32(self.maturity_date)
         write_fixed_string(buffer, self.share_property, 2, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.expiration_days = buffer.read_u16()
         self.expiration_type = buffer.read_u8()
         self.maturity_date = buffer.read_u32()
@@ -2020,6 +2801,34 @@ executionReportMessageFactory.register("470", Extend204715)
 
 
 class ExecutionReport(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "order_id", "cl_ord_id", "quote_msg_id", "exec_id", "exec_type", "ord_status", "last_px", "last_qty", "leaves_qty", "cum_qty", "side", "account_id", "branch_id", "appl_extend")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32'),
+        FieldDescriptor('report_index', 'i64'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64'),
+        FieldDescriptor('user_info', 'fixed_string', size=8),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('quote_msg_id', 'fixed_string', size=10),
+        FieldDescriptor('exec_id', 'fixed_string', size=16),
+        FieldDescriptor('exec_type', 'fixed_string', size=1),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+        FieldDescriptor('last_px', 'i64'),
+        FieldDescriptor('last_qty', 'i64'),
+        FieldDescriptor('leaves_qty', 'i64'),
+        FieldDescriptor('cum_qty', 'i64'),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('account_id', 'fixed_string', size=12),
+        FieldDescriptor('branch_id', 'fixed_string', size=4),
+        FieldDescriptor('appl_extend', 'message', factory='executionReportMessageFactory', factory_key='appl_id'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -2047,6 +2856,33 @@ class ExecutionReport(BinaryCodec):
         self.branch_id = ''
         self.appl_extend = None
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.order_id = ''
+        self.cl_ord_id = ''
+        self.quote_msg_id = ''
+        self.exec_id = ''
+        self.exec_type = ''
+        self.ord_status = ''
+        self.last_px = 0
+        self.last_qty = 0
+        self.leaves_qty = 0
+        self.cum_qty = 0
+        self.side = ''
+        self.account_id = ''
+        self.branch_id = ''
+        self.appl_extend = None
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32(self.partition_no)
         buffer.write_i64(self.report_index)
@@ -2075,7 +2911,7 @@ class ExecutionReport(BinaryCodec):
         if self.appl_extend is not None:
             self.appl_extend.encode(buffer)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32()
         self.report_index = buffer.read_i64()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -2100,8 +2936,11 @@ class ExecutionReport(BinaryCodec):
         self.side = read_fixed_string(buffer, 1, 'utf-8')
         self.account_id = read_fixed_string(buffer, 12, 'utf-8')
         self.branch_id = read_fixed_string(buffer, 4, 'utf-8')
-        self.appl_extend = executionReportMessageFactory.create(self.appl_id)
-        self.appl_extend.decode(buffer)
+        if reuse_body:
+            self.appl_extend = executionReportMessageFactory.reuse(self.appl_extend, self.appl_id)
+        else:
+            self.appl_extend = executionReportMessageFactory.create(self.appl_id)
+        self.appl_extend.decode(buffer, reuse_body)
     
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -2144,19 +2983,32 @@ class ExecutionReport(BinaryCodec):
 
 
 class Extend200415(BinaryCodec):
+    __slots__ = ("position_effect", "covered_or_uncovered", "contract_account_code", "secondary_order_id")
+    _fields = (
+        FieldDescriptor('position_effect', 'fixed_string', size=1),
+        FieldDescriptor('covered_or_uncovered', 'u8'),
+        FieldDescriptor('contract_account_code', 'fixed_string', size=6),
+        FieldDescriptor('secondary_order_id', 'fixed_string', size=16),
+    )
     def __init__(self):
         self.position_effect = ''
         self.covered_or_uncovered = 0
         self.contract_account_code = ''
         self.secondary_order_id = ''
     
+    def reset(self):
+        self.position_effect = ''
+        self.covered_or_uncovered = 0
+        self.contract_account_code = ''
+        self.secondary_order_id = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.position_effect, 1, 'utf-8')
         buffer.write_u8(self.covered_or_uncovered)
         write_fixed_string(buffer, self.contract_account_code, 6, 'utf-8')
         write_fixed_string(buffer, self.secondary_order_id, 16, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.position_effect = read_fixed_string(buffer, 1, 'utf-8')
         self.covered_or_uncovered = buffer.read_u8()
         self.contract_account_code = read_fixed_string(buffer, 6, 'utf-8')
@@ -2192,6 +3044,22 @@ class Extend200415(BinaryCodec):
 
 
 class OrderCancelRequest(BinaryCodec):
+    __slots__ = ("appl_id", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "cl_ord_id", "orig_cl_ord_id", "side", "order_id", "order_qty")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64'),
+        FieldDescriptor('user_info', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+        FieldDescriptor('order_qty', 'i64'),
+    )
     def __init__(self):
         self.appl_id = ''
         self.submitting_pbuid = ''
@@ -2207,6 +3075,21 @@ class OrderCancelRequest(BinaryCodec):
         self.order_id = ''
         self.order_qty = 0
     
+    def reset(self):
+        self.appl_id = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.cl_ord_id = ''
+        self.orig_cl_ord_id = ''
+        self.side = ''
+        self.order_id = ''
+        self.order_qty = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         write_fixed_string(buffer, self.submitting_pbuid, 6, 'utf-8')
@@ -2222,7 +3105,7 @@ class OrderCancelRequest(BinaryCodec):
         write_fixed_string(buffer, self.order_id, 16, 'utf-8')
         buffer.write_i64(self.order_qty)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
         self.security_id = read_fixed_string(buffer, 8, 'utf-8')
@@ -2260,6 +3143,27 @@ class OrderCancelRequest(BinaryCodec):
 
 
 class CancelReject(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "appl_id", "reporting_pbuid", "submitting_pbuid", "security_id", "security_id_source", "owner_type", "clearing_firm", "transact_time", "user_info", "cl_ord_id", "orig_cl_ord_id", "side", "ord_status", "cxl_rej_reason", "reject_text", "order_id")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32'),
+        FieldDescriptor('report_index', 'i64'),
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('reporting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('owner_type', 'u16'),
+        FieldDescriptor('clearing_firm', 'fixed_string', size=2),
+        FieldDescriptor('transact_time', 'i64'),
+        FieldDescriptor('user_info', 'fixed_string', size=8),
+        FieldDescriptor('cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('orig_cl_ord_id', 'fixed_string', size=10),
+        FieldDescriptor('side', 'fixed_string', size=1),
+        FieldDescriptor('ord_status', 'fixed_string', size=1),
+        FieldDescriptor('cxl_rej_reason', 'u16'),
+        FieldDescriptor('reject_text', 'fixed_string', size=16),
+        FieldDescriptor('order_id', 'fixed_string', size=16),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
@@ -2280,6 +3184,26 @@ class CancelReject(BinaryCodec):
         self.reject_text = ''
         self.order_id = ''
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.appl_id = ''
+        self.reporting_pbuid = ''
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.owner_type = 0
+        self.clearing_firm = ''
+        self.transact_time = 0
+        self.user_info = ''
+        self.cl_ord_id = ''
+        self.orig_cl_ord_id = ''
+        self.side = ''
+        self.ord_status = ''
+        self.cxl_rej_reason = 0
+        self.reject_text = ''
+        self.order_id = ''
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32(self.partition_no)
         buffer.write_i64(self.report_index)
@@ -2300,7 +3224,7 @@ class CancelReject(BinaryCodec):
         write_fixed_string(buffer, self.reject_text, 16, 'utf-8')
         write_fixed_string(buffer, self.order_id, 16, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32()
         self.report_index = buffer.read_i64()
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
@@ -2348,6 +3272,19 @@ class CancelReject(BinaryCodec):
 
 
 class BusinessReject(BinaryCodec):
+    __slots__ = ("appl_id", "transact_time", "submitting_pbuid", "security_id", "security_id_source", "ref_seq_num", "ref_msg_type", "business_reject_ref_id", "business_reject_reason", "business_reject_text")
+    _fields = (
+        FieldDescriptor('appl_id', 'fixed_string', size=3),
+        FieldDescriptor('transact_time', 'i64'),
+        FieldDescriptor('submitting_pbuid', 'fixed_string', size=6),
+        FieldDescriptor('security_id', 'fixed_string', size=8),
+        FieldDescriptor('security_id_source', 'fixed_string', size=4),
+        FieldDescriptor('ref_seq_num', 'i64'),
+        FieldDescriptor('ref_msg_type', 'u32'),
+        FieldDescriptor('business_reject_ref_id', 'fixed_string', size=10),
+        FieldDescriptor('business_reject_reason', 'u16'),
+        FieldDescriptor('business_reject_text', 'fixed_string', size=50),
+    )
     def __init__(self):
         self.appl_id = ''
         self.transact_time = 0
@@ -2360,6 +3297,18 @@ class BusinessReject(BinaryCodec):
         self.business_reject_reason = 0
         self.business_reject_text = ''
     
+    def reset(self):
+        self.appl_id = ''
+        self.transact_time = 0
+        self.submitting_pbuid = ''
+        self.security_id = ''
+        self.security_id_source = ''
+        self.ref_seq_num = 0
+        self.ref_msg_type = 0
+        self.business_reject_ref_id = ''
+        self.business_reject_reason = 0
+        self.business_reject_text = ''
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.appl_id, 3, 'utf-8')
         buffer.write_i64(self.transact_time)
@@ -2372,7 +3321,7 @@ class BusinessReject(BinaryCodec):
         buffer.write_u16(self.business_reject_reason)
         write_fixed_string(buffer, self.business_reject_text, 50, 'utf-8')
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.appl_id = read_fixed_string(buffer, 3, 'utf-8')
         self.transact_time = buffer.read_i64()
         self.submitting_pbuid = read_fixed_string(buffer, 6, 'utf-8')
@@ -2404,15 +3353,24 @@ class BusinessReject(BinaryCodec):
 
 
 class PartitionReport(BinaryCodec):
+    __slots__ = ("partition_no", "report_index")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32'),
+        FieldDescriptor('report_index', 'i64'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32(self.partition_no)
         buffer.write_i64(self.report_index)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32()
         self.report_index = buffer.read_i64()
     
@@ -2427,9 +3385,16 @@ class PartitionReport(BinaryCodec):
     
 
 class ReportSynchronization(BinaryCodec):
+    __slots__ = ("partition_report",)
+    _fields = (
+        FieldDescriptor('partition_report', 'list', length_type='u32', element=FieldDescriptor(None, 'message', message_class='PartitionReport')),
+    )
     def __init__(self):
         self.partition_report = []
     
+    def reset(self):
+        self.partition_report = []
+    
     def encode(self, buffer: ByteBuf):
         size = len(self.partition_report)
         buffer.write_u32(size)
@@ -2437,8 +3402,9 @@ class ReportSynchronization(BinaryCodec):
             self.partition_report[i].encode(buffer)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         size = read_len(buffer, 'u32')
+        self.partition_report = []
         for i in range(size):
             _partition_report = PartitionReport()
             _partition_report.decode(buffer)
@@ -2458,15 +3424,24 @@ class ReportSynchronization(BinaryCodec):
 
 
 class PlatformStateInfo(BinaryCodec):
+    __slots__ = ("platform_id", "platform_state")
+    _fields = (
+        FieldDescriptor('platform_id', 'u16'),
+        FieldDescriptor('platform_state', 'u16'),
+    )
     def __init__(self):
         self.platform_id = 0
         self.platform_state = 0
     
+    def reset(self):
+        self.platform_id = 0
+        self.platform_state = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16(self.platform_id)
         buffer.write_u16(self.platform_state)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.platform_id = buffer.read_u16()
         self.platform_state = buffer.read_u16()
     
@@ -2482,17 +3457,28 @@ class PlatformStateInfo(BinaryCodec):
 
 
 class ReportFinished(BinaryCodec):
+    __slots__ = ("partition_no", "report_index", "platform_id")
+    _fields = (
+        FieldDescriptor('partition_no', 'i32'),
+        FieldDescriptor('report_index', 'i64'),
+        FieldDescriptor('platform_id', 'u16'),
+    )
     def __init__(self):
         self.partition_no = 0
         self.report_index = 0
         self.platform_id = 0
     
+    def reset(self):
+        self.partition_no = 0
+        self.report_index = 0
+        self.platform_id = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32(self.partition_no)
         buffer.write_i64(self.report_index)
         buffer.write_u16(self.platform_id)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32()
         self.report_index = buffer.read_i64()
         self.platform_id = buffer.read_u16()
@@ -2510,13 +3496,20 @@ class ReportFinished(BinaryCodec):
 
 
 class PlatformPartition(BinaryCodec):
+    __slots__ = ("partition_no",)
+    _fields = (
+        FieldDescriptor('partition_no', 'i32'),
+    )
     def __init__(self):
         self.partition_no = 0
     
+    def reset(self):
+        self.partition_no = 0
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_i32(self.partition_no)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.partition_no = buffer.read_i32()
     
     def __eq__(self, other):
@@ -2529,10 +3522,19 @@ class PlatformPartition(BinaryCodec):
     
 
 class PlatformInfo(BinaryCodec):
+    __slots__ = ("platform_id", "platform_partition")
+    _fields = (
+        FieldDescriptor('platform_id', 'u16'),
+        FieldDescriptor('platform_partition', 'list', length_type='u32', element=FieldDescriptor(None, 'message', message_class='PlatformPartition')),
+    )
     def __init__(self):
         self.platform_id = 0
         self.platform_partition = []
     
+    def reset(self):
+        self.platform_id = 0
+        self.platform_partition = []
+    
     def encode(self, buffer: ByteBuf):
         buffer.write_u16(self.platform_id)
         size = len(self.platform_partition)
@@ -2541,9 +3543,10 @@ class PlatformInfo(BinaryCodec):
             self.platform_partition[i].encode(buffer)
         
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.platform_id = buffer.read_u16()
         size = read_len(buffer, 'u32')
+        self.platform_partition = []
         for i in range(size):
             _platform_partition = PlatformPartition()
             _platform_partition.decode(buffer)
@@ -2564,6 +3567,16 @@ class PlatformInfo(BinaryCodec):
 
 
 class TradingSessionStatus(BinaryCodec):
+    __slots__ = ("market_id", "market_segment_id", "trading_session_id", "trading_session_sub_id", "trad_ses_status", "trad_ses_start_time", "trad_ses_end_time")
+    _fields = (
+        FieldDescriptor('market_id', 'fixed_string', size=8),
+        FieldDescriptor('market_segment_id', 'fixed_string', size=8),
+        FieldDescriptor('trading_session_id', 'fixed_string', size=4),
+        FieldDescriptor('trading_session_sub_id', 'fixed_string', size=4),
+        FieldDescriptor('trad_ses_status', 'u16'),
+        FieldDescriptor('trad_ses_start_time', 'i64'),
+        FieldDescriptor('trad_ses_end_time', 'i64'),
+    )
     def __init__(self):
         self.market_id = ''
         self.market_segment_id = ''
@@ -2573,6 +3586,15 @@ class TradingSessionStatus(BinaryCodec):
         self.trad_ses_start_time = 0
         self.trad_ses_end_time = 0
     
+    def reset(self):
+        self.market_id = ''
+        self.market_segment_id = ''
+        self.trading_session_id = ''
+        self.trading_session_sub_id = ''
+        self.trad_ses_status = 0
+        self.trad_ses_start_time = 0
+        self.trad_ses_end_time = 0
+    
     def encode(self, buffer: ByteBuf):
         write_fixed_string(buffer, self.market_id, 8, 'utf-8')
         write_fixed_string(buffer, self.market_segment_id, 8, 'utf-8')
@@ -2582,7 +3604,7 @@ class TradingSessionStatus(BinaryCodec):
         buffer.write_i64(self.trad_ses_start_time)
         buffer.write_i64(self.trad_ses_end_time)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
         self.market_id = read_fixed_string(buffer, 8, 'utf-8')
         self.market_segment_id = read_fixed_string(buffer, 8, 'utf-8')
         self.trading_session_id = read_fixed_string(buffer, 4, 'utf-8')
@@ -2689,13 +3711,34 @@ szseBinaryMessageFactory.register(290008, CancelReject)
 
 
 class SzseBinary(BinaryCodec):
+    __slots__ = ("msg_type", "body_length", "body", "checksum", "checksum_valid", "body_cache")
+    _fields = (
+        FieldDescriptor('msg_type', 'u32'),
+        FieldDescriptor('body_length', 'u32'),
+        FieldDescriptor('body', 'message', factory='szseBinaryMessageFactory', factory_key='msg_type'),
+        FieldDescriptor('checksum', 'i32'),
+    )
+    frame_layout = FrameLayout(4, ">I", 8, ">i")
+    checksum_service = create_checksum_service("SZSE_BIN")
+    checksum_verifier = ChecksumVerifier(checksum_service)
+
     def __init__(self):
         self.msg_type = 0
         self.body_length = 0
         self.body = None
         self.checksum = 0
+        self.checksum_valid = None
+        self.body_cache = None
+    
+    def reset(self):
+        self.msg_type = 0
+        self.body_length = 0
+        self.body = None
+        self.checksum = 0
+        self.checksum_valid = None
     
     def encode(self, buffer: ByteBuf):
+        frame_start = buffer.write_index
         buffer.write_u32(self.msg_type)
         body_length_pos = buffer.write_index
         buffer.write_u32(0)
@@ -2704,16 +3747,30 @@ class SzseBinary(BinaryCodec):
         body_end = buffer.write_index
         self.body_length = body_end - body_start
         buffer.write_u32_at(body_length_pos, self.body_length)
-        service = create_checksum_service("SZSE_BIN")
+        service = self.checksum_service
         if service :
-            self.checksum = service.calc(buffer)
+            self.checksum = service.calc_range(buffer, frame_start, buffer.write_index)
         buffer.write_i32(self.checksum)
     
-    def decode(self, buffer: ByteBuf):
+    def decode(self, buffer: ByteBuf, reuse_body: bool = False):
+        checksum_valid = self.checksum_verifier.verify_next(buffer, self.frame_layout)
+        self._decode_frame(buffer, reuse_body)
+        self.checksum_valid = checksum_valid
+
+    @classmethod
+    def decode_batch(cls, buffer: ByteBuf) -> list:
+        return decode_frames(cls, buffer)
+    
+    def _decode_frame(self, buffer: ByteBuf, reuse_body: bool = False):
         self.msg_type = buffer.read_u32()
         self.body_length = buffer.read_u32()
-        self.body = szseBinaryMessageFactory.create(self.msg_type)
-        self.body.decode(buffer)
+        if reuse_body:
+            if self.body_cache is None:
+                self.body_cache = {}
+            self.body = szseBinaryMessageFactory.create_cached(self.msg_type, self.body_cache)
+        else:
+            self.body = szseBinaryMessageFactory.create(self.msg_type)
+        self.body.decode(buffer.read_verified_slice(self.body_length), reuse_body)
         self.checksum = buffer.read_i32()
     
     def __eq__(self, other):
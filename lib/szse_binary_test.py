@@ -1,4 +1,5 @@
-# Code generated by fin-protoc. DO NOT EDIT.
+# Code generated by fin-protoc, with hand edits its templates do not emit yet.
+# See "Pending generator template changes" in README.md before regenerating.
 import unittest
 
 from szse_binary import *
@@ -937,6 +938,62 @@ class TestExecutionReport(unittest.TestCase):
         decoded_packet.decode(buf)
         self.assertEqual(decoded_packet, self.packet)
 
+    def test_decode_into_reuses_appl_extend(self):
+        buf = ByteBuf()
+        self.packet.encode(buf)
+        self.packet.encode(buf)
+        self.packet.encode(buf)
+        decoded_packet = ExecutionReport()
+        decoded_packet.decode(buf)
+        appl_extend = decoded_packet.appl_extend
+        decoded_packet.decode(buf)
+        self.assertIsNot(appl_extend, decoded_packet.appl_extend)
+        appl_extend = decoded_packet.appl_extend
+        decoded_packet.decode(buf, reuse_body=True)
+        self.assertIs(appl_extend, decoded_packet.appl_extend)
+        self.assertEqual(decoded_packet, self.packet)
+
+    def test_reuse_body_is_passed_to_appl_extend(self):
+        seen = []
+
+        class Recording(Extend200115):
+            __slots__ = ()
+
+            def decode(self, buffer, reuse_body=False):
+                seen.append(reuse_body)
+                super().decode(buffer, reuse_body)
+
+        buf = ByteBuf()
+        self.packet.encode(buf)
+        self.packet.encode(buf)
+        decoded_packet = ExecutionReport()
+        decoded_packet.appl_extend = Recording()
+        appl_id = self.packet.appl_id
+        registered = executionReportMessageFactory._creators[appl_id]
+        executionReportMessageFactory.register(appl_id, Recording)
+        try:
+            decoded_packet.decode(buf, reuse_body=True)
+            decoded_packet.decode(buf)
+        finally:
+            executionReportMessageFactory.register(appl_id, registered)
+        self.assertEqual([True, False], seen)
+
+    def test_framing_reuse_body_reaches_appl_extend(self):
+        frame = SzseBinary()
+        frame.msg_type = 200115
+        frame.body = self.packet
+        buf = ByteBuf()
+        for _ in range(3):
+            frame.encode(buf)
+        decoded_frame = SzseBinary()
+        decoded_frame.decode(buf, reuse_body=True)
+        appl_extend = decoded_frame.body.appl_extend
+        decoded_frame.decode(buf, reuse_body=True)
+        self.assertIs(appl_extend, decoded_frame.body.appl_extend)
+        decoded_frame.decode(buf)
+        self.assertIsNot(appl_extend, decoded_frame.body.appl_extend)
+        self.assertEqual(self.packet, decoded_frame.body)
+
 
 
 class TestExtend200115(unittest.TestCase):